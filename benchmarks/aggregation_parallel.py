@@ -0,0 +1,132 @@
+"""
+Sequential vs parallel loading of an aggregation.
+
+Writes a synthetic results tree (build parameters and an 8-mode eigenmode
+result per iteration, SQLite ledger) and times a full aggregation of it:
+
+- `sequential`: one file at a time in the main process;
+- `threads`: files read on a thread pool, validated in the main process
+  (the default for large updates);
+- `processes`: files read on a thread pool, validated on `--workers`
+  spawned processes (each imports quansys on start, a few seconds).
+
+    python benchmarks/aggregation_parallel.py --iterations 5000 --workers 8
+
+With `--cold` (Linux, root) the page cache is dropped before every run, so the
+files are read from disk, as on a fresh node or a network file system.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+from pycaddy.save import save_json
+
+from quansys.simulation import EigenmodeResults
+from quansys.workflow.aggregation import IncrementalAggregation, ParallelLoadingConfig
+from quansys.workflow.ledger import open_project
+
+ADAPTER = "quansys.simulation:SIMULATION_RESULTS_ADAPTER"
+
+
+def eigenmode_payload(rng: random.Random, modes: int = 8) -> dict:
+    return EigenmodeResults(
+        results={
+            i: {
+                "mode_number": i,
+                "quality_factor": rng.uniform(1e3, 1e7),
+                "frequency": {"value": rng.uniform(3, 12), "unit": "GHz"},
+            }
+            for i in range(modes)
+        }
+    ).model_dump()
+
+
+def write_tree(root: Path, iterations: int) -> None:
+    rng = random.Random(0)
+    iterations_project = open_project(root, "sqlite").sub("iterations")
+    for i in range(iterations):
+        params = {"lj": f"{10 + i % 7}nh", "cap": 90 + i % 13, "index": i}
+        for identifier, data in (("build", params), ("eigen", eigenmode_payload(rng))):
+            session = iterations_project.session(identifier, params=params)
+            session.start()
+            path = session.path(suffix=".json")
+            save_json(path, data)
+            session.attach_files({"data": path})
+            session.done()
+
+
+def drop_caches() -> None:
+    os.sync()
+    Path("/proc/sys/vm/drop_caches").write_text("3\n")
+
+
+def aggregate(root: Path, name: str, loading: ParallelLoadingConfig) -> Path:
+    shutil.rmtree(root / "aggregations", ignore_errors=True)
+    project = open_project(root, "sqlite")
+    aggregation = IncrementalAggregation(
+        name,
+        ["build", "eigen"],
+        project.sub("aggregations"),
+        project.sub("iterations"),
+        ADAPTER,
+        loading=loading,
+    )
+    aggregation.update(final=True)
+    return aggregation._session.path(suffix=".csv", include_uid=False)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=5000)
+    parser.add_argument(
+        "--workers", type=int, default=0, help="0: one per CPU, up to 8"
+    )
+    parser.add_argument(
+        "--cold", action="store_true", help="drop the page cache per run"
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="best of N timings")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        start = time.perf_counter()
+        write_tree(root, args.iterations)
+        print(
+            f"tree: {args.iterations} iterations in {time.perf_counter() - start:.1f} s"
+        )
+
+        configs = {
+            "sequential": ParallelLoadingConfig(min_rows=args.iterations + 1),
+            "threads": ParallelLoadingConfig(workers=1, min_rows=1),
+            "processes": ParallelLoadingConfig(workers=args.workers, min_rows=1),
+        }
+        timings = {}
+        frames = {}
+        for name, loading in configs.items():
+            runs = []
+            for _ in range(args.repeat):
+                if args.cold:
+                    drop_caches()
+                start = time.perf_counter()
+                path = aggregate(root, name, loading)
+                runs.append(time.perf_counter() - start)
+            timings[name] = min(runs)
+            frames[name] = pd.read_csv(path)
+            speedup = timings["sequential"] / timings[name]
+            print(f"{name:>10}: {timings[name]:.2f} s ({speedup:.2f}x)")
+
+        for name in ("threads", "processes"):
+            pd.testing.assert_frame_equal(frames[name], frames["sequential"])
+        print("outputs identical")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Startup cost of quansys: import time and the first unit conversion.
+
+Every spawned worker process (post-processing pipeline, parallel loading)
+imports quansys, so import-time work is paid once per process. Each import
+runs in a fresh interpreter with ``-X importtime``; the best of `--repeat`
+runs is reported.
+
+    python benchmarks/import_time.py --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import subprocess
+import sys
+
+MODULES = (
+    "quansys.shared.conversion",
+    "quansys.workflow.builder.design_variables_handler.conversion",
+    "pint",
+    "quansys.simulation",
+    "quansys.workflow",
+)
+
+FIRST_USE = """
+import time
+import quansys.workflow
+from quansys.shared.conversion import convert
+start = time.perf_counter()
+convert(5.1, "GHz", "MHz")
+print(time.perf_counter() - start)
+"""
+
+_LINE = re.compile(r"import time:\s+\d+ \|\s+(?P<cumulative>\d+) \|\s+(?P<module>\S+)")
+
+
+def import_times() -> dict[str, float]:
+    """Cumulative import time (s) of `MODULES` when importing quansys.workflow."""
+    run = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import quansys.workflow"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = dict.fromkeys(MODULES, 0.0)
+    for match in _LINE.finditer(run.stderr):
+        if match["module"] in times:
+            times[match["module"]] = int(match["cumulative"]) / 1e6
+    return times
+
+
+def first_use() -> float:
+    run = subprocess.run(
+        [sys.executable, "-c", FIRST_USE], capture_output=True, text=True, check=True
+    )
+    return float(run.stdout.split()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    runs = [import_times() for _ in range(args.repeat)]
+    print("import quansys.workflow (cumulative, best of runs)")
+    for module in MODULES:
+        best = min(run[module] for run in runs)
+        print(f"{module:>62}{best * 1e3:>9.0f} ms")
+
+    best = min(first_use() for _ in range(args.repeat))
+    print(f"{'first convert() after import':>62}{best * 1e3:>9.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
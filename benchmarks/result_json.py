@@ -0,0 +1,153 @@
+"""
+Encode/decode cost of a realistic QuantumResults (6 modes x 4 junctions).
+
+Compares the generic path (``save_json(path, result.model_dump())`` and
+``validate_python(load_json(path))``) with `save_result`/`load_result`, and
+the array sidecars.
+
+    python benchmarks/result_json.py --repeat 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+from pycaddy.load import load_json
+from pycaddy.save import save_json
+
+from quansys.shared import Value
+from quansys.simulation import (
+    SIMULATION_RESULTS_ADAPTER,
+    ConfigJunction,
+    EigenmodeResults,
+    QuantumResults,
+)
+from quansys.simulation.quantum_epr.structures import (
+    EprDiagResult,
+    ParsedJunctionValues,
+    ParticipationDataset,
+)
+from quansys.simulation.storage import load_result, save_result
+
+PER_MODE_AND_JUNCTION = (
+    "participation_ratio_induction",
+    "participation_ratio_capacitance",
+    "sign",
+    "peak_currents",
+    "peak_voltages",
+    "inductance_energy",
+    "capacitance_energy",
+)
+PER_MODE = (
+    "total_inductance_energy",
+    "total_capacitance_energy",
+    "peak_total_magnetic_energy",
+    "peak_total_electric_energy",
+    "norm",
+    "diff",
+)
+
+
+def quantum_result(modes: int = 6, junctions: int = 4) -> QuantumResults:
+    rng = np.random.default_rng(0)
+    labels = [f"mode_{i}" for i in range(modes)]
+    junctions_infos = tuple(
+        ParsedJunctionValues(
+            info=ConfigJunction(line_name=f"j{j}", inductance_variable_name=f"lj{j}"),
+            inductance=Value(value=10e-9 + j * 1e-9, unit="H"),
+        )
+        for j in range(junctions)
+    )
+    arrays = {name: rng.random((modes, junctions)) for name in PER_MODE_AND_JUNCTION}
+    # complex field amplitudes
+    for name in ("peak_currents", "peak_voltages"):
+        arrays[name] = arrays[name] * np.exp(1j * rng.random((modes, junctions)))
+    arrays.update({name: rng.random(modes) for name in PER_MODE})
+    frequencies = np.sort(rng.uniform(4e9, 9e9, modes))
+    quality_factors = rng.uniform(1e4, 1e7, modes)
+
+    distributed = ParticipationDataset(
+        junctions_infos=junctions_infos,
+        labels_to_modes={label: i + 1 for i, label in enumerate(labels)},
+        labels_order=tuple(labels),
+        frequencies=frequencies,
+        quality_factors=quality_factors,
+        inductances=np.array([j.inductance.value for j in junctions_infos]),
+        capacitances=np.full(junctions, 2e-15),
+        **arrays,
+    )
+    eigenmode = EigenmodeResults(
+        results={
+            i + 1: {
+                "mode_number": i + 1,
+                "quality_factor": float(quality_factors[i]),
+                "frequency": {"value": float(frequencies[i]) / 1e9, "unit": "GHz"},
+                "label": label,
+            }
+            for i, label in enumerate(labels)
+        }
+    )
+    chi = rng.normal(scale=1.0, size=(modes, modes))
+    return QuantumResults(
+        epr=EprDiagResult(chi=chi + chi.T, frequencies=frequencies / 1e9),
+        distributed=distributed,
+        eigenmode_result=eigenmode,
+    )
+
+
+def timed(fn, repeat: int) -> float:
+    """Best per-call time in microseconds, over 5 rounds of `repeat` calls."""
+    rounds = []
+    for _ in range(5):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            fn()
+        rounds.append((time.perf_counter() - start) / repeat * 1e6)
+    return min(rounds)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--modes", type=int, default=6)
+    parser.add_argument("--junctions", type=int, default=4)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    result = quantum_result(args.modes, args.junctions)
+    adapter = SIMULATION_RESULTS_ADAPTER
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        generic = root / "generic.json"
+        cases = {
+            "generic": (
+                lambda: save_json(generic, result.model_dump()),
+                lambda: adapter.validate_python(load_json(generic)),
+                generic,
+            )
+        }
+        for arrays in ("json", "npz", "npy"):
+            path = root / f"{arrays}.json"
+            cases[f"save_result({arrays})"] = (
+                lambda path=path, arrays=arrays: save_result(path, result, arrays),
+                lambda path=path: load_result(path, adapter),
+                path,
+            )
+
+        print(f"QuantumResults, {args.modes} modes x {args.junctions} junctions")
+        print(f"{'':>20}{'encode+write':>14}{'read+decode':>13}{'bytes':>9}")
+        for name, (write, read, path) in cases.items():
+            write_us = timed(write, args.repeat)
+            read_us = timed(read, args.repeat)
+            size = sum(
+                p.stat().st_size for p in root.glob(f"{path.stem}*") if p.is_file()
+            )
+            size += sum(p.stat().st_size for p in root.glob(f"{path.stem}.arrays/*"))
+            print(f"{name:>20}{write_us:>11.0f} us{read_us:>10.0f} us{size:>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Unit conversion cost: pint per call versus the cached conversion factors.
+
+Compares building a pint ``Quantity`` per value (the previous `convert`) with
+the cached `convert`, `convert_array`, and the per-mode frequency conversion
+done by `QuantumResults.flatten` while aggregating.
+
+    python benchmarks/unit_conversion.py --values 1000
+"""
+
+from __future__ import annotations
+
+import argparse
+
+import numpy as np
+from result_json import quantum_result, timed
+
+from quansys.shared.conversion import convert, convert_array, ureg
+
+
+def pint_convert(value: float, unit: str, target_unit: str) -> tuple[float, str]:
+    quantity = ureg.Quantity(value, unit).to(target_unit)
+    return quantity.magnitude, str(quantity.units)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--values", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    values = np.random.default_rng(0).uniform(4e9, 8e9, args.values)
+    scalars = values.tolist()
+    cases = {
+        "pint per value": lambda: [pint_convert(v, "Hz", "GHz") for v in scalars],
+        "convert": lambda: [convert(v, "Hz", "GHz") for v in scalars],
+        "convert_array": lambda: convert_array(values, "Hz", "GHz"),
+    }
+
+    print(f"{args.values} frequencies, Hz -> GHz")
+    for name, fn in cases.items():
+        print(f"{name:>20}{timed(fn, args.repeat):>11.0f} us")
+
+    result = quantum_result()
+    print("QuantumResults.flatten, 6 modes")
+    print(f"{'flatten':>20}{timed(result.flatten, args.repeat * 10):>11.0f} us")
+
+
+if __name__ == "__main__":
+    main()
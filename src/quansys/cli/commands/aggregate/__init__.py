@@ -0,0 +1,4 @@
+# Expose the command function for import by main.py
+from .cmd import aggregate
+
+__all__ = ["aggregate"]
@@ -0,0 +1,34 @@
+"""
+Aggregate command - lightweight signature only, heavy logic in impl.py
+"""
+
+from pathlib import Path
+from typing import Annotated
+
+import typer
+
+
+def aggregate(
+    root: Annotated[Path, typer.Argument(help="Results root folder of a workflow.")],
+    spec: Annotated[
+        Path,
+        typer.Option(
+            "--spec",
+            "-s",
+            help="Aggregation spec (YAML): identifiers, filters, reductions.",
+        ),
+    ],
+    output: Annotated[
+        Path | None,
+        typer.Option(
+            "--output", "-o", help="Output .csv or .parquet file; overrides the spec."
+        ),
+    ] = None,
+):
+    """
+    Re-aggregate an existing results tree, without the workflow config or AEDT.
+    """
+    # Lazy import the heavy implementation only when command is actually called
+    from .impl import execute_aggregate
+
+    return execute_aggregate(root=root, spec_path=spec, output=output)
@@ -0,0 +1,40 @@
+"""
+Aggregate command implementation - contains all heavy imports and logic
+"""
+
+import typer
+
+
+def execute_aggregate(root, spec_path, output=None):
+    """
+    Main aggregate implementation - all heavy logic happens here.
+    This function is only imported when the aggregate command is actually called.
+    """
+    from quansys.workflow.aggregation.spec import AggregationSpec
+    from quansys.workflow.aggregation.tree import (
+        load_frame,
+        select_iterations,
+        shape_frame,
+        write_frame,
+    )
+
+    if not spec_path.exists():
+        typer.echo(f"Error: spec file not found: {spec_path}", err=True)
+        raise typer.Exit(1)
+    spec = AggregationSpec.load_from_yaml(spec_path)
+
+    try:
+        iterations, finished = select_iterations(root, spec)
+        frame = shape_frame(load_frame(iterations, spec), spec)
+    except (FileNotFoundError, ValueError) as exc:
+        typer.echo(f"Error: {exc}", err=True)
+        raise typer.Exit(1)
+
+    typer.echo(f"{len(iterations)} of {finished} finished iterations selected.")
+    output = output or spec.output
+    if output is None:
+        typer.echo(frame.to_string(index=False))
+        return
+
+    path = write_frame(frame, output)
+    typer.echo(f"Wrote {len(frame)} rows to {path}")
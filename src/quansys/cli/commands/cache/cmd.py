@@ -0,0 +1,49 @@
+"""
+Cache commands - lightweight signatures only, heavy logic in impl.py
+"""
+
+from pathlib import Path
+from typing import Annotated
+
+import typer
+
+cache_app = typer.Typer(help="Inspect and clean the global simulation result cache.")
+
+CachePath = Annotated[
+    Path | None,
+    typer.Option(
+        "--path",
+        "-p",
+        help="Cache directory (defaults to the ResultCacheConfig default).",
+    ),
+]
+
+
+@cache_app.command()
+def stats(path: CachePath = None):
+    """
+    Show the number of entries and the size of the result cache.
+    """
+    from .impl import execute_stats
+
+    return execute_stats(path=path)
+
+
+@cache_app.command()
+def gc(
+    path: CachePath = None,
+    max_size: Annotated[
+        float | None,
+        typer.Option(
+            "--max-size",
+            "-m",
+            help="Target cache size in MB (defaults to the configured bound).",
+        ),
+    ] = None,
+):
+    """
+    Evict least recently used entries until the cache fits its size bound.
+    """
+    from .impl import execute_gc
+
+    return execute_gc(path=path, max_size=max_size)
@@ -0,0 +1,44 @@
+"""
+Cache command implementation - contains all heavy imports and logic
+"""
+
+import typer
+
+
+def _open_cache(path, max_size=None):
+    from quansys.workflow.cache import ResultCache, ResultCacheConfig
+
+    update = {}
+    if path is not None:
+        update["path"] = path
+    if max_size is not None:
+        update["max_size_mb"] = max_size
+
+    config = ResultCacheConfig(**update)
+    return ResultCache(config.path, config.max_bytes)
+
+
+def _format_mb(num_bytes: int) -> str:
+    return f"{num_bytes / 1024**2:.1f} MB"
+
+
+def execute_stats(path):
+    cache = _open_cache(path)
+    stats = cache.stats()
+
+    typer.echo(f"Cache:    {cache.root}")
+    typer.echo(f"Entries:  {stats.entries}")
+    typer.echo(
+        f"Size:     {_format_mb(stats.total_bytes)} / {_format_mb(stats.max_bytes)}"
+    )
+    if stats.entries:
+        typer.echo(f"Oldest:   {stats.oldest_access:%Y-%m-%d %H:%M}")
+        typer.echo(f"Newest:   {stats.newest_access:%Y-%m-%d %H:%M}")
+
+
+def execute_gc(path, max_size):
+    cache = _open_cache(path, max_size)
+    removed, removed_bytes = cache.gc()
+    typer.echo(
+        f"Removed {removed} entries ({_format_mb(removed_bytes)}) from {cache.root}"
+    )
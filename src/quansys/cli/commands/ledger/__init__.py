@@ -0,0 +1,4 @@
+# Expose the command group for import by main.py
+from .cmd import ledger_app
+
+__all__ = ["ledger_app"]
@@ -0,0 +1,26 @@
+"""
+Ledger commands - lightweight signatures only, heavy logic in impl.py
+"""
+
+from pathlib import Path
+from typing import Annotated
+
+import typer
+
+ledger_app = typer.Typer(help="Manage the run ledger of a results folder.")
+
+
+@ledger_app.command(name="import")
+def import_(
+    root_folder: Annotated[Path, typer.Argument(help="The workflow's results folder.")],
+    force: Annotated[
+        bool, typer.Option("--force", help="Import into an existing SQLite ledger.")
+    ] = False,
+):
+    """
+    Import the JSON ledger (metadata.json) into an indexed SQLite ledger
+    (metadata.sqlite), for use with `ledger: sqlite` in the workflow config.
+    """
+    from .impl import execute_import
+
+    return execute_import(root_folder=root_folder, force=force)
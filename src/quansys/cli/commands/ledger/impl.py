@@ -0,0 +1,40 @@
+"""
+Ledger commands implementation - contains all heavy imports and logic
+"""
+
+import time
+
+import typer
+
+
+def execute_import(root_folder, force):
+    """
+    Main import implementation - all heavy logic happens here.
+    This function is only imported when the command is actually called.
+    """
+    from quansys.workflow.ledger import (
+        JSON_LEDGER_FILE,
+        SQLITE_LEDGER_FILE,
+        SqliteLedger,
+        import_json_ledger,
+    )
+
+    source = root_folder / JSON_LEDGER_FILE
+    dest = root_folder / SQLITE_LEDGER_FILE
+    if not source.exists():
+        typer.echo(f"Error: no JSON ledger at {source}", err=True)
+        raise typer.Exit(1)
+    if dest.exists() and not force:
+        typer.echo(
+            f"Error: {dest} already exists; runs recorded there since would be "
+            "replaced by the JSON ones. Use --force to import anyway.",
+            err=True,
+        )
+        raise typer.Exit(1)
+
+    start = time.perf_counter()
+    count = import_json_ledger(source, SqliteLedger(dest))
+    typer.echo(
+        f"Imported {count} runs into {dest} in {time.perf_counter() - start:.1f} s"
+    )
+    typer.echo("Set `ledger: sqlite` in the workflow config to use it.")
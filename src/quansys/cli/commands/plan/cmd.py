@@ -0,0 +1,32 @@
+"""
+Plan command - lightweight signature only, heavy logic in impl.py
+"""
+
+from pathlib import Path
+from typing import Annotated
+
+import typer
+
+
+def plan(
+    config_path: Annotated[Path, typer.Argument(help="Path to the config.yaml file.")],
+    history: Annotated[
+        list[Path] | None,
+        typer.Option(
+            "--history",
+            "-H",
+            help="Earlier workflow config.yaml files, or folders to search for them.",
+        ),
+    ] = None,
+    margin: Annotated[
+        float,
+        typer.Option("--margin", help="Relative safety margin on time and memory."),
+    ] = 0.25,
+):
+    """
+    Predict wall time and memory of the pending runs and recommend submit resources.
+    """
+    # Lazy import the heavy implementation only when command is actually called
+    from .impl import execute_plan
+
+    return execute_plan(config_path=config_path, history=history, margin=margin)
@@ -0,0 +1,65 @@
+"""
+Plan command implementation - contains all heavy imports and logic
+"""
+
+import typer
+
+
+def _format_seconds(seconds):
+    if seconds is None:
+        return "-"
+    seconds = round(seconds)
+    return f"{seconds // 3600:02d}:{seconds % 3600 // 60:02d}:{seconds % 60:02d}"
+
+
+def _format_gb(gb):
+    return "-" if gb is None else f"{gb:.1f} GB"
+
+
+def execute_plan(config_path, history, margin):
+    """
+    Main plan implementation - all heavy logic happens here.
+    This function is only imported when the plan command is actually called.
+    """
+    from quansys.workflow.history import make_plan, recommend
+
+    plan = make_plan(config_path, history or [])
+    resources = recommend(plan, margin=margin)
+
+    typer.echo(
+        f"{'identifier':<24}{'pending':>8}{'history':>9}{'per run':>11}"
+        f"{'total':>11}{'memory':>10}"
+    )
+    for e in plan.estimates:
+        typer.echo(
+            f"{e.identifier:<24}{e.pending:>8}{e.samples:>9}"
+            f"{_format_seconds(e.seconds_per_run):>11}"
+            f"{_format_seconds(e.total_seconds):>11}{_format_gb(e.memory_gb):>10}"
+        )
+
+    typer.echo("")
+    typer.echo(f"Pending runs:        {plan.pending}")
+    typer.echo(f"Predicted wall time: {_format_seconds(plan.total_seconds)}")
+    typer.echo(f"Predicted peak mem:  {_format_gb(plan.peak_memory_gb)}")
+    for note in resources.notes:
+        typer.echo(f"Note: {note}")
+
+    if not plan.pending:
+        typer.echo("Nothing to run.")
+        return
+
+    options = []
+    if resources.mem_mb is not None:
+        options.append(f"--mem {resources.mem_mb}")
+    if resources.timeout is not None:
+        options.append(f"--timeout {resources.timeout}")
+
+    typer.echo("")
+    typer.echo(f"Recommended (+{margin:.0%} margin):")
+    typer.echo(f"  quansys submit {config_path} <venv> -n <name> {' '.join(options)}")
+    typer.echo(f"  cores: {resources.cores}")
+    if resources.workers:
+        typer.echo(
+            f"  pipeline: enabled, workers: {resources.workers} "
+            "(overlaps EPR post-processing with the next solve)"
+        )
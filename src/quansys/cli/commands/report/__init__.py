@@ -0,0 +1,4 @@
+# Expose the command function for import by main.py
+from .cmd import report
+
+__all__ = ["report"]
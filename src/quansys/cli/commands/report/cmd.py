@@ -0,0 +1,32 @@
+"""
+Report command - lightweight signature only, heavy logic in impl.py
+"""
+
+from pathlib import Path
+from typing import Annotated
+
+import typer
+
+
+def report(
+    path: Annotated[
+        Path,
+        typer.Argument(help="Results root folder, or the telemetry file itself."),
+    ],
+    file_name: Annotated[
+        str,
+        typer.Option(
+            "--file",
+            "-f",
+            help="Name of the telemetry file in the root folder "
+            "(the config's telemetry.file_name).",
+        ),
+    ] = "telemetry.jsonl",
+):
+    """
+    Summarize where the time went in a workflow run, per phase and analysis.
+    """
+    # Lazy import the heavy implementation only when command is actually called
+    from .impl import execute_report
+
+    return execute_report(path=path, file_name=file_name)
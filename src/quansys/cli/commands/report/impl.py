@@ -0,0 +1,44 @@
+"""
+Report command implementation - contains all heavy imports and logic
+"""
+
+import typer
+
+
+def _format_seconds(seconds):
+    seconds = round(seconds)
+    return f"{seconds // 3600:02d}:{seconds % 3600 // 60:02d}:{seconds % 60:02d}"
+
+
+def execute_report(path, file_name="telemetry.jsonl"):
+    """
+    Main report implementation - all heavy logic happens here.
+    This function is only imported when the report command is actually called.
+    """
+    from quansys.workflow.telemetry import load_events, summarize_events
+
+    if path.is_dir():
+        path = path / file_name
+    if not path.exists():
+        typer.echo(f"Error: no telemetry found at {path}", err=True)
+        raise typer.Exit(1)
+
+    summary = summarize_events(load_events(path))
+    if summary.empty:
+        typer.echo("No events recorded yet.")
+        return
+
+    typer.echo(
+        f"{'phase':<10}{'identifier':<22}{'runs':>6}{'errors':>7}{'total':>11}"
+        f"{'mean':>11}{'max':>11}{'cpu':>11}{'peak RSS':>11}{'share':>7}"
+    )
+    for row in summary.itertuples():
+        typer.echo(
+            f"{row.phase:<10}{row.identifier:<22}{row.runs:>6}{row.errors:>7}"
+            f"{_format_seconds(row.wall_s):>11}{_format_seconds(row.mean_s):>11}"
+            f"{_format_seconds(row.max_s):>11}{_format_seconds(row.cpu_s):>11}"
+            f"{row.peak_rss_mb / 1024:>7.1f} GiB{row.share:>7.0%}"
+        )
+
+    typer.echo("")
+    typer.echo(f"Total wall time: {_format_seconds(summary['wall_s'].sum())}")
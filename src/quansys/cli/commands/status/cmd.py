@@ -0,0 +1,26 @@
+"""
+Status command - lightweight signature only, heavy logic in impl.py
+"""
+
+from pathlib import Path
+from typing import Annotated
+
+import typer
+
+
+def status(
+    root_folder: Annotated[Path, typer.Argument(help="The workflow's results folder.")],
+    last: Annotated[
+        int,
+        typer.Option(
+            "--last", "-n", help="Number of recent runs the throughput is taken from."
+        ),
+    ] = 20,
+):
+    """
+    Show per-analysis progress, throughput and ETA of a (running) workflow.
+    """
+    # Lazy import the heavy implementation only when command is actually called
+    from .impl import execute_status
+
+    return execute_status(root_folder=root_folder, last=last)
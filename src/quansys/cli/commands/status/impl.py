@@ -0,0 +1,157 @@
+"""
+Status command implementation.
+
+Meant to be polled (e.g. from `watch`) on large, NFS-mounted results trees, so
+it reads the small ``progress.json`` written by the workflow and deliberately
+imports nothing from `quansys.workflow` (which pulls in pyaedt).
+"""
+
+import json
+import sqlite3
+import time
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+
+import typer
+
+# written by quansys.workflow.progress.ProgressIndex
+PROGRESS_FILE = "progress.json"
+
+
+@dataclass
+class IdentifierStatus:
+    """Progress of one identifier, with throughput over the recent runs."""
+
+    identifier: str
+    done: int
+    running: int
+    failed: int
+    pending: int
+    per_hour: float | None = None
+
+    @property
+    def eta_seconds(self):
+        if not self.pending:
+            return 0.0
+        if not self.per_hour:
+            return None
+        return self.pending / self.per_hour * 3600
+
+
+def read_status(root, last=20):
+    """
+    Progress of the workflow under `root`, and the age of that information in
+    seconds.
+
+    Reads ``progress.json`` when present. Otherwise the ledger is counted,
+    which is slower, knows nothing about runs that were not allocated yet and
+    gives no throughput (the age is then None).
+    """
+    path = Path(root) / PROGRESS_FILE
+    if not path.exists():
+        return _ledger_status(Path(root)), None
+
+    data = json.loads(path.read_text())
+    statuses = []
+    for identifier, entry in data["identifiers"].items():
+        running = int(entry["running_since"] is not None)
+        remaining = entry["total"] - entry["done"] - entry["failed"] - running
+        statuses.append(
+            IdentifierStatus(
+                identifier=identifier,
+                done=entry["done"],
+                running=running,
+                failed=entry["failed"],
+                pending=max(0, remaining),
+                per_hour=_per_hour(entry["recent"][-last:]),
+            )
+        )
+    return statuses, time.time() - data["updated"]
+
+
+def _per_hour(times):
+    if len(times) < 2 or times[-1] <= times[0]:
+        return None
+    return (len(times) - 1) / (times[-1] - times[0]) * 3600
+
+
+def _ledger_status(root):
+    if (root / "metadata.sqlite").exists():
+        counts = _sqlite_counts(root / "metadata.sqlite")
+    elif (root / "metadata.json").exists():
+        counts = _json_counts(root / "metadata.json")
+    else:
+        return []
+
+    return [
+        IdentifierStatus(
+            identifier=identifier,
+            done=c["done"],
+            running=c["running"],
+            failed=c["error"],
+            pending=c["pending"],
+        )
+        for identifier, c in counts.items()
+    ]
+
+
+def _json_counts(path):
+    # the raw ledger is enough to count statuses; no records are validated
+    counts = {}
+    for identifier, tree in json.loads(path.read_text()).items():
+        records = tree.get("iterations", {})
+        if records:
+            counts[identifier] = Counter(r["status"] for r in records.values())
+    return counts
+
+
+def _sqlite_counts(path):
+    counts = {}
+    with sqlite3.connect(f"file:{path}?mode=ro", uri=True) as db:
+        rows = db.execute(
+            "SELECT identifier, status, COUNT(*) FROM runs "
+            "WHERE relpath = 'iterations' GROUP BY identifier, status"
+        )
+        for identifier, status, count in rows:
+            counts.setdefault(identifier, Counter())[status] = count
+    return counts
+
+
+def _format_seconds(seconds):
+    if seconds is None:
+        return "-"
+    seconds = round(seconds)
+    return f"{seconds // 3600:02d}:{seconds % 3600 // 60:02d}:{seconds % 60:02d}"
+
+
+def execute_status(root_folder, last):
+    """
+    Main status implementation.
+    This function is only imported when the status command is actually called.
+    """
+    statuses, age = read_status(root_folder, last)
+    if not statuses:
+        typer.echo(f"Error: no workflow progress found in {root_folder}", err=True)
+        raise typer.Exit(1)
+
+    typer.echo(
+        f"{'identifier':<24}{'done':>7}{'running':>9}{'failed':>8}{'pending':>9}"
+        f"{'per hour':>10}{'ETA':>11}"
+    )
+    for s in statuses:
+        per_hour = "-" if s.per_hour is None else f"{s.per_hour:.1f}"
+        typer.echo(
+            f"{s.identifier:<24}{s.done:>7}{s.running:>9}{s.failed:>8}{s.pending:>9}"
+            f"{per_hour:>10}{_format_seconds(s.eta_seconds):>11}"
+        )
+
+    typer.echo("")
+    # analyses of one iteration run back to back; the slowest one bounds the run
+    etas = [s.eta_seconds for s in statuses]
+    eta = None if None in etas else max(etas)
+    typer.echo(f"ETA: {_format_seconds(eta)}")
+    if age is None:
+        typer.echo("(counted from the ledger: no progress.json, no throughput)")
+    else:
+        typer.echo(f"(updated {_format_seconds(age)} ago)")
@@ -27,6 +27,26 @@ def submit(
     overwrite: bool = typer.Option(
         False, "--overwrite", help="Overwrite the existing project folder."
     ),
+    auto_resources: bool = typer.Option(
+        False,
+        "--auto-resources",
+        help="Size memory, time limit and queue from earlier runs "
+        "(falls back to --mem/--timeout without history).",
+    ),
+    history: list[Path] = typer.Option(
+        None,
+        "--history",
+        "-H",
+        help="Earlier workflow config.yaml files, or folders to search for them.",
+    ),
+    margin: float = typer.Option(
+        0.25, "--margin", help="Relative safety margin for --auto-resources."
+    ),
+    queues: str = typer.Option(
+        "short=03:00,medium=24:00,long=168:00",
+        "--queues",
+        help="Queues and their run limits (HH:MM), for --auto-resources.",
+    ),
 ):
     """
     Prepare and optionally submit a simulation workflow to the cluster.
@@ -43,4 +63,8 @@ def submit(
         timeout=timeout,
         prepare=prepare,
         overwrite=overwrite,
+        auto_resources=auto_resources,
+        history=history,
+        margin=margin,
+        queues=queues,
     )
@@ -4,9 +4,12 @@ Submit command implementation - contains all heavy imports and logic
 
 import typer
 from pathlib import Path
+import re
 import shutil
 import subprocess
 
+_QUEUE = re.compile(r"(?P<name>[\w.-]+)\s*=\s*(?P<hours>\d+):(?P<minutes>[0-5]\d)")
+
 
 def _copy_files(files, target_dir):
     """Copy a list of files to the target directory."""
@@ -16,15 +19,26 @@ def _copy_files(files, target_dir):
         shutil.copy(file, target_dir)
 
 
+DEFAULT_CORES = 8
+
+
 def _generate_job_submission_script(
-    results_dir, config, mem_mb, timeout, default_cores=8
+    results_dir,
+    config,
+    mem_mb,
+    timeout,
+    default_cores=DEFAULT_CORES,
+    cores=None,
+    queue="short",
 ):
     """Generate the job_submission.sh script."""
     # try to look for cores in all simulations and take the maximum
-    core_lst = map(
-        lambda x: x.cores if hasattr(x, "cores") else 1, config.simulations.values()
-    )
-    cores = max(default_cores, max(core_lst))
+    if cores is None:
+        core_lst = map(
+            lambda x: x.cores if hasattr(x, "cores") else 1,
+            config.simulations.values(),
+        )
+        cores = max(default_cores, max(core_lst))
 
     project_name = results_dir.stem
     results_dir = results_dir.resolve()  # Ensure full path
@@ -33,7 +47,7 @@ def _generate_job_submission_script(
 
     template = f"""#!/bin/bash
 bsub -J {project_name} \\
-    -q short \\
+    -q {queue} \\
     -oo {(results_dir / "lsf_output_%J.log")} \\
     -eo {(results_dir / "lsf_error_%J.err")} \\
     -n {cores} \\
@@ -63,7 +77,61 @@ quansys run {config_path}
     simulation_script.chmod(0o755)
 
 
-def _prepare_job(config_path, project_dir, files, mem, timeout, venv):
+def _parse_queues(queues):
+    """'short=03:00,long=168:00' -> [(minutes, 'short'), (10080, 'long')], sorted."""
+    table = []
+    for entry in queues.split(","):
+        match = _QUEUE.fullmatch(entry.strip())
+        if match is None:
+            raise typer.BadParameter(
+                f"expected name=HH:MM, got {entry.strip()!r}", param_hint="--queues"
+            )
+        minutes = int(match["hours"]) * 60 + int(match["minutes"])
+        table.append((minutes, match["name"]))
+    return sorted(table)
+
+
+def _auto_resources(config_path, history, margin, queues, mem, timeout):
+    """
+    Smallest reservation that covered the worst finished run of each analysis,
+    plus the safety margin. Without history the given mem/timeout are kept.
+    Cores come from the config, with the same `DEFAULT_CORES` floor as without
+    auto resources.
+    """
+    from quansys.workflow.history import make_plan, recommend
+
+    table = _parse_queues(queues)
+    # the worst run that still succeeded, not a typical one
+    plan = make_plan(config_path, history or [], quantile=1.0)
+    resources = recommend(plan, margin=margin)
+    for note in resources.notes:
+        typer.echo(f"Note: {note}")
+
+    if resources.mem_mb is None:
+        typer.echo(f"No memory history, keeping --mem {mem}")
+        resources.mem_mb = mem
+    if resources.timeout is None:
+        typer.echo(f"No run time history, keeping --timeout {timeout}")
+    timeout = resources.timeout or timeout
+
+    hours, minutes = timeout.split(":")
+    needed = int(hours) * 60 + int(minutes)
+    limit, queue = next(((m, q) for m, q in table if m >= needed), table[-1])
+    if limit < needed:
+        typer.echo(f"Predicted {timeout} exceeds every queue, capping at {queue}")
+        timeout = f"{limit // 60:02d}:{limit % 60:02d}"
+
+    cores = max(DEFAULT_CORES, resources.cores)
+    typer.echo(
+        f"Auto resources: {cores} cores, {resources.mem_mb} MB, "
+        f"-W {timeout}, queue {queue}"
+    )
+    return cores, resources.mem_mb, timeout, queue
+
+
+def _prepare_job(
+    config_path, project_dir, files, mem, timeout, venv, cores=None, queue="short"
+):
     """Prepare the workflow: create directories, copy files, generate scripts."""
     import quansys.workflow as workflow
 
@@ -80,7 +148,9 @@ def _prepare_job(config_path, project_dir, files, mem, timeout, venv):
         _copy_files(files, project_dir)
 
     # Generate cluster scripts
-    _generate_job_submission_script(project_dir, config, mem, timeout)
+    _generate_job_submission_script(
+        project_dir, config, mem, timeout, cores=cores, queue=queue
+    )
     _generate_simulation_script(project_dir, venv)
 
     return project_dir.resolve()
@@ -98,7 +168,20 @@ def _submit_job(results_dir):
     subprocess.run(["bash", job_script], check=True)
 
 
-def execute_submit(config_path, venv, name, files, mem, timeout, prepare, overwrite):
+def execute_submit(
+    config_path,
+    venv,
+    name,
+    files,
+    mem,
+    timeout,
+    prepare,
+    overwrite,
+    auto_resources=False,
+    history=None,
+    margin=0.25,
+    queues="short=03:00,medium=24:00,long=168:00",
+):
     """
     Main submit implementation - all heavy logic happens here.
     This function is only imported when the submit command is actually called.
@@ -111,8 +194,20 @@ def execute_submit(config_path, venv, name, files, mem, timeout, prepare, overwr
         typer.echo(f"Overwriting the existing project '{name}'...")
         shutil.rmtree(project_dir)
 
+    # Size the reservation from earlier runs (this project included, if resumed)
+    cores, queue = None, "short"
+    if auto_resources:
+        history = list(history or [])
+        if project_dir.exists():
+            history.append(project_dir)
+        cores, mem, timeout, queue = _auto_resources(
+            config_path, history, margin, queues, mem, timeout
+        )
+
     # Prepare the job (heavy workflow imports happen here)
-    results_dir = _prepare_job(config_path, project_dir, files, mem, timeout, venv)
+    results_dir = _prepare_job(
+        config_path, project_dir, files, mem, timeout, venv, cores, queue
+    )
 
     if prepare:
         typer.echo(f"Job prepared. Results directory: {results_dir}")
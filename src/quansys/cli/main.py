@@ -5,6 +5,12 @@ import typer
 from .commands.submit import submit
 from .commands.run import run
 from .commands.example import example
+from .commands.cache import cache_app
+from .commands.ledger import ledger_app
+from .commands.plan import plan
+from .commands.report import report
+from .commands.status import status
+from .commands.aggregate import aggregate
 
 # Suppress FutureWarning from pyaedt
 warnings.filterwarnings("ignore", category=FutureWarning, module="pyaedt")
@@ -16,6 +22,12 @@ app = typer.Typer(help="Workflow management commands.")
 app.command()(submit)
 app.command()(run)
 app.command()(example)
+app.command()(plan)
+app.command()(report)
+app.command()(status)
+app.command()(aggregate)
+app.add_typer(cache_app, name="cache")
+app.add_typer(ledger_app, name="ledger")
 
 if __name__ == "__main__":
     app()
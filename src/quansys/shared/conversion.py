@@ -1,25 +1,65 @@
-import pint
+from __future__ import annotations
 
-# Create a global unit registry to be used by the convert() function.
-ureg = pint.UnitRegistry(case_sensitive=False)
-ureg.formatter.default_format = "~"
+from functools import cache, lru_cache
+from typing import TYPE_CHECKING, NamedTuple
+
+import numpy as np
+
+from .hfss_values import hfss_si_scale
+
+if TYPE_CHECKING:
+    import pint
 
 
 # Define the canonical units and their multipliers relative to Hz.
 case_sensitive_units = ("Hz", "kHz", "MHz", "GHz")
 multipliers = {"Hz": 1, "kHz": 1e3, "MHz": 1e6, "GHz": 1e9}
 
-# Add lower-case aliases for each canonical unit.
-for canonical in case_sensitive_units:
-    lower_unit = canonical.lower()
-    # Only define an alias if lower-case version differs from canonical.
-    if lower_unit != canonical:
-        # Example: For GHz, create the alias: "ghz = 1e9 * Hz = GHz"
-        definition = f"{lower_unit} = {multipliers[canonical]} * Hz"
-        try:
-            ureg.define(definition)
-        except Exception as e:
-            print(f"Failed to define alias for {canonical}: {e}")
+
+@cache
+def get_registry() -> pint.UnitRegistry:
+    """
+    The unit registry used by the conversions of quansys, built on first use.
+
+    Building a registry takes a few hundred milliseconds, which every process
+    importing quansys (e.g. each post-processing worker) would otherwise pay
+    at import time even if it never converts a unit.
+    """
+    import pint
+
+    ureg = pint.UnitRegistry(case_sensitive=False)
+    ureg.formatter.default_format = "~"
+
+    # Add lower-case aliases for each canonical unit.
+    for canonical in case_sensitive_units:
+        lower_unit = canonical.lower()
+        # Only define an alias if lower-case version differs from canonical.
+        if lower_unit != canonical:
+            # Example: For GHz, create the alias: "ghz = 1e9 * Hz = GHz"
+            definition = f"{lower_unit} = {multipliers[canonical]} * Hz"
+            try:
+                ureg.define(definition)
+            except Exception as e:
+                print(f"Failed to define alias for {canonical}: {e}")
+    return ureg
+
+
+@cache
+def get_case_sensitive_registry() -> pint.UnitRegistry:
+    """
+    A plain pint registry, in which case matters ("Mm" is a megameter, "Pa" a
+    pascal). Built on first use, like `get_registry`.
+    """
+    import pint
+
+    return pint.UnitRegistry()
+
+
+def __getattr__(name: str):
+    # `ureg` is still available as a module attribute, built when first read
+    if name == "ureg":
+        return get_registry()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def is_dimensionless(unit: str | None) -> bool:
@@ -65,7 +105,7 @@ class SIConverter:
         """
         try:
             # Create the quantity and convert it to SI (base) units.
-            quantity = ureg.Quantity(value, unit)
+            quantity = get_registry().Quantity(value, unit)
             si_quantity = quantity.to_base_units()
         except Exception as e:
             raise ValueError(f"Error converting {value} from unit '{unit}' to SI: {e}")
@@ -89,14 +129,14 @@ class SIConverter:
         """
         try:
             # Determine the SI base unit corresponding to the target unit.
-            base_unit = ureg.Quantity(1, target_unit).to_base_units().units
+            base_unit = get_registry().Quantity(1, target_unit).to_base_units().units
         except Exception as e:
             raise ValueError(
                 f"Error determining SI base unit for target '{target_unit}': {e}"
             )
         try:
             # Create a quantity in SI using the determined base unit and convert it.
-            quantity = ureg.Quantity(value, base_unit)
+            quantity = get_registry().Quantity(value, base_unit)
             converted_quantity = quantity.to(target_unit)
         except Exception as e:
             raise ValueError(
@@ -105,14 +145,81 @@ class SIConverter:
         return converted_quantity.magnitude, str(converted_quantity.units)
 
 
+class ConversionFactor(NamedTuple):
+    """
+    An affine unit conversion: ``converted = value * scale + offset``.
+
+    `offset` is only non-zero for offset units (e.g. degC to K). Conversions
+    that are not affine (logarithmic units) have ``scale=None`` and go through
+    pint on every call.
+    """
+
+    scale: float | None
+    offset: float
+    unit: str
+
+
+@lru_cache(maxsize=512)
+def conversion_factor(unit: str, target_unit: str | None = None) -> ConversionFactor:
+    """
+    The conversion from `unit` to `target_unit` (SI base units when `None`),
+    resolved by pint once per pair and cached.
+
+    Raises:
+        ValueError: If either unit is unknown or they are not compatible.
+    """
+    try:
+        zero, one, two = (
+            _to(get_registry().Quantity(x, unit), target_unit) for x in (0.0, 1.0, 2.0)
+        )
+    except Exception as e:
+        raise ValueError(
+            f"Error converting from '{unit}' to '{target_unit or 'SI'}': {e}"
+        ) from e
+
+    offset = zero.magnitude
+    scale = one.magnitude - offset
+    if not np.isclose(two.magnitude, 2 * scale + offset, rtol=1e-12, atol=0):
+        scale = None
+    return ConversionFactor(scale, offset, str(one.units))
+
+
+def to_si(value: float, unit: str | None) -> float:
+    """
+    Convert a value in an HFSS unit (case-insensitive, e.g. "nh", "mm", "GHz")
+    to SI base units.
+
+    SI-prefixed HFSS units are resolved with a table lookup (see
+    `quansys.shared.hfss_values`); any other unit by pint, once per unit.
+
+    Raises:
+        ValueError: If the unit is unknown.
+    """
+    scale = hfss_si_scale(unit or "")
+    if scale is not None:
+        return value * scale
+
+    factor = conversion_factor(unit)
+    if factor.scale is None:
+        return _to(get_registry().Quantity(value, unit), None).magnitude
+    return value * factor.scale + factor.offset
+
+
+def _to(quantity: pint.Quantity, target_unit: str | None) -> pint.Quantity:
+    if target_unit is None:
+        return quantity.to_base_units()
+    return quantity.to(target_unit)
+
+
 def convert(
     value: float | int, unit: str, target_unit: str | None
 ) -> tuple[float, str]:
     """
     Convert a value from one arbitrary unit to another directly.
 
-    This function does not rely on the SIConverter class. Instead, it creates a Pint quantity
-    from the given value and unit and uses the `.to()` method to perform the conversion.
+    This function does not rely on the SIConverter class. The conversion
+    factor of each (unit, target_unit) pair is resolved by pint once and
+    cached (see `conversion_factor`).
 
     Args:
         value (float or int): The numeric value.
@@ -134,13 +241,46 @@ def convert(
         # Input is dimensionless; nothing to convert.
         return value, ""
     try:
-        quantity = ureg.Quantity(value, unit)
-        converted_quantity = quantity.to(target_unit)
-    except Exception as e:
+        factor = conversion_factor(unit, target_unit)
+    except ValueError as e:
         raise ValueError(
-            f"Error converting {value} from '{unit}' to '{target_unit}': {e}"
+            f"Error converting {value} from '{unit}' to '{target_unit}': {e.__cause__}"
         )
-    return converted_quantity.magnitude, str(converted_quantity.units)
+    if factor.scale is None:
+        return _to(
+            get_registry().Quantity(value, unit), target_unit
+        ).magnitude, factor.unit
+    return value * factor.scale + factor.offset, factor.unit
+
+
+def convert_array(
+    values: np.typing.ArrayLike, unit: str, target_unit: str | None
+) -> tuple[np.ndarray, str]:
+    """
+    Vectorized `convert`: convert every element of `values` from `unit` to
+    `target_unit` at once.
+
+    Returns:
+        tuple: (converted float array, unit_str), as for `convert`.
+
+    Raises:
+        ValueError: If the conversion fails.
+    """
+    values = np.asarray(values, dtype=float)
+    if target_unit is None or target_unit == "":
+        return values, unit
+
+    if is_dimensionless(unit):
+        return values, ""
+    factor = conversion_factor(unit, target_unit)
+    if factor.scale is None:
+        return _to(
+            get_registry().Quantity(values, unit), target_unit
+        ).magnitude, factor.unit
+    converted = values * factor.scale
+    if factor.offset:
+        converted += factor.offset
+    return converted, factor.unit
 
 
 # === Example Usages ===
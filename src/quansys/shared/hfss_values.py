@@ -0,0 +1,107 @@
+"""
+Parsing of HFSS value strings such as ``"10nh"``, ``"3 mm"`` or ``"1e-8"``.
+
+HFSS accepts unit names regardless of case ("10nh" is 10 nH), while pint is
+case-sensitive ("nh" is a nanohour). The common forms, an SI prefix and a base
+unit, are resolved here with a regex and a lookup table; `hfss_unit_to_pint`
+gives the pint spelling for everything else. A unit written exactly as pint
+spells it keeps that meaning ("Mohm" is a megaohm, "mohm" a milliohm); other
+spellings are looked up regardless of case.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+
+# lower-case HFSS name -> (pint spelling, scale to SI)
+_HFSS_BASE_UNITS = {
+    "m": ("m", 1.0),
+    "h": ("H", 1.0),
+    "f": ("F", 1.0),
+    "hz": ("Hz", 1.0),
+    "s": ("s", 1.0),
+    "ohm": ("ohm", 1.0),
+    "v": ("V", 1.0),
+    "a": ("A", 1.0),
+}
+_HFSS_PREFIXES = {
+    "f": ("f", 1e-15),
+    "p": ("p", 1e-12),
+    "n": ("n", 1e-9),
+    "u": ("u", 1e-6),
+    "m": ("m", 1e-3),
+    "c": ("c", 1e-2),
+    "k": ("k", 1e3),
+    "meg": ("M", 1e6),
+    "g": ("G", 1e9),
+    "t": ("T", 1e12),
+}
+_HFSS_UNITS = {
+    prefix + base: (pint_prefix + pint_base, prefix_scale * base_scale)
+    for base, (pint_base, base_scale) in _HFSS_BASE_UNITS.items()
+    for prefix, (pint_prefix, prefix_scale) in (
+        {"": ("", 1.0)} | _HFSS_PREFIXES
+    ).items()
+}
+# frequencies are written "MHz" in HFSS, so "mhz" means mega, not milli
+_HFSS_UNITS.update(
+    {
+        "mhz": ("MHz", 1e6),
+        "mil": ("mil_length", 2.54e-5),
+        "in": ("inch", 0.0254),
+        "deg": ("deg", math.pi / 180),
+        "rad": ("rad", 1.0),
+    }
+)
+
+# pint spelling -> (pint spelling, scale to SI), matched before the lower case
+_PINT_UNITS = {entry[0]: entry for entry in _HFSS_UNITS.values()}
+
+HFSS_UNITS = {unit: pint_unit for unit, (pint_unit, _) in _HFSS_UNITS.items()}
+
+_NUMBER_AND_UNIT = re.compile(
+    r"^\s*(?P<number>[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)\s*(?P<unit>[A-Za-z]*)\s*$"
+)
+
+
+def parse_hfss_value(text: str) -> tuple[float, str] | None:
+    """
+    Split a number with an optional unit ("10nh", "3 mm", "1e-8") into the
+    number and the unit as written; `None` for anything else (expressions,
+    variable names).
+    """
+    match = _NUMBER_AND_UNIT.match(text)
+    if match is None:
+        return None
+    return float(match["number"]), match["unit"]
+
+
+def _lookup(unit: str) -> tuple[str, float] | None:
+    return _PINT_UNITS.get(unit) or _HFSS_UNITS.get(unit.lower())
+
+
+def hfss_unit_to_pint(unit: str) -> str:
+    """Return the pint spelling of an HFSS unit name (case-insensitive)."""
+    entry = _lookup(unit)
+    return unit if entry is None else entry[0]
+
+
+def pint_si_scale(unit: str) -> float | None:
+    """
+    The factor to SI base units of a table unit written exactly as pint spells
+    it ("nH", "Mohm"), or `None`. Unlike `hfss_si_scale`, case is never ignored.
+    """
+    entry = _PINT_UNITS.get(unit)
+    return None if entry is None else entry[1]
+
+
+def hfss_si_scale(unit: str) -> float | None:
+    """
+    The factor from the HFSS unit `unit` to SI base units, or `None` when it
+    is not an SI-prefixed HFSS unit (pint has to resolve it).
+    """
+    if not unit:
+        return 1.0
+    entry = _lookup(unit)
+    return None if entry is None else entry[1]
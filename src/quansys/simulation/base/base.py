@@ -1,6 +1,7 @@
 from pydantic import BaseModel, TypeAdapter
 from abc import ABC, abstractmethod
 from enum import StrEnum, auto
+from typing import Any
 from ansys.aedt.core import Hfss
 
 FlatDictType = dict[str, str | bool | float]
@@ -36,3 +37,28 @@ class BaseAnalysis(BaseModel, ABC):
     @abstractmethod
     def analyze(self, hfss: Hfss) -> BaseSimulationOutput:
         pass
+
+    def collect(self, hfss: Hfss) -> Any:
+        """
+        HFSS-bound part of the analysis.
+
+        Everything that needs the open AEDT session happens here. The returned
+        object must be picklable, as it may be handed to a background process
+        for `post_process`. By default, the whole analysis runs here.
+        """
+        return self.analyze(hfss)
+
+    def extract(self, hfss: Hfss) -> Any:
+        """
+        Like `collect`, but for a setup that is already solved for the current
+        nominal variation (e.g. by a parametric sweep). Analyses that solve
+        in `collect` override this to only read the existing solution.
+        """
+        return self.collect(hfss)
+
+    def post_process(self, collected: Any) -> BaseSimulationOutput:
+        """
+        CPU-only part of the analysis, applied to the output of `collect`.
+        By default, `collect` already returns the final result.
+        """
+        return collected
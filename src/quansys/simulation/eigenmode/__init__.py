@@ -1,6 +1,8 @@
+from .mesh import MeshSeed
 from .model import EigenmodeAnalysis, EigenmodeResults
 
 __all__ = [
     "EigenmodeAnalysis",
     "EigenmodeResults",
+    "MeshSeed",
 ]
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+
+from ansys.aedt.core.application.analysis import Setup
+from ansys.aedt.core.internal.errors import AEDTRuntimeError, GrpcApiError
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+
+class MeshSeed(BaseModel):
+    """
+    A solved project whose converged mesh seeds the next adaptive solve.
+
+    Attributes:
+        project: Path to the solved `.aedt` project (its `.aedtresults` must still exist).
+        variables: Values of the design variables at which `project` was solved,
+            as HFSS strings (e.g. {"chip_base_width": "3mm"}). Variables not listed
+            are mapped to the same variable of the target design.
+    """
+
+    project: Path
+    variables: dict[str, str] = {}
+
+
+def link_mesh(setup: Setup, design_name: str, seed: MeshSeed) -> bool:
+    """
+    Import the converged mesh of `seed` as the initial mesh of `setup`.
+
+    The source solution is the same setup of the same design in the seed
+    project, at the variation it was solved for. The source is never re-solved:
+    if its solution is missing HFSS falls back to the initial mesh.
+
+    Returns:
+        bool: True if the mesh link was applied. False (with a warning logged
+        when AEDT rejected it) means the solve starts from the initial mesh.
+
+    Raises:
+        ValueError: If pyaedt rejects the arguments, e.g. an unknown design.
+    """
+    if not seed.project.exists():
+        return False
+
+    try:
+        if not setup.add_mesh_link(
+            design_name,
+            solution=f"{setup.name} : LastAdaptive",
+            project=str(seed.project.resolve()),
+            force_source_to_solve=False,
+            preserve_partner_solution=True,
+            apply_mesh_operations=True,
+        ):
+            return False
+
+        # pyaedt maps every source variable to the same target variable, which
+        # points at a variation the source never solved; pin the swept ones
+        setup.props["MeshLink"]["Params"].update(seed.variables)
+        return bool(setup.update())
+    except (GrpcApiError, AEDTRuntimeError) as exc:
+        logger.warning(
+            "Mesh link from %s not applied to %s (%s: %s); solving from the "
+            "initial mesh",
+            seed.project,
+            setup.name,
+            type(exc).__name__,
+            exc,
+        )
+        return False
@@ -1,4 +1,5 @@
 from ansys.aedt.core import Hfss
+from pydantic import Field
 from typing import Literal
 
 
@@ -8,9 +9,11 @@ from ..base import (
     set_design_and_get_setup,
     update_setup_parameters,
     validate_solution_type,
+    validate_existing_solution,
 )
 
 from .results import get_eigenmode_results, EigenmodeResults, SimpleProfile
+from .mesh import MeshSeed, link_mesh
 
 
 class EigenmodeAnalysis(BaseAnalysis):
@@ -28,6 +31,14 @@ class EigenmodeAnalysis(BaseAnalysis):
         gpus: Number of GPUs to allocate (default is 0).
         setup_parameters: Optional dictionary of parameters to override the setup configuration.
         frequency_unit: Optional string to specify the frequency unit (default is 'GHz').
+        reuse_mesh: If True, the adaptive meshing starts from the converged mesh of a
+            previous, nearby sweep point instead of the initial mesh (default is False).
+            The workflow then runs neighbouring points consecutively and provides
+            `mesh_seed`; whether the mesh was reused and the number of adaptive passes
+            are recorded in the result profile. Requires
+            `prepare_folder.copy_enabled`.
+        mesh_seed: Runtime-only source of the mesh to reuse. Set by the workflow,
+            never serialized.
     """
 
     type: Literal[SimulationTypesNames.EIGENMODE] = SimulationTypesNames.EIGENMODE
@@ -37,6 +48,8 @@ class EigenmodeAnalysis(BaseAnalysis):
     gpus: int = 0
     setup_parameters: dict = {}
     frequency_unit: str = "GHz"
+    reuse_mesh: bool = False
+    mesh_seed: MeshSeed | None = Field(None, exclude=True)
 
     def analyze(self, hfss: Hfss) -> EigenmodeResults:
         """
@@ -62,6 +75,11 @@ class EigenmodeAnalysis(BaseAnalysis):
         # validate solution type
         validate_solution_type(setup, setup_type="HfssEigen")
 
+        # seed the adaptive meshing from a neighbouring solved point
+        mesh_reused = False
+        if self.reuse_mesh and self.mesh_seed is not None:
+            mesh_reused = link_mesh(setup, self.design_name, self.mesh_seed)
+
         # Analyze
         setup.analyze(cores=self.cores, gpus=self.gpus)
 
@@ -72,8 +90,34 @@ class EigenmodeAnalysis(BaseAnalysis):
         results = get_eigenmode_results(setup=setup)
 
         # Add profile information
-        results.profile = SimpleProfile.from_setup(setup)
+        results.profile = SimpleProfile.from_setup(setup, mesh_reused=mesh_reused)
+
+        return results
+
+    def extract(self, hfss: Hfss) -> EigenmodeResults:
+        """
+        Extract results of an already solved setup, without running it.
+
+        Used when the setup was solved for many variations at once, and the
+        variation of interest has been made the nominal one.
+
+        Args:
+            hfss: An active HFSS project instance.
+
+        Returns:
+            EigenmodeResults: Object containing frequencies and Q-factors of each eigenmode.
 
+        Raises:
+            ValueError: If `hfss` is not a valid Hfss instance or the setup has no solution.
+        """
+        if not isinstance(hfss, Hfss):
+            raise ValueError("hfss given must be a Hfss instance")
+
+        setup = set_design_and_get_setup(hfss, self.design_name, self.setup_name)
+        validate_existing_solution(setup)
+
+        results = get_eigenmode_results(setup=setup)
+        results.profile = SimpleProfile.from_setup(setup)
         return results
 
     # @staticmethod
@@ -40,6 +40,11 @@ def _normalise_mem(s: str, unit: str = "GB") -> float:
     return v
 
 
+def memory_to_gb(s: str) -> float:
+    """Parse a memory string as found in HFSS profiles ('356 M', '1.2 GB') to GB."""
+    return _normalise_mem(str(s), unit="GB")
+
+
 def timedelta_to_str(td: timedelta) -> str:
     total_seconds = int(td.total_seconds())
     h = total_seconds // 3600
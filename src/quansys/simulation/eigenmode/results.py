@@ -41,12 +41,14 @@ class SingleModeResult(BaseModel):
 class SimpleProfile(BaseModel):
     total_time_min: float | int = 0
     memory: str = ""
+    adaptive_passes: int = 0
+    mesh_reused: bool = False
 
     @classmethod
-    def from_setup(cls, setup: Setup) -> SimpleProfile:
+    def from_setup(cls, setup: Setup, mesh_reused: bool = False) -> SimpleProfile:
         profiles = setup.get_profile()
         if not profiles:
-            return cls()
+            return cls(mesh_reused=mesh_reused)
         last_profile = list(profiles.values())[-1]
 
         total_time_delta = last_profile.real_time()
@@ -54,7 +56,12 @@ class SimpleProfile(BaseModel):
 
         max_memory = str(last_profile.max_memory())
 
-        return SimpleProfile(total_time_min=total_time_mins, memory=max_memory)
+        return SimpleProfile(
+            total_time_min=total_time_mins,
+            memory=max_memory,
+            adaptive_passes=last_profile.num_adaptive_passes,
+            mesh_reused=mesh_reused,
+        )
 
 
 class EigenmodeResults(BaseSimulationOutput):
@@ -1,3 +1,4 @@
+from dataclasses import dataclass
 from typing import Literal
 from ansys.aedt.core.hfss import Hfss
 from pydantic import Field
@@ -6,10 +7,10 @@ from .distributed_analysis import DistributedAnalysis
 from .epr_calculator import EprCalculator
 from .modes_to_labels import ModesToLabels
 from ..base import BaseAnalysis, SimulationTypesNames, validate_and_set_design
-from ..eigenmode.results import get_eigenmode_results
+from ..eigenmode.results import get_eigenmode_results, EigenmodeResults
 
 from .results import QuantumResults
-from .structures import ConfigJunction, EprDiagResult, ParticipationDataset
+from .structures import ConfigJunction, ParticipationDataset
 
 
 def ensure_list(value):
@@ -18,6 +19,14 @@ def ensure_list(value):
     return value
 
 
+@dataclass
+class QuantumCollectedData:
+    """HFSS-side output of `QuantumEPR.collect`, ready for diagonalization."""
+
+    distributed: ParticipationDataset
+    eigenmode_result: EigenmodeResults
+
+
 class QuantumEPR(BaseAnalysis):
     """
     Runs an EPR-based quantum simulation using Eigenmode results and junction data.
@@ -61,6 +70,23 @@ class QuantumEPR(BaseAnalysis):
         Returns:
             QuantumResults: Final output containing EPR matrix, participation data, and labeled eigenmode results.
 
+        Raises:
+            ValueError: If `hfss` is not a valid Hfss instance.
+        """
+        return self.post_process(self.collect(hfss))
+
+    def collect(self, hfss: Hfss) -> QuantumCollectedData:
+        """
+        Extract eigenmode results and junction participation data from HFSS.
+
+        This is the only part of the analysis that needs an open HFSS session.
+
+        Args:
+            hfss: An active HFSS project instance.
+
+        Returns:
+            QuantumCollectedData: Participation dataset and labeled eigenmode results.
+
         Raises:
             ValueError: If `hfss` is not a valid Hfss instance.
         """
@@ -86,29 +112,34 @@ class QuantumEPR(BaseAnalysis):
         if isinstance(modes_to_labels, ModesToLabels):
             modes_to_labels = modes_to_labels.parse(simple_eigenmode_result)
 
-        epr, distributed = self._analyze(hfss, simple_eigenmode_result, modes_to_labels)
+        dst = DistributedAnalysis(
+            hfss, modes_to_labels=modes_to_labels, junctions_infos=self.junctions_infos
+        )
 
-        return QuantumResults(
-            epr=epr,
-            distributed=distributed,
+        return QuantumCollectedData(
+            distributed=dst.main(simple_eigenmode_result),
             eigenmode_result=eigenmode_result.generate_a_labeled_version(
                 modes_to_labels
             ),
         )
 
-    def _analyze(
-        self,
-        hfss: Hfss,
-        eigenmode_result: dict[int, dict[str, float]],
-        modes_to_labels: dict[int, str],
-    ) -> tuple[EprDiagResult, ParticipationDataset]:
-        dst = DistributedAnalysis(
-            hfss, modes_to_labels=modes_to_labels, junctions_infos=self.junctions_infos
-        )
+    def post_process(self, collected: QuantumCollectedData) -> QuantumResults:
+        """
+        Numerically diagonalize the EPR Hamiltonian for collected data.
 
-        distributed_result = dst.main(eigenmode_result)
+        Runs without HFSS, so it can be moved to a background process.
 
-        calc = EprCalculator(participation_dataset=distributed_result)
-        epr_result = calc.epr_numerical_diagonalizing()
+        Args:
+            collected: Output of `collect`.
+
+        Returns:
+            QuantumResults: Final output containing EPR matrix, participation data, and labeled eigenmode results.
+        """
+        calc = EprCalculator(participation_dataset=collected.distributed)
+        epr = calc.epr_numerical_diagonalizing()
 
-        return epr_result, distributed_result
+        return QuantumResults(
+            epr=epr,
+            distributed=collected.distributed,
+            eigenmode_result=collected.eigenmode_result,
+        )
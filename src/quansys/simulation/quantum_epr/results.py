@@ -1,7 +1,7 @@
 from typing import Literal, TypeVar, Type, Callable, Iterable
 from .structures import EprDiagResult, ParticipationDataset
 import numpy as np
-from .serializer import dataclass_to_dict, dict_to_dataclass
+from .serializer import dataclass_to_dict, lazy_dataclass
 from itertools import combinations
 from ..base import BaseSimulationOutput, SimulationOutputTypesNames, FlatDictType
 from ..eigenmode.results import EigenmodeResults
@@ -17,9 +17,11 @@ T = TypeVar("T")
 
 
 def factory_custom_dataclass_before_validator(cls: Type[T]) -> Callable[[dict], T]:
+    # fields are decoded on first access: aggregation (`flatten`) only reads
+    # the labels, chi and frequencies
     def validator(x: dict | Type[T]) -> T:
         if isinstance(x, dict):
-            return dict_to_dataclass(cls, x)
+            return lazy_dataclass(cls, x)
         return x
 
     return validator
@@ -1,52 +1,73 @@
 from numpy.typing import NDArray
 import numpy as np
-from dataclasses import is_dataclass, fields, dataclass
+from dataclasses import MISSING, Field, is_dataclass, fields, dataclass
+from functools import cache
 from typing import Any
 
+from ..storage import (
+    ARRAY_REF,
+    complex_to_dicts,
+    current_array_store,
+    use_array_store,
+)
 
-def serialize_ndarray(array: NDArray) -> Any:
+
+def serialize_ndarray(array: NDArray, name: str = "array") -> Any:
     """
     Serialize an ndarray to a JSON-serializable structure.
+    When an array sidecar is active (see `quansys.simulation.storage`), the array
+    is stored there as is and a reference to it is returned.
     If the array contains complex numbers, it converts each element to a dict with real and imaginary parts.
     Otherwise, it converts the array to a nested list.
     """
+    store = current_array_store()
+    if store is not None and array.dtype != object:
+        return store.put(array, name)
+
+    if not np.iscomplexobj(array):
+        return array.tolist()
+
     is_not_complex = np.isclose(np.sum(np.imag(array)), 0)
     if is_not_complex:
         return np.real(array).tolist()
 
-    # Recursively serialize complex arrays of arbitrary dimensions
-    def serialize_element(element):
-        if isinstance(element, complex):
-            return {"real": element.real, "imag": element.imag}
-        return element
-
-    return np.vectorize(serialize_element, otypes=[object])(array).tolist()
+    # element-wise dicts, built from the (C-level) nested lists of both parts
+    return complex_to_dicts(array.real.tolist(), array.imag.tolist())
 
 
 def deserialize_ndarray(data: Any) -> NDArray:
     """
     Deserialize a JSON-serializable structure back into an ndarray.
+    Sidecar references are resolved from the active array sidecar.
     If the data contains dictionaries with "real" and "imag", it reconstructs complex numbers.
     Otherwise, it converts the data to a standard ndarray.
     """
+    if isinstance(data, np.ndarray):
+        return data
+    if isinstance(data, dict) and ARRAY_REF in data:
+        store = current_array_store()
+        if store is None:
+            raise ValueError(
+                "array stored in a sidecar file; load the result with "
+                "quansys.simulation.storage.load_result"
+            )
+        return store.get(data[ARRAY_REF])
+
+    array = np.array(data)
+    if array.dtype != object:
+        return array
 
-    def deserialize_element(element):
-        # If the element is a dictionary with 'real' and 'imag', reconstruct as a complex number
-        if isinstance(element, dict) and "real" in element and "imag" in element:
-            return complex(element["real"], element["imag"])
-        return element
+    # complex numbers, stored as {"real": ..., "imag": ...} elements
+    return _to_complex(array).astype(complex)
 
-    # Recursively deserialize elements, preserving structure
-    def recursive_deserialize(data):
-        if isinstance(data, list):
-            return [recursive_deserialize(item) for item in data]
-        return deserialize_element(data)
 
-    # Apply recursive deserialization
-    deserialized = recursive_deserialize(data)
+def _to_complex_element(element: Any) -> Any:
+    if isinstance(element, dict) and "real" in element and "imag" in element:
+        return complex(element["real"], element["imag"])
+    return element
 
-    # Convert to ndarray with appropriate dtype
-    return np.array(deserialized)
+
+_to_complex = np.frompyfunc(_to_complex_element, 1, 1)
 
 
 def dataclass_to_dict(obj: Any) -> Any:
@@ -58,7 +79,7 @@ def dataclass_to_dict(obj: Any) -> Any:
         for field in fields(obj):
             value = getattr(obj, field.name)
             if isinstance(value, np.ndarray):
-                result[field.name] = serialize_ndarray(value)
+                result[field.name] = serialize_ndarray(value, field.name)
             elif is_dataclass(value):
                 result[field.name] = dataclass_to_dict(value)
             elif isinstance(value, list):
@@ -93,19 +114,93 @@ def dict_to_dataclass(cls: Any, data: dict) -> Any:
     for field in fields(cls):
         value = data.get(field.name)
         if value is not None:
-            if isinstance(field.type, type) and issubclass(field.type, np.ndarray):
-                kwargs[field.name] = deserialize_ndarray(value)
-            elif is_dataclass(field.type):
-                kwargs[field.name] = dict_to_dataclass(field.type, value)
-            elif isinstance(value, list) and is_dataclass(field.type.__args__[0]):
-                kwargs[field.name] = [
-                    dict_to_dataclass(field.type.__args__[0], v) for v in value
-                ]
-            else:
-                kwargs[field.name] = value
+            kwargs[field.name] = _decode_field(field, value)
     return cls(**kwargs)
 
 
+def lazy_dataclass(cls: Any, data: dict) -> Any:
+    """
+    Like `dict_to_dataclass`, but each field is only decoded on first access.
+
+    The returned object is an instance of (a subclass of) `cls`. It pickles
+    (and copies) as a plain, fully decoded `cls`. A result whose arrays are in
+    a sidecar is decoded right away, while its sidecar is open (see
+    `quansys.simulation.storage.open_result`): the JSON holds only references
+    then, and nothing has to keep the sidecar open afterwards.
+    """
+    if not is_dataclass(cls):
+        raise ValueError("Provided class is not a dataclass")
+
+    store = current_array_store()
+    eager = store is not None and store.exists()
+
+    instance = object.__new__(_lazy_class(cls))
+    pending = {}
+    missing = []
+    for field in fields(cls):
+        value = data.get(field.name)
+        if value is not None and (eager or hasattr(cls, field.name)):
+            # (a class-level default would shadow a pending value)
+            instance.__dict__[field.name] = _decode_field(field, value)
+        elif value is not None:
+            pending[field.name] = (field, value)
+        elif field.default is not MISSING:
+            instance.__dict__[field.name] = field.default
+        elif field.default_factory is not MISSING:
+            instance.__dict__[field.name] = field.default_factory()
+        else:
+            missing.append(field.name)
+    if missing:
+        raise TypeError(f"{cls.__name__} is missing the fields {missing}")
+
+    instance.__dict__["_pending"] = pending
+    return instance
+
+
+class LazyFields:
+    """Mixin of the classes built by `lazy_dataclass`."""
+
+    _dataclass: type
+
+    def __getattr__(self, name: str) -> Any:
+        # only reached for the fields not decoded yet
+        pending = self.__dict__.get("_pending", {})
+        if name not in pending:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            )
+        field, value = pending.pop(name)
+        # inline JSON only, whatever array store is active now
+        with use_array_store(None):
+            decoded = _decode_field(field, value)
+        self.__dict__[name] = decoded
+        return decoded
+
+    def __reduce__(self):
+        return self._dataclass, tuple(getattr(self, f.name) for f in fields(self))
+
+
+@cache
+def _lazy_class(cls: type) -> type:
+    return type(f"Lazy{cls.__name__}", (LazyFields, cls), {"_dataclass": cls})
+
+
+def _decode_field(field: Field, value: Any) -> Any:
+    if _is_ndarray_type(field.type):
+        return deserialize_ndarray(value)
+    if is_dataclass(field.type):
+        return dict_to_dataclass(field.type, value)
+    if isinstance(value, list) and is_dataclass(field.type.__args__[0]):
+        return [dict_to_dataclass(field.type.__args__[0], v) for v in value]
+    return value
+
+
+def _is_ndarray_type(tp: Any) -> bool:
+    # NDArray is a generic alias of np.ndarray, not a class
+    origin = getattr(tp, "__origin__", tp)
+    return isinstance(origin, type) and issubclass(origin, np.ndarray)
+
+
 @dataclass
 class EprDiagResult:
     chi: NDArray
@@ -0,0 +1,250 @@
+"""
+Reading and writing simulation result files, with optional binary sidecars.
+
+By default a result is a single JSON file, with arrays written as nested
+lists. With ``arrays="npz"`` or ``arrays="npy"`` the arrays of the result
+(e.g. the `QuantumResults` chi matrix and participation dataset) are stored
+next to it instead, and the JSON only holds ``{"__ndarray__": <key>}``
+references:
+
+- ``npz``: one uncompressed ``<name>.npz`` archive, read member by member.
+- ``npy``: a ``<name>.arrays/`` folder with one ``<key>.npy`` per array,
+  memory-mapped (read-only) on load.
+
+The sidecar location is derived from the JSON path, so result files must be
+read, copied and removed with the helpers below.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Literal
+
+import numpy as np
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+ArrayStorage = Literal["json", "npz", "npy"]
+
+ARRAY_REF = "__ndarray__"
+
+_array_store: ContextVar[ArraySidecar | None] = ContextVar(
+    "quansys_array_store", default=None
+)
+
+
+class ArraySidecar:
+    """
+    The binary arrays of one result file.
+
+    While active (see `use_array_store`), array serialization `put`s arrays
+    here and array deserialization resolves references with `get`.
+    """
+
+    def __init__(self, path: Path, storage: Literal["npz", "npy"] = "npz"):
+        self.path = Path(path)
+        self.storage = storage
+        self._arrays: dict[str, np.ndarray] = {}
+        self._npz = None
+
+    @property
+    def npz_path(self) -> Path:
+        return self.path.with_suffix(".npz")
+
+    @property
+    def npy_dir(self) -> Path:
+        return self.path.with_suffix(".arrays")
+
+    def exists(self) -> bool:
+        """Whether the result has arrays on disk."""
+        return self.npy_dir.is_dir() or self.npz_path.exists()
+
+    def put(self, array: np.ndarray, name: str = "array") -> dict:
+        key, i = name, 1
+        while key in self._arrays:
+            key, i = f"{name}_{i}", i + 1
+        self._arrays[key] = np.asarray(array)
+        return {ARRAY_REF: key}
+
+    def get(self, key: str) -> np.ndarray:
+        if self.npy_dir.is_dir():
+            return np.load(self.npy_dir / f"{key}.npy", mmap_mode="r")
+        if self._npz is None:
+            if not self.npz_path.exists():
+                raise FileNotFoundError(f"Array sidecar of {self.path} not found")
+            self._npz = np.load(self.npz_path)
+        return self._npz[key]
+
+    def write(self) -> None:
+        """Replace the sidecar on disk with the arrays `put` so far."""
+        remove_sidecars(self.path)
+        if not self._arrays:
+            return
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if self.storage == "npz":
+            tmp = self.npz_path.with_name(self.npz_path.name + ".tmp")
+            with open(tmp, "wb") as f:
+                np.savez(f, **self._arrays)
+            os.replace(tmp, self.npz_path)
+            return
+
+        tmp = self.npy_dir.with_name(self.npy_dir.name + ".tmp")
+        shutil.rmtree(tmp, ignore_errors=True)
+        tmp.mkdir()
+        for key, array in self._arrays.items():
+            np.save(tmp / f"{key}.npy", array, allow_pickle=False)
+        os.replace(tmp, self.npy_dir)
+
+    def close(self) -> None:
+        if self._npz is not None:
+            self._npz.close()
+            self._npz = None
+
+
+def current_array_store() -> ArraySidecar | None:
+    return _array_store.get()
+
+
+@contextmanager
+def use_array_store(store: ArraySidecar | None) -> Iterator[ArraySidecar | None]:
+    token = _array_store.set(store)
+    try:
+        yield store
+    finally:
+        _array_store.reset(token)
+
+
+def save_result(path: Path, result: BaseModel, arrays: ArrayStorage = "json") -> Path:
+    """
+    Write `result` to the JSON file `path`, with its arrays in a sidecar
+    unless `arrays` is ``"json"``.
+
+    The JSON is written compact, with the C encoder of the standard library.
+    """
+    path = Path(path)
+    sidecar = None if arrays == "json" else ArraySidecar(path, arrays)
+    with use_array_store(sidecar):
+        data = result.model_dump()
+
+    # arrays first, so the JSON never references missing ones
+    if sidecar is None:
+        remove_sidecars(path)
+    else:
+        sidecar.write()
+    path.write_text(json.dumps(data, default=_json_default))
+    return path
+
+
+@contextmanager
+def open_result(path: Path) -> Iterator[ArraySidecar]:
+    """Resolve the array references of the result at `path` while active."""
+    sidecar = ArraySidecar(path)
+    try:
+        with use_array_store(sidecar):
+            yield sidecar
+    finally:
+        sidecar.close()
+
+
+def load_result(path: Path, adapter: TypeAdapter | None = None) -> Any:
+    """
+    Load the result at `path`, validated with `adapter`.
+
+    The file is parsed by pydantic straight from its bytes (no intermediate
+    ``json.loads`` tree). Without an adapter, the plain JSON data is returned.
+    """
+    path = Path(path)
+    with open_result(path):
+        return parse_result(path.read_bytes(), adapter)
+
+
+def parse_result(content: bytes, adapter: TypeAdapter | None = None) -> Any:
+    """
+    Validate the JSON `content` with `adapter`; content it does not validate
+    (e.g. build parameters) is returned as plain JSON data.
+
+    Array references are resolved from the active sidecar (see `open_result`).
+    """
+    if adapter is not None:
+        try:
+            return adapter.validate_json(content)
+        except ValidationError:
+            pass
+    return json.loads(content)
+
+
+def complex_to_dicts(real: Any, imag: Any) -> Any:
+    """
+    ``{"real", "imag"}`` dicts, element-wise, from the nested lists (or
+    scalars) of the real and imaginary parts of a complex value.
+    """
+    if isinstance(real, list):
+        return [complex_to_dicts(r, i) for r, i in zip(real, imag)]
+    return {"real": real, "imag": imag}
+
+
+def _json_default(obj: Any) -> Any:
+    if isinstance(obj, np.integer):
+        return int(obj)
+    if isinstance(obj, np.floating):
+        return float(obj)
+    if isinstance(obj, (complex, np.complexfloating)):
+        return complex_to_dicts(float(obj.real), float(obj.imag))
+    if isinstance(obj, np.ndarray):
+        if np.iscomplexobj(obj):
+            return complex_to_dicts(obj.real.tolist(), obj.imag.tolist())
+        return obj.tolist()
+    if isinstance(obj, (tuple, set)):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def sidecars(path: Path) -> list[Path]:
+    """The existing sidecar files of the result at `path`."""
+    path = Path(path)
+    candidates = (path.with_suffix(".npz"), path.with_suffix(".arrays"))
+    return [p for p in candidates if p.exists()]
+
+
+def copy_result(source: Path, target: Path) -> Path:
+    """Copy a result file and its sidecar; the JSON is written last."""
+    copy_sidecars(source, target)
+    shutil.copyfile(source, target)
+    return Path(target)
+
+
+def copy_sidecars(source: Path, target: Path) -> None:
+    """Replace the sidecar of the result `target` with a copy of that of `source`."""
+    target = Path(target)
+    remove_sidecars(target)
+    for sidecar in sidecars(source):
+        destination = target.with_suffix(sidecar.suffix)
+        if sidecar.is_dir():
+            shutil.copytree(sidecar, destination)
+        else:
+            shutil.copyfile(sidecar, destination)
+
+
+def remove_sidecars(path: Path) -> None:
+    for sidecar in sidecars(path):
+        if sidecar.is_dir():
+            shutil.rmtree(sidecar)
+        else:
+            sidecar.unlink()
+
+
+def result_size(path: Path) -> int:
+    """Bytes of a result file and its sidecar."""
+    size = Path(path).stat().st_size
+    for sidecar in sidecars(path):
+        if sidecar.is_dir():
+            size += sum(p.stat().st_size for p in sidecar.iterdir())
+        else:
+            size += sidecar.stat().st_size
+    return size
@@ -2,6 +2,14 @@ from .workflow import execute_workflow
 from .config import WorkflowConfig
 from .session_handler import PyaedtFileParameters
 from .prepare import PrepareFolderConfig
+from .pipeline import PipelineConfig
+from .cache import ResultCacheConfig
+from .multi_variation import MultiVariationConfig
+from .sweep import AdaptiveSweep
+from .screening import ScreeningConfig
+from .telemetry import TelemetryConfig
+from .aggregation import ParallelLoadingConfig
+from .consolidated import ConsolidatedStoreConfig
 from .builder import FunctionBuilder, DesignVariableBuilder, ModuleBuilder
 
 __all__ = [
@@ -9,6 +17,14 @@ __all__ = [
     "WorkflowConfig",
     "PyaedtFileParameters",
     "PrepareFolderConfig",
+    "PipelineConfig",
+    "ResultCacheConfig",
+    "MultiVariationConfig",
+    "AdaptiveSweep",
+    "ScreeningConfig",
+    "TelemetryConfig",
+    "ParallelLoadingConfig",
+    "ConsolidatedStoreConfig",
     "FunctionBuilder",
     "DesignVariableBuilder",
     "ModuleBuilder",
@@ -0,0 +1,25 @@
+from .config import ParallelLoadingConfig
+from .formats import AggregationFormat, CsvSink, ParquetSink
+from .incremental import AggregationState, IncrementalAggregation, uid_key
+from .load import load_aggregation
+from .parallel import merge_row, parallel_rows
+from .spec import AggregationSpec, ParamFilter, Pivot, Reduction
+from .tree import aggregate_tree
+
+__all__ = [
+    "AggregationFormat",
+    "AggregationSpec",
+    "AggregationState",
+    "CsvSink",
+    "IncrementalAggregation",
+    "ParallelLoadingConfig",
+    "ParamFilter",
+    "ParquetSink",
+    "Pivot",
+    "Reduction",
+    "aggregate_tree",
+    "load_aggregation",
+    "merge_row",
+    "parallel_rows",
+    "uid_key",
+]
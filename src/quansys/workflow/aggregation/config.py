@@ -0,0 +1,30 @@
+from pydantic import BaseModel, Field
+
+
+class ParallelLoadingConfig(BaseModel):
+    """
+    Configuration for loading results in parallel while aggregating.
+
+    Large updates (a resumed or long sweep aggregated at once) read the result
+    files on a thread pool, which overlaps the reads on slow or network file
+    systems. With `workers > 1` the results are also validated and flattened
+    on a process pool. Rows are still written in uid order, so the output is
+    identical to a sequential aggregation. Small updates (the per-iteration
+    ones) stay sequential.
+
+    Every worker process imports quansys (and pyaedt) on start, which takes a
+    few seconds, so the process pool only pays off for heavy results (e.g.
+    large EPR datasets) or many thousands of rows on a many-core host.
+
+    Attributes:
+        workers: Number of validation processes. `0` uses one per CPU, up to 8;
+            `1` validates in the main process. default: 1
+        io_threads: Number of threads reading result files. default: 16
+        min_rows: Smallest update loaded in parallel. default: 256
+        chunk_size: Uids per task. default: 64
+    """
+
+    workers: int = Field(1, ge=0)
+    io_threads: int = Field(16, ge=1)
+    min_rows: int = Field(256, ge=1)
+    chunk_size: int = Field(64, ge=1)
@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+import csv
+import os
+from collections.abc import Iterable
+from contextlib import ExitStack
+from pathlib import Path
+from typing import Literal
+
+AggregationFormat = Literal["csv", "parquet"]
+
+# rows per Parquet part file (and row group)
+ROWS_PER_PART = 4096
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError as exc:
+        raise ImportError(
+            "Parquet output requires pyarrow: pip install 'quansys[parquet]'"
+        ) from exc
+
+
+class CsvSink:
+    """
+    Appends rows to a CSV with the layout of `pandas.DataFrame.to_csv`: a
+    leading row-index column, the columns in first-seen order. When a row
+    brings new columns the file is rewritten once with the wider header,
+    streaming the existing rows.
+    """
+
+    suffix = ".csv"
+
+    def __init__(self, path: Path):
+        self.path = path
+
+    def exists(self) -> bool:
+        return self.path.exists()
+
+    def reset(self) -> None:
+        self.path.unlink(missing_ok=True)
+
+    def recover(self, state) -> None:
+        if self.path.stat().st_size > state.size:
+            # drop the rows of an interrupted update, they are appended again
+            with open(self.path, "r+") as f:
+                f.truncate(state.size)
+
+    def append(self, rows: Iterable[dict], state) -> None:
+        columns = state.columns
+        with ExitStack() as stack:
+            writer = csv.writer(stack.enter_context(open(self.path, "a", newline="")))
+            for row in rows:
+                added = [key for key in row if key not in columns]
+                if added:
+                    # closed before the file is replaced by the wider one
+                    stack.close()
+                    columns = [*columns, *added]
+                    self._widen(columns, state.rows)
+                    f = stack.enter_context(open(self.path, "a", newline=""))
+                    writer = csv.writer(f)
+                writer.writerow([state.rows, *(row.get(c) for c in columns)])
+                state.rows += 1
+        state.columns = columns
+
+    def compact(self, state) -> None:
+        pass
+
+    def commit(self, state) -> None:
+        state.size = self.path.stat().st_size
+
+    def cleanup(self, state) -> None:
+        pass
+
+    def _widen(self, columns: list[str], rows: int) -> None:
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp, "w", newline="") as dst:
+            writer = csv.writer(dst)
+            writer.writerow(["", *columns])
+            if rows:
+                with open(self.path, newline="") as src:
+                    reader = csv.reader(src)
+                    next(reader)
+                    for row in reader:
+                        writer.writerow(row + [""] * (len(columns) + 1 - len(row)))
+        os.replace(tmp, self.path)
+
+
+class ParquetSink:
+    """
+    Writes rows as a directory of Parquet part files with typed columns.
+
+    Every update adds parts of at most `ROWS_PER_PART` rows; the parts that
+    belong to the aggregation are listed in its state, so a part written by an
+    interrupted update is ignored and removed. Text columns (labels such as
+    parameter values) are dictionary-encoded, except the unique `uid`. At the
+    end of a run (`compact`) the small parts left by per-iteration updates are
+    merged into one.
+    """
+
+    suffix = ".parquet"
+
+    def __init__(self, path: Path):
+        _require_pyarrow()
+        self.path = path
+
+    def exists(self) -> bool:
+        return self.path.is_dir()
+
+    def reset(self) -> None:
+        for part in self.path.glob("part-*"):
+            part.unlink()
+
+    def recover(self, state) -> None:
+        self.cleanup(state)
+
+    def append(self, rows: Iterable[dict], state) -> None:
+        self.path.mkdir(parents=True, exist_ok=True)
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) == ROWS_PER_PART:
+                self._write_part(batch, state)
+                batch = []
+        if batch:
+            self._write_part(batch, state)
+
+    def compact(self, state) -> None:
+        import pyarrow.dataset as ds
+        import pyarrow.parquet as pq
+
+        paths = [self.path / part for part in state.parts]
+        small = [
+            p for p in paths if pq.ParquetFile(p).metadata.num_rows < ROWS_PER_PART
+        ]
+        if len(small) < 2:
+            return
+
+        schema = unified_schema(small)
+        dest = self.path / self._next_name(state)
+        with pq.ParquetWriter(dest, schema) as writer:
+            for batch in ds.dataset(small, schema=schema).to_batches():
+                writer.write_batch(batch)
+        # the merged parts are deleted once the new list is committed
+        state.parts = [p for p in state.parts if self.path / p not in small]
+        state.parts.append(dest.name)
+
+    def commit(self, state) -> None:
+        pass
+
+    def cleanup(self, state) -> None:
+        for part in self.path.glob("part-*"):
+            if part.name not in state.parts:
+                part.unlink()
+
+    def _write_part(self, rows: list[dict], state) -> None:
+        import pyarrow.parquet as pq
+
+        dest = self.path / self._next_name(state)
+        pq.write_table(to_table(rows), dest)
+        state.parts.append(dest.name)
+        state.rows += len(rows)
+
+    @staticmethod
+    def _next_name(state) -> str:
+        index = int(state.parts[-1][5:13]) + 1 if state.parts else 0
+        return f"part-{index:08d}.parquet"
+
+
+def to_table(rows: list[dict]):
+    """Rows to a typed Arrow table; text columns other than `uid` become dictionaries."""
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    columns = {}
+    for key in dict.fromkeys(k for row in rows for k in row):
+        values = [row.get(key) for row in rows]
+        try:
+            array = pa.array(values)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            # mixed types (e.g. numbers and text): keep them all as text
+            array = pa.array([None if v is None else str(v) for v in values])
+        if pa.types.is_string(array.type) and key != "uid":
+            array = pc.dictionary_encode(array)
+        columns[key] = array
+    return pa.table(columns)
+
+
+def unified_schema(paths: list[Path]):
+    """
+    One schema for parts written at different times (ints widen to floats, ...).
+    A column whose types cannot be merged, e.g. a sweep value that is text in
+    some parts and a number in others, is read as text.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schemas = [pq.read_schema(p) for p in paths]
+    try:
+        return pa.unify_schemas(schemas, promote_options="permissive")
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        pass
+
+    fields = {}
+    for schema in schemas:
+        for field in schema:
+            known = fields.setdefault(field.name, field)
+            if known is field:
+                continue
+            try:
+                merged = pa.unify_schemas(
+                    [pa.schema([known]), pa.schema([field])],
+                    promote_options="permissive",
+                )
+                fields[field.name] = merged.field(0)
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                fields[field.name] = pa.field(field.name, pa.string())
+    return pa.schema(list(fields.values()))
+
+
+SINKS = {"csv": CsvSink, "parquet": ParquetSink}
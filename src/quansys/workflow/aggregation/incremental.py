@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import json
+import os
+from collections.abc import Iterator
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+from pycaddy.ledger import Status
+from pycaddy.project import Project, StorageMode
+
+from .config import ParallelLoadingConfig
+from .formats import SINKS, AggregationFormat
+from .parallel import AdapterSpec, load_rows
+
+
+def uid_key(uid: str) -> tuple[int, str]:
+    """Allocation order of uids ("999" < "1000")."""
+    return len(uid), uid
+
+
+@dataclass
+class AggregationState:
+    """
+    What has been written to an aggregation CSV so far.
+
+    Attributes:
+        high_water: The highest uid aggregated.
+        below: Uids under `high_water` that were allocated but not finished
+            when it was set; they are aggregated once they finish.
+        columns: The CSV header (after the index column).
+        rows: Number of rows written.
+        size: Size of the CSV after the last complete update. Anything past
+            it (an interrupted update) is dropped before appending again.
+        parts: The Parquet part files of the aggregation, in order.
+    """
+
+    high_water: str | None = None
+    below: list[str] = field(default_factory=list)
+    columns: list[str] = field(default_factory=list)
+    rows: int = 0
+    size: int = 0
+    parts: list[str] = field(default_factory=list)
+
+    def is_new(self, uid: str) -> bool:
+        if self.high_water is None or uid in self.below:
+            return True
+        return uid_key(uid) > uid_key(self.high_water)
+
+    def advance(self, written: list[str], allocated: set[str]) -> None:
+        """Move the mark past `written`, remembering the unfinished uids skipped."""
+        old = self.high_water
+        self.high_water = max([*written, *([old] if old else [])], key=uid_key)
+        skipped = {
+            uid
+            for uid in allocated
+            if (old is None or uid_key(uid) > uid_key(old))
+            and uid_key(uid) < uid_key(self.high_water)
+        }
+        below = (set(self.below) | skipped) - set(written)
+        self.below = sorted(below, key=uid_key)
+
+
+class IncrementalAggregation:
+    """
+    Keeps ``aggregations/<name>.csv`` (or ``<name>.parquet/``) up to date with
+    the finished runs.
+
+    Every `update` appends one row per uid whose runs are finished under all
+    `identifiers` and that was not aggregated yet, and records the progress in
+    ``<name>_state.json``. Rows are merged and written one at a time (CSV) or
+    in bounded batches (Parquet), so memory does not grow with the number of
+    iterations; a later update after a resumed or extended sweep only adds
+    the new rows.
+
+    Rows hold the flattened results in first-seen order (identifiers in the
+    order given) and the `uid`. See `CsvSink` and `ParquetSink` for the file
+    layouts.
+
+    Updates of at least `loading.min_rows` rows are loaded in parallel (see
+    `ParallelLoadingConfig`). Worker processes import the adapter, so it may
+    be given as a 'module:attribute' reference.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        identifiers: list[str],
+        project: Project,
+        iteration_project: Project,
+        adapter: AdapterSpec = None,
+        format: AggregationFormat = "csv",
+        loading: ParallelLoadingConfig | None = None,
+    ):
+        self.name = name
+        self.identifiers = list(dict.fromkeys(identifiers))
+        self.project = project
+        self.iteration_project = iteration_project
+        self.adapter = adapter
+        self.format = format
+        self.loading = loading or ParallelLoadingConfig()
+        self._session = None
+
+    def update(self, final: bool = False) -> int:
+        """
+        Append the newly finished runs; return the number of rows added.
+        With `final` (the end of a run) the output is also compacted.
+        """
+        if self._session is None:
+            # keyed by its recipe, so every update and resume shares one record
+            self._session = self.project.session(
+                self.name,
+                params={"identifiers": self.identifiers},
+                storage_mode=StorageMode.PREFIX,
+            )
+        session = self._session
+        sink_cls = SINKS[self.format]
+        sink = sink_cls(session.path(suffix=sink_cls.suffix, include_uid=False))
+        state_path = session.path("state", suffix=".json", include_uid=False)
+        state = self._load_state(sink, state_path)
+
+        ready, allocated = self._ready_uids(state)
+        new = sorted((uid for uid in ready if state.is_new(uid)), key=uid_key)
+        if not new and sink.exists() and not final:
+            return 0
+
+        first = not session.is_done()
+        if first:
+            session.start()
+
+        sink.append(self._rows(ready, new), state)
+        state.advance(new, allocated)
+        if final:
+            sink.compact(state)
+        sink.commit(state)
+        _write_json(state_path, asdict(state))
+        sink.cleanup(state)
+
+        if first:
+            session.attach_files({"data": sink.path, "state": state_path})
+            session.done()
+        return len(new)
+
+    # ------------------------------------------------------------------
+    def _ready_uids(
+        self, state: AggregationState
+    ) -> tuple[dict[str, list[Path]], set[str]]:
+        """
+        uid -> data files of the uids new to `state` and finished under every
+        identifier; and every uid allocated above the high-water mark.
+        """
+        records = {
+            identifier: self._new_records(identifier, state)
+            for identifier in self.identifiers
+        }
+
+        allocated = set().union(*records.values())
+        finished = [
+            {uid for uid, r in records[i].items() if r.status == Status.DONE}
+            for i in self.identifiers
+        ]
+        ready = set.intersection(*finished) if finished else set()
+        return {
+            uid: [records[i][uid].files["data"] for i in self.identifiers]
+            for uid in ready
+        }, allocated
+
+    def _new_records(self, identifier: str, state: AggregationState) -> dict:
+        """The ledger records of `identifier` above the mark, or skipped below it."""
+        ledger = self.iteration_project.ledger
+        relpath = self.iteration_project.relpath
+
+        # an indexed ledger reads only those; the JSON one reads every run
+        records_after = getattr(ledger, "get_uid_record_dict_after", None)
+        if records_after is not None:
+            return records_after(
+                identifier, state.high_water, relpath=relpath, include=state.below
+            )
+        records = ledger.get_uid_record_dict(identifier, relpath=relpath)
+        return {uid: r for uid, r in records.items() if state.is_new(uid)}
+
+    def _rows(self, ready: dict, new: list[str]) -> Iterator[dict[str, Any]]:
+        items = ((uid, ready[uid]) for uid in new)
+        return load_rows(items, len(new), self.adapter, self.loading)
+
+    @staticmethod
+    def _load_state(sink, state_path: Path) -> AggregationState:
+        if not (sink.exists() and state_path.exists()):
+            # nothing (consistent) written yet: start over
+            sink.reset()
+            return AggregationState()
+
+        state = AggregationState(**json.loads(state_path.read_text()))
+        sink.recover(state)
+        return state
+
+
+def _write_json(path: Path, data: dict) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps(data))
+    os.replace(tmp, path)
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import json
+import operator
+from pathlib import Path
+
+import pandas as pd
+
+from .formats import _require_pyarrow, unified_schema
+
+Filters = list[tuple[str, str, object]]
+
+_OPERATORS = {
+    "==": operator.eq,
+    "=": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+
+
+def load_aggregation(
+    path: Path, columns: list[str] | None = None, filters: Filters | None = None
+) -> pd.DataFrame:
+    """
+    Load an aggregation written by the workflow into a DataFrame.
+
+    For Parquet output (``aggregations/<name>.parquet``) only the requested
+    columns are read, and row groups whose column statistics rule out every
+    row in `filters` are skipped without being read. Labels come back as
+    categoricals. CSV output is read whole, then selected.
+
+    Args:
+        path: The ``.csv`` file or ``.parquet`` folder.
+        columns: Columns to load (default: all).
+        filters: Row predicates, all of which must hold, as
+            ``(column, op, value)`` with `op` one of ``==``, ``!=``, ``<``,
+            ``<=``, ``>``, ``>=``, ``in``, ``not in``.
+
+    Example:
+        ```python
+        df = load_aggregation(
+            "results/aggregations/classical_agg.parquet",
+            columns=["chip_base_width", "Mode 1 Freq. (ghz)"],
+            filters=[("Mode 1 Quality Factor", ">", 1e5)],
+        )
+        ```
+    """
+    path = Path(path)
+    if path.is_dir():
+        return _load_parquet(path, columns, filters)
+
+    df = pd.read_csv(path, index_col=0)
+    for column, op, value in filters or []:
+        if op == "in":
+            mask = df[column].isin(value)
+        elif op == "not in":
+            mask = ~df[column].isin(value)
+        else:
+            mask = _OPERATORS[op](df[column], value)
+        df = df[mask]
+    return df if columns is None else df[columns]
+
+
+def _load_parquet(path: Path, columns, filters) -> pd.DataFrame:
+    _require_pyarrow()
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+
+    # only the committed parts; without a state file, every part
+    state_path = path.with_name(f"{path.stem}_state.json")
+    if state_path.exists():
+        parts = [path / p for p in json.loads(state_path.read_text())["parts"]]
+    else:
+        parts = sorted(path.glob("part-*.parquet"))
+    if not parts:
+        return pd.DataFrame(columns=columns)
+
+    dataset = ds.dataset(parts, schema=unified_schema(parts), format="parquet")
+    expression = pq.filters_to_expression(filters) if filters else None
+    return dataset.to_table(columns=columns, filter=expression).to_pandas()
@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+import importlib
+import os
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import ExitStack
+from itertools import islice
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Any
+
+from pycaddy.dict_utils import flatten_with_pretty_keys
+from pydantic import TypeAdapter
+
+from ...simulation.storage import open_result, parse_result
+from .config import ParallelLoadingConfig
+
+AdapterSpec = TypeAdapter | str | None
+
+# the simulation results adapter, importable by spawned workers
+RESULTS_ADAPTER = "quansys.simulation:SIMULATION_RESULTS_ADAPTER"
+
+# chunks in flight per stage: enough to keep every worker busy while the
+# oldest chunk is being written, few enough to bound memory
+_DEPTH_PER_WORKER = 2
+
+_worker_adapter: TypeAdapter | None = None
+
+
+def load_adapter(spec: AdapterSpec) -> TypeAdapter | None:
+    """Resolve a 'module:attribute' adapter reference (other values are returned as is)."""
+    if not isinstance(spec, str):
+        return spec
+    module, attribute = spec.split(":", 1)
+    imported_module = importlib.import_module(module)
+    try:
+        return getattr(imported_module, attribute)
+    except AttributeError:
+        raise AttributeError(f"Adapter '{attribute}' not found in module '{module}'.")
+
+
+def worker_count(config: ParallelLoadingConfig) -> int:
+    if config.workers:
+        return config.workers
+    return min(8, os.cpu_count() or 1)
+
+
+def flatten_payload(content: bytes, adapter: TypeAdapter | None) -> dict[str, Any]:
+    """Validate the content of one result file and flatten it into row columns."""
+    payload = parse_result(content, adapter)
+    if isinstance(payload, dict):
+        return flatten_with_pretty_keys(payload)
+    return payload.flatten()
+
+
+def merge_row(paths: list[Path], adapter: TypeAdapter | None = None) -> dict[str, Any]:
+    """Load, validate and flatten the data files of one uid into one row."""
+    merged: dict[str, Any] = {}
+    for path in paths:
+        try:
+            with open_result(path):
+                merged.update(flatten_payload(path.read_bytes(), adapter))
+        except Exception as exc:
+            raise RuntimeError(f"while processing {path}") from exc
+    return merged
+
+
+def load_rows(
+    items: Iterable[tuple[str, list[Path]]],
+    count: int,
+    adapter: AdapterSpec,
+    config: ParallelLoadingConfig,
+) -> Iterator[dict[str, Any]]:
+    """
+    Merged rows of `items` (uid, data files), in the order given: in parallel
+    for at least `config.min_rows` (of `count`) items, sequentially otherwise.
+    """
+    if count >= config.min_rows:
+        yield from parallel_rows(items, adapter, config)
+        return
+
+    adapter = load_adapter(adapter)
+    for uid, paths in items:
+        yield merge_row(paths, adapter) | {"uid": uid}
+
+
+def parallel_rows(
+    items: Iterable[tuple[str, list[Path]]],
+    adapter: AdapterSpec,
+    config: ParallelLoadingConfig,
+) -> Iterator[dict[str, Any]]:
+    """
+    Merged rows of `items` (uid, data files), in the order given.
+
+    File contents are read on a thread pool and handed, one chunk of uids at a
+    time, to the validation stage: a process pool when `config` asks for more
+    than one worker, the calling process otherwise. At most a few chunks per
+    worker are in flight at each stage.
+
+    Args:
+        items: The uids to load and the data files of each, one per identifier.
+        adapter: The result adapter. Worker processes are spawned, so with a
+            process pool it must be a 'module:attribute' reference (or None).
+        config: Pool sizes and chunking.
+    """
+    workers = worker_count(config)
+    if workers > 1 and not (adapter is None or isinstance(adapter, str)):
+        raise TypeError(
+            "parallel validation needs the adapter as a 'module:attribute' reference"
+        )
+
+    depth = workers * _DEPTH_PER_WORKER
+    chunks = _chunked(iter(items), config.chunk_size)
+
+    with ExitStack() as stack:
+        io_pool = stack.enter_context(ThreadPoolExecutor(max_workers=config.io_threads))
+        if workers > 1:
+            parse_pool = stack.enter_context(
+                ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=get_context("spawn"),
+                    initializer=_init_worker,
+                    initargs=(adapter,),
+                )
+            )
+        else:
+            parse_pool = _InlinePool(load_adapter(adapter))
+
+        reading: deque[tuple[list, list[list[Future]]]] = deque()
+        parsing: deque[tuple[list, Future]] = deque()
+
+        def parse_oldest_read() -> None:
+            chunk, reads = reading.popleft()
+            payloads = [
+                [(str(path), read.result()) for path, read in zip(paths, files)]
+                for (_, paths), files in zip(chunk, reads)
+            ]
+            parsing.append((chunk, parse_pool.submit(_merge_chunk, payloads)))
+
+        def pop_parsed() -> Iterator[dict[str, Any]]:
+            chunk, future = parsing.popleft()
+            for (uid, _), row in zip(chunk, future.result()):
+                yield row | {"uid": uid}
+
+        for chunk in chunks:
+            reads = [
+                [io_pool.submit(Path.read_bytes, path) for path in paths]
+                for _, paths in chunk
+            ]
+            reading.append((chunk, reads))
+            if len(reading) > depth:
+                parse_oldest_read()
+            if len(parsing) >= depth:
+                yield from pop_parsed()
+
+        while reading:
+            parse_oldest_read()
+            if len(parsing) >= depth:
+                yield from pop_parsed()
+        while parsing:
+            yield from pop_parsed()
+
+
+class _InlinePool:
+    """Runs `_merge_chunk` in the calling process, with a fixed adapter."""
+
+    def __init__(self, adapter: TypeAdapter | None):
+        self.adapter = adapter
+
+    def submit(self, fn, payloads) -> Future:
+        future: Future = Future()
+        try:
+            future.set_result(fn(payloads, self.adapter))
+        except Exception as exc:  # noqa: BLE001 - raised by future.result()
+            future.set_exception(exc)
+        return future
+
+
+def _chunked(iterator: Iterator, size: int) -> Iterator[list]:
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def _init_worker(adapter: str | None) -> None:
+    global _worker_adapter
+    _worker_adapter = load_adapter(adapter)
+
+
+def _merge_chunk(
+    payloads: list[list[tuple[str, bytes]]], adapter: TypeAdapter | None = None
+) -> list[dict[str, Any]]:
+    adapter = adapter or _worker_adapter
+    rows = []
+    for files in payloads:
+        merged: dict[str, Any] = {}
+        for path, content in files:
+            try:
+                with open_result(Path(path)):
+                    merged.update(flatten_payload(content, adapter))
+            except Exception as exc:
+                raise RuntimeError(f"while processing {path}") from exc
+        rows.append(merged)
+    return rows
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import operator
+from pathlib import Path
+from typing import Any, Literal
+
+from pydantic import BaseModel, Field, model_validator
+from pydantic_yaml import parse_yaml_file_as
+
+from ..builder.design_variables_handler import normalize_value
+from .config import ParallelLoadingConfig
+
+ReductionName = Literal["mean", "min", "max", "std", "median", "count"]
+
+_COMPARISONS = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+
+
+class ParamFilter(BaseModel):
+    """
+    A predicate on one sweep parameter.
+
+    Values are compared after normalization to SI, so `value: 12nh` matches a
+    point built with `"12 nH"` or `1.2e-8`. A point without the parameter, or
+    whose value cannot be ordered against `value`, does not match.
+
+    Attributes:
+        param: Name of the sweep parameter.
+        op: Comparison: `==`, `!=`, `<`, `<=`, `>`, `>=`, `in` or `not in`. default: '=='
+        value: Value compared against; a list for `in` and `not in`.
+    """
+
+    param: str
+    op: Literal["==", "!=", "<", "<=", ">", ">=", "in", "not in"] = "=="
+    value: Any
+
+    @model_validator(mode="after")
+    def _check_value(self) -> ParamFilter:
+        if self.op in ("in", "not in") and not isinstance(self.value, list):
+            raise ValueError(f"'{self.op}' needs a list value")
+        return self
+
+    def __call__(self, params: dict) -> bool:
+        if self.param not in params:
+            return False
+        actual = normalize_value(params[self.param])
+        if self.op in ("in", "not in"):
+            found = actual in [normalize_value(v) for v in self.value]
+            return found if self.op == "in" else not found
+        try:
+            return bool(_COMPARISONS[self.op](actual, normalize_value(self.value)))
+        except TypeError:
+            return False
+
+
+class Reduction(BaseModel):
+    """
+    Grouped reduction of the aggregated rows.
+
+    Rows are grouped either by the `group_by` columns, or by every sweep
+    parameter except the `over` axes, and each result column is reduced with
+    every function in `functions`. Reduced columns are named
+    `<column> [<function>]`.
+
+    Attributes:
+        group_by: Columns identifying a group.
+        over: Sweep parameters reduced over, instead of `group_by`.
+        functions: Reductions applied to every column. default: ['mean']
+        columns: Columns reduced. default: every numeric result column.
+    """
+
+    group_by: list[str] | None = None
+    over: list[str] | None = None
+    functions: list[ReductionName] = Field(
+        default_factory=lambda: ["mean"], min_length=1
+    )
+    columns: list[str] | None = None
+
+    @model_validator(mode="after")
+    def _check_grouping(self) -> Reduction:
+        if (self.group_by is None) == (self.over is None):
+            raise ValueError("set either group_by or over")
+        return self
+
+
+class Pivot(BaseModel):
+    """
+    Spread the values of one column (typically a sweep parameter) into columns.
+
+    Output columns are named `<value> | <columns>=<key>`, one per key of
+    `columns` and value column.
+
+    Attributes:
+        index: Columns identifying an output row.
+        columns: Column whose values become columns.
+        values: Columns spread. default: every other column.
+    """
+
+    index: list[str]
+    columns: str
+    values: list[str] | None = None
+
+
+class AggregationSpec(BaseModel):
+    """
+    Recipe of a standalone aggregation (`quansys aggregate`).
+
+    Rows hold the sweep parameters of every iteration finished under all
+    `identifiers`, followed by the flattened results and the `uid`. The
+    parameters are read first, from the small ``build`` parameter files,
+    and `where` is applied to them, so the results of excluded iterations
+    are never parsed. The selected rows are then narrowed to `columns`,
+    reduced and pivoted, in that order.
+
+    Attributes:
+        identifiers: Simulation identifiers whose results are merged per iteration.
+        where: Parameter predicates, all of which must hold.
+        columns: Result columns kept (parameters, `uid` and the columns used by
+            `reduce` and `pivot` are always kept). default: all
+        reduce: Optional grouped reduction.
+        pivot: Optional pivot, applied after `reduce`.
+        output: Output file (`.csv` or `.parquet`). default: print the table
+        loading: Parallel loading of the result files.
+    """
+
+    identifiers: list[str] = Field(min_length=1)
+    where: list[ParamFilter] = []
+    columns: list[str] | None = None
+    reduce: Reduction | None = None
+    pivot: Pivot | None = None
+    output: Path | None = None
+    loading: ParallelLoadingConfig = ParallelLoadingConfig()
+
+    def selects(self, params: dict) -> bool:
+        return all(predicate(params) for predicate in self.where)
+
+    @classmethod
+    def load_from_yaml(cls, path: str | Path) -> AggregationSpec:
+        """
+        Load an aggregation spec from a YAML file.
+
+        Args:
+            path: Source file path.
+
+        Returns:
+            AggregationSpec: Parsed spec.
+        """
+        return parse_yaml_file_as(cls, path)
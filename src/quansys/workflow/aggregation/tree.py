@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from pathlib import Path
+
+import pandas as pd
+from pycaddy.dict_utils import flatten_with_pretty_keys
+from pycaddy.ledger import Status
+
+from ..ledger import open_ledger
+from .formats import _require_pyarrow
+from .incremental import uid_key
+from .parallel import RESULTS_ADAPTER, load_rows
+from .spec import AggregationSpec, Pivot, Reduction
+
+ITERATIONS = Path("iterations")
+BUILD = "build"
+
+
+@dataclass
+class Iteration:
+    """A finished iteration: its sweep parameters and result files."""
+
+    uid: str
+    params: dict
+    paths: list[Path]
+
+
+def select_iterations(root: Path, spec: AggregationSpec) -> tuple[list[Iteration], int]:
+    """
+    The iterations finished under every identifier of `spec` whose parameters
+    satisfy `spec.where`, in uid order, and the number of finished iterations.
+
+    Only the ledger and the ``build`` parameter files are read.
+    """
+    ledger = open_ledger(root)
+    if ledger is None:
+        raise FileNotFoundError(f"No results ledger found in {root}")
+
+    identifiers = list(dict.fromkeys([BUILD, *spec.identifiers]))
+    records = {
+        identifier: ledger.get_uid_record_dict(identifier, relpath=ITERATIONS)
+        for identifier in identifiers
+    }
+    finished = set.intersection(
+        *(
+            {uid for uid, record in records[i].items() if record.status == Status.DONE}
+            for i in identifiers
+        )
+    )
+
+    selected = []
+    for uid in sorted(finished, key=uid_key):
+        params = json.loads(Path(records[BUILD][uid].files["data"]).read_text())
+        if not spec.selects(params):
+            continue
+        paths = [
+            Path(records[i][uid].files["data"]) for i in spec.identifiers if i != BUILD
+        ]
+        selected.append(Iteration(uid, params, paths))
+    return selected, len(finished)
+
+
+def load_frame(iterations: list[Iteration], spec: AggregationSpec) -> pd.DataFrame:
+    """Parameters, flattened results and uid of `iterations`, one row each."""
+    items = ((iteration.uid, iteration.paths) for iteration in iterations)
+    rows = load_rows(items, len(iterations), RESULTS_ADAPTER, spec.loading)
+    frame = pd.DataFrame(
+        [
+            flatten_with_pretty_keys(iteration.params) | row
+            for iteration, row in zip(iterations, rows)
+        ]
+    )
+    frame.attrs["parameters"] = list(
+        dict.fromkeys(
+            key
+            for iteration in iterations
+            for key in flatten_with_pretty_keys(iteration.params)
+        )
+    )
+    return frame
+
+
+def shape_frame(frame: pd.DataFrame, spec: AggregationSpec) -> pd.DataFrame:
+    """Apply the column selection, reduction and pivot of `spec`, in that order."""
+    if frame.empty:
+        return frame
+
+    parameters = frame.attrs.get("parameters", [])
+    if spec.columns is not None:
+        used = [*parameters, "uid", *spec.columns]
+        if spec.reduce is not None:
+            used += [*(spec.reduce.group_by or []), *(spec.reduce.columns or [])]
+        if spec.pivot is not None:
+            used += [*spec.pivot.index, spec.pivot.columns, *(spec.pivot.values or [])]
+        frame = frame[_existing(frame, dict.fromkeys(used))]
+    if spec.reduce is not None:
+        frame = reduce_frame(frame, spec.reduce, parameters)
+    if spec.pivot is not None:
+        frame = pivot_frame(frame, spec.pivot)
+    return frame
+
+
+def reduce_frame(
+    frame: pd.DataFrame, reduction: Reduction, parameters: list[str]
+) -> pd.DataFrame:
+    """Group `frame` and reduce its result columns; see `Reduction`."""
+    if reduction.group_by is not None:
+        group = _existing(frame, reduction.group_by)
+    else:
+        _existing(frame, reduction.over)
+        group = [p for p in parameters if p not in reduction.over]
+
+    if reduction.columns is not None:
+        columns = _existing(frame, reduction.columns)
+    else:
+        excluded = {*group, *parameters, "uid"}
+        numeric = frame.select_dtypes("number").columns
+        columns = [c for c in numeric if c not in excluded]
+
+    keyed = frame.assign(_all=0) if not group else frame
+    reduced = keyed.groupby(group or ["_all"], sort=False, dropna=False)[columns].agg(
+        reduction.functions
+    )
+    reduced.columns = [f"{column} [{function}]" for column, function in reduced.columns]
+    return reduced.reset_index(drop=not group)
+
+
+def pivot_frame(frame: pd.DataFrame, pivot: Pivot) -> pd.DataFrame:
+    """Spread `pivot.columns` into columns; see `Pivot`."""
+    _existing(frame, [*pivot.index, pivot.columns])
+    values = pivot.values or [
+        c for c in frame.columns if c not in {*pivot.index, pivot.columns, "uid"}
+    ]
+    try:
+        wide = frame.pivot(
+            index=pivot.index, columns=pivot.columns, values=_existing(frame, values)
+        )
+    except ValueError as exc:
+        raise ValueError(
+            f"Several rows share the same {pivot.index} and '{pivot.columns}'; "
+            "reduce them first (`reduce`) or add the distinguishing parameters "
+            "to the pivot index."
+        ) from exc
+    wide.columns = [f"{value} | {pivot.columns}={key}" for value, key in wide.columns]
+    return wide.reset_index()
+
+
+def aggregate_tree(root: Path, spec: AggregationSpec) -> pd.DataFrame:
+    """
+    Aggregate the existing results tree under `root` according to `spec`.
+
+    Args:
+        root: Results root folder of a workflow.
+        spec: What to select, load, reduce and pivot.
+
+    Returns:
+        pd.DataFrame: The aggregated table.
+    """
+    iterations, _ = select_iterations(Path(root), spec)
+    return shape_frame(load_frame(iterations, spec), spec)
+
+
+def write_frame(frame: pd.DataFrame, path: Path) -> Path:
+    """Write `frame` as CSV, or as Parquet for a `.parquet` path."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if path.suffix == ".parquet":
+        _require_pyarrow()
+        frame.to_parquet(path, index=False)
+    else:
+        frame.to_csv(path, index=False)
+    return path
+
+
+def _existing(frame: pd.DataFrame, columns) -> list[str]:
+    columns = list(columns)
+    missing = [c for c in columns if c not in frame.columns]
+    if missing:
+        raise ValueError(f"Unknown columns {missing}; available: {list(frame.columns)}")
+    return columns
@@ -1,7 +1,17 @@
-from .handler import set_variables, get_variable, set_variable
+from .handler import (
+    set_variables,
+    get_variable,
+    set_variable,
+    format_variables,
+    InputAdapter,
+)
+from .conversion import normalize_value
 
 __all__ = [
     "set_variables",
     "get_variable",
     "set_variable",
+    "format_variables",
+    "InputAdapter",
+    "normalize_value",
 ]
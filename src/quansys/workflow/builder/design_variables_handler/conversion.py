@@ -1,7 +1,5 @@
-from pint import UnitRegistry
-
-# Create a unit registry
-ureg = UnitRegistry()
+from ....shared.conversion import get_case_sensitive_registry, get_registry, to_si
+from ....shared.hfss_values import parse_hfss_value, pint_si_scale
 
 
 def convert_from_si(value, to_unit):
@@ -19,7 +17,7 @@ def convert_from_si(value, to_unit):
         return value
 
     # Create a quantity in SI base units (assume it's already in SI)
-    quantity = value * ureg.dimensionless
+    quantity = value * get_registry().dimensionless
 
     # Convert to the desired unit
     converted_quantity = quantity.to(to_unit)
@@ -37,6 +35,9 @@ def convert_to_si(value: float | int, unit: str = None) -> float:
 
     Returns:
         float: The value converted to SI units, or the original value if unitless.
+
+    Units are resolved case-sensitively, as pint spells them ("Mm" is a megameter,
+    "mm" a millimeter).
     """
 
     if (
@@ -44,9 +45,53 @@ def convert_to_si(value: float | int, unit: str = None) -> float:
     ):  # If unit is None or an empty string, return the value as is
         return value
 
+    scale = pint_si_scale(unit)
+    if scale is not None:
+        # common prefixed units, without pint
+        return value * scale
+
     try:
-        quantity = value * ureg.Unit(unit)  # Create a Pint Quantity
-        si_quantity = quantity.to_base_units()  # Convert to SI base units
-        return si_quantity.magnitude  # Return the numeric value
+        quantity = value * get_case_sensitive_registry().Unit(unit)
+        return quantity.to_base_units().magnitude
     except Exception as e:
         raise ValueError(f"Error in conversion: {e}")
+
+
+SIGNIFICANT_DIGITS = 12
+
+
+def normalize_value(value):
+    """
+    Normalize a design-variable value to its SI magnitude.
+
+    Numbers, numeric strings with an optional HFSS unit ("10nh", "10 nH",
+    "1e-8") and `Value`-like dicts ({"value": 10, "unit": "nH"}) are converted
+    to a float in SI base units (see `quansys.shared.conversion.to_si`),
+    rounded to `SIGNIFICANT_DIGITS` significant digits so that equivalent
+    spellings compare equal. Anything else (expressions, booleans, unknown
+    units) is returned unchanged.
+    """
+    if isinstance(value, bool) or value is None:
+        return value
+
+    if isinstance(value, (int, float)):
+        return _round_significant(float(value))
+
+    if isinstance(value, dict) and set(value) <= {"value", "unit"} and "value" in value:
+        return normalize_value(f"{value['value']}{value.get('unit', '')}")
+
+    if isinstance(value, str):
+        parsed = parse_hfss_value(value)
+        if parsed is None:
+            return value
+        try:
+            si = to_si(*parsed)
+        except ValueError:
+            return value
+        return _round_significant(float(si))
+
+    return value
+
+
+def _round_significant(value: float) -> float:
+    return float(f"{value:.{SIGNIFICANT_DIGITS}g}")
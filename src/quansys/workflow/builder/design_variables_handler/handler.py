@@ -10,9 +10,24 @@ def set_variables(hfss: Hfss, variables: SupportedInputType):
     if variables is None or variables == {}:
         return
 
-    instance = InputAdapter.validate_python(variables)
-    for k, v in instance.items():
-        set_variable(hfss, k, v.to_str())
+    for k, v in format_variables(variables).items():
+        set_variable(hfss, k, v)
+
+
+def format_variables(variables: SupportedInputType) -> dict[str, str]:
+    """
+    The HFSS string of every variable, as validating with `InputAdapter` and
+    calling `to_str()` gives. Plain numbers and strings skip the validation.
+    """
+    formatted = {}
+    for name, value in variables.items():
+        if value is None or type(value) in (str, float, bool):
+            formatted[name] = f"{value}"
+        elif type(value) is int:
+            formatted[name] = f"{float(value)}"
+        else:
+            formatted[name] = InputAdapter.validate_python({name: value})[name].to_str()
+    return formatted
 
 
 def set_variable(hfss: Hfss, name: str, value: str):
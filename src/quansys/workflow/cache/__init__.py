@@ -0,0 +1,4 @@
+from .config import ResultCacheConfig
+from .store import CacheStats, ResultCache, file_digest
+
+__all__ = ["CacheStats", "ResultCache", "ResultCacheConfig", "file_digest"]
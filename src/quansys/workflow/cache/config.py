@@ -0,0 +1,33 @@
+from pathlib import Path
+from typing import Annotated
+
+from pydantic import BaseModel, BeforeValidator, Field
+
+
+def ensure_path(value: Path | str) -> Path:
+    return Path(value).expanduser() if isinstance(value, str) else value.expanduser()
+
+
+DEFAULT_CACHE_PATH = Path.home() / ".cache" / "quansys" / "results"
+
+
+class ResultCacheConfig(BaseModel):
+    """
+    Configuration for the global, content-addressed simulation result cache.
+
+    A result is stored under a hash of the template `.aedt` contents, the sweep
+    parameters and the analysis configuration. Any later workflow that asks for
+    the same combination copies the cached JSON instead of solving again.
+
+    Attributes:
+        path: Cache directory, shared between workflows. default: '~/.cache/quansys/results'
+        max_size_mb: Size bound of the cache. Least recently used entries are evicted
+            once it is exceeded. default: 2048
+    """
+
+    path: Annotated[Path, BeforeValidator(ensure_path)] = DEFAULT_CACHE_PATH
+    max_size_mb: float = Field(2048, gt=0)
+
+    @property
+    def max_bytes(self) -> int:
+        return int(self.max_size_mb * 1024**2)
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+
+from pydantic import BaseModel
+
+from ...simulation.storage import copy_sidecars, remove_sidecars, result_size
+from ..sweep import params_key
+
+
+@dataclass
+class CacheStats:
+    entries: int
+    total_bytes: int
+    max_bytes: int
+    oldest_access: datetime | None = None
+    newest_access: datetime | None = None
+
+
+def file_digest(path: Path) -> str:
+    """SHA-256 of a file's contents, memoized per (path, size, mtime)."""
+    stat = path.stat()
+    return _file_digest(path.resolve(), stat.st_size, stat.st_mtime_ns)
+
+
+@lru_cache(maxsize=32)
+def _file_digest(path: Path, size: int, mtime_ns: int) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024**2), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """
+    Content-addressed store of simulation result JSON files.
+
+    Entries live at ``<root>/<key[:2]>/<key>.json``, with the array sidecar
+    of the result, if any, next to it. Each hit refreshes the
+    entry's modification time, which is then used for least-recently-used
+    eviction once the total size exceeds ``max_bytes``.
+    """
+
+    def __init__(self, root: Path, max_bytes: int):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self._total_bytes: int | None = None
+
+    @staticmethod
+    def key(template_digest: str, params: dict, simulation: BaseModel) -> str:
+        payload = {
+            "template": template_digest,
+            "params": params_key(params) if params else "",
+            "analysis": simulation.model_dump(mode="json"),
+        }
+        encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+    def path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Path | None:
+        """Return the cached file for `key`, marking it as recently used."""
+        path = self.path(key)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return path
+
+    def put(self, key: str, source: Path) -> Path:
+        """Copy `source` into the cache under `key` and evict if over budget."""
+        path = self.path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        replaced = result_size(path) if path.exists() else 0
+
+        # sidecar first, then copy-then-rename of the JSON, so concurrent
+        # readers never see a partial file
+        copy_sidecars(source, path)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        shutil.copyfile(source, tmp)
+        os.replace(tmp, path)
+
+        if self._total_bytes is None:
+            self._total_bytes = sum(result_size(p) for p in self._entries())
+        else:
+            self._total_bytes += result_size(path) - replaced
+
+        if self._total_bytes > self.max_bytes:
+            self.gc()
+        return path
+
+    def stats(self) -> CacheStats:
+        sizes_and_times = [(result_size(p), p.stat().st_mtime) for p in self._entries()]
+        if not sizes_and_times:
+            return CacheStats(entries=0, total_bytes=0, max_bytes=self.max_bytes)
+
+        times = [t for _, t in sizes_and_times]
+        return CacheStats(
+            entries=len(sizes_and_times),
+            total_bytes=sum(s for s, _ in sizes_and_times),
+            max_bytes=self.max_bytes,
+            oldest_access=datetime.fromtimestamp(min(times)),
+            newest_access=datetime.fromtimestamp(max(times)),
+        )
+
+    def gc(self, max_bytes: int | None = None) -> tuple[int, int]:
+        """
+        Evict least recently used entries until the cache fits `max_bytes`.
+
+        Returns:
+            (number of removed entries, number of removed bytes)
+        """
+        max_bytes = self.max_bytes if max_bytes is None else max_bytes
+
+        entries = []
+        for p in self._entries():
+            entries.append((p.stat().st_mtime, result_size(p), p))
+        entries.sort()
+
+        total = sum(size for _, size, _ in entries)
+        removed, removed_bytes = 0, 0
+        for _, size, p in entries:
+            if total <= max_bytes:
+                break
+            remove_sidecars(p)
+            p.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+            removed_bytes += size
+
+        self._total_bytes = total
+        return removed, removed_bytes
+
+    def _entries(self) -> Iterator[Path]:
+        if not self.root.exists():
+            return iter(())
+        return self.root.glob("??/*.json")
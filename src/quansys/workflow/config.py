@@ -2,17 +2,27 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from pydantic import BaseModel, BeforeValidator
+from pydantic import BaseModel, BeforeValidator, field_validator, model_validator
 from pydantic_yaml import to_yaml_file, parse_yaml_file_as
 from typing_extensions import Annotated, TypeAlias
 
-from pycaddy.sweeper import EmptySweep, DictSweep
+from pycaddy.sweeper import EmptySweep
 
 from ..simulation import SUPPORTED_ANALYSIS
+from ..simulation.storage import ArrayStorage
 
 from .builder import SUPPORTED_BUILDERS
 from .session_handler import PyaedtFileParameters
 from .prepare import PrepareFolderConfig
+from .pipeline import PipelineConfig
+from .cache import ResultCacheConfig
+from .multi_variation import MultiVariationConfig
+from .screening import ScreeningConfig
+from .telemetry import TelemetryConfig
+from .ledger import LedgerBackend
+from .aggregation import AggregationFormat, ParallelLoadingConfig
+from .consolidated import ConsolidatedStoreConfig
+from .sweep import SUPPORTED_SWEEPS, AdaptiveSweep, SweepOrder
 
 
 def ensure_path(s: str | Path) -> Path:
@@ -71,6 +81,28 @@ class WorkflowConfig(BaseModel):
             --> {'a': 1, 'b': 2, 'c': 4}
             `
 
+            At most one entry may instead be an
+            [`AdaptiveSweep`][quansys.workflow.sweep.adaptive.AdaptiveSweep] (`type: adaptive`),
+            which refines one parameter from the results seen so far, for every
+            combination produced by the other entries.
+
+        deduplicate_sweep: If True, sweep points that are physically identical once their
+            values are normalized to SI (e.g. `"10nh"`, `"10 nH"` and `1e-8`) are solved
+            only once. Every duplicate still gets its own uid, with its own build parameters
+            and a copy of the representative's results. default: True
+
+        sweep_order: Order in which sweep points are run.
+
+            - `sweep`: the order produced by `builder_sweep`.
+            - `similarity`: a short path through parameter space (greedy nearest-neighbour
+              tour over SI-normalized values), so consecutive iterations are close to each
+              other. This helps mesh reuse, warm starts and caching. The tour is computed
+              over the full sweep, so a resumed run continues along the same path.
+            - `auto`: `similarity` when an analysis reuses meshes
+              (e.g. `EigenmodeAnalysis(reuse_mesh=True)`), otherwise `sweep`.
+
+            default: 'auto'
+
         aggregation_dict: Optional aggregation rules for result post-processing.
 
             Each key maps to a list of strings which should be all simulation identifiers.
@@ -78,6 +110,76 @@ class WorkflowConfig(BaseModel):
             its list of identifiers (e.g., flattening, validation, merging by UID).
 
             See `pycaddy.aggregator.Aggregator` for behavior.
+
+        aggregation_format: File format of the aggregations.
+
+            - `csv`: `aggregations/<name>.csv`.
+            - `parquet`: `aggregations/<name>.parquet/`, a folder of Parquet parts with typed
+              columns (full float precision) and dictionary-encoded labels. Requires
+              `pyarrow` (`pip install 'quansys[parquet]'`). Load it with
+              [`load_aggregation`][quansys.workflow.aggregation.load.load_aggregation],
+              which reads only the requested columns and row groups.
+
+            default: 'csv'
+
+        aggregation_loading: Parallel loading of large aggregation updates (result
+            files read on a thread pool, validated and flattened on a process pool).
+            See [`ParallelLoadingConfig`][quansys.workflow.aggregation.config.ParallelLoadingConfig].
+
+        result_arrays: Where the arrays of result files (e.g. the `QuantumResults` chi
+            matrix and participation dataset) are stored.
+
+            - `json`: as nested lists inside the result JSON.
+            - `npz`: in a binary `<result>.npz` archive next to the JSON, which only
+              holds references.
+            - `npy`: in a `<result>.arrays/` folder of `.npy` files next to the JSON,
+              memory-mapped on load.
+
+            Binary sidecars are lossless, smaller and much faster to write and parse.
+            Read results with [`load_result`][quansys.simulation.storage.load_result].
+
+            default: 'json'
+
+        consolidated_store: Optional HDF5 file (`results.h5` in the root folder) to
+            which every finished result is also appended, one chunked, compressed
+            dataset per result value with a row per iteration, indexed by the hash of
+            its sweep parameters. Requires `h5py` (`pip install 'quansys[hdf5]'`).
+            Read it with [`Hdf5ResultStore`][quansys.workflow.consolidated.hdf5.Hdf5ResultStore].
+            See [`ConsolidatedStoreConfig`][quansys.workflow.consolidated.config.ConsolidatedStoreConfig].
+
+        pipeline: Controls overlapping of HFSS solves with CPU post-processing
+            (EPR diagonalization and result writing) on a background process pool.
+            See [`PipelineConfig`][quansys.workflow.pipeline.config.PipelineConfig].
+
+        result_cache: Optional global, content-addressed result cache shared between
+            workflows. When every pending analysis of an iteration is found in the cache,
+            the cached JSON files are copied instead of solving.
+            See [`ResultCacheConfig`][quansys.workflow.cache.config.ResultCacheConfig].
+
+        multi_variation: Solve the whole sweep as a single HFSS parametric analysis
+            on one project copy, instead of one project copy and solve per iteration.
+            See [`MultiVariationConfig`][quansys.workflow.multi_variation.config.MultiVariationConfig].
+
+        screening: Optional multi-fidelity mode. Every point is first solved with cheap
+            setup overrides under `<identifier>_screening`, then only the selected points
+            are solved at full fidelity under their original identifiers.
+            See [`ScreeningConfig`][quansys.workflow.screening.config.ScreeningConfig].
+
+        telemetry: Optional per-phase event stream (`telemetry.jsonl` in the root
+            folder) with wall time, CPU time, peak AEDT memory and outcome of every
+            phase.
+            See [`TelemetryConfig`][quansys.workflow.telemetry.config.TelemetryConfig].
+
+        ledger: Backend of the run ledger in the root folder.
+
+            - `json`: pycaddy's `metadata.json`, read and rewritten whole on every lookup
+              and status change.
+            - `sqlite`: an indexed SQLite database (`metadata.sqlite`, WAL mode) with
+              constant-time resume checks, for large sweeps. See
+              [`SqliteLedger`][quansys.workflow.ledger.sqlite.SqliteLedger]. An existing
+              JSON ledger must first be imported with `quansys ledger import`.
+
+            default: 'json'
     """
 
     root_folder: PathType = "results"
@@ -86,9 +188,42 @@ class WorkflowConfig(BaseModel):
     simulations: dict[str, SUPPORTED_ANALYSIS]
 
     builder: SUPPORTED_BUILDERS | None = None
-    builder_sweep: list[DictSweep] = EmptySweep()
+    builder_sweep: list[SUPPORTED_SWEEPS] = EmptySweep()
+    deduplicate_sweep: bool = True
+    sweep_order: SweepOrder = "auto"
     aggregation_dict: dict[str, list[str]] = {}
+    aggregation_format: AggregationFormat = "csv"
+    aggregation_loading: ParallelLoadingConfig = ParallelLoadingConfig()
+    result_arrays: ArrayStorage = "json"
+    consolidated_store: ConsolidatedStoreConfig | None = None
     prepare_folder: PrepareFolderConfig = PrepareFolderConfig()
+    pipeline: PipelineConfig = PipelineConfig()
+    result_cache: ResultCacheConfig | None = None
+    multi_variation: MultiVariationConfig = MultiVariationConfig()
+    screening: ScreeningConfig | None = None
+    telemetry: TelemetryConfig = TelemetryConfig()
+    ledger: LedgerBackend = "json"
+
+    @field_validator("builder_sweep")
+    @classmethod
+    def _single_adaptive_sweep(cls, sweeps: list) -> list:
+        if sum(isinstance(s, AdaptiveSweep) for s in sweeps) > 1:
+            raise ValueError("builder_sweep may contain at most one AdaptiveSweep")
+        return sweeps
+
+    @model_validator(mode="after")
+    def _reuse_mesh_needs_copies(self) -> WorkflowConfig:
+        # the mesh is seeded from the previous point's own project copy
+        reuse_mesh = any(
+            getattr(simulation, "reuse_mesh", False)
+            for simulation in self.simulations.values()
+        )
+        if reuse_mesh and not self.prepare_folder.copy_enabled:
+            raise ValueError(
+                "reuse_mesh requires prepare_folder.copy_enabled: without a copy "
+                "per point the template itself would seed the mesh"
+            )
+        return self
 
     def save_to_yaml(self, path: str | Path) -> None:
         """
@@ -0,0 +1,4 @@
+from .config import ConsolidatedStoreConfig
+from .hdf5 import ConsolidatedStore, Hdf5ResultStore
+
+__all__ = ["ConsolidatedStore", "ConsolidatedStoreConfig", "Hdf5ResultStore"]
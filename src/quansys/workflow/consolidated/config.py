@@ -0,0 +1,34 @@
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+
+class ConsolidatedStoreConfig(BaseModel):
+    """
+    Configuration for the consolidated HDF5 result store of a workflow.
+
+    Next to the per-iteration JSON files, every finished result is appended
+    to one HDF5 file in the root folder, indexed by the hash of its sweep
+    parameters. Each numeric or string value of a result is a chunked,
+    compressed dataset with one row per iteration, so an array (e.g. the
+    `QuantumResults` chi matrix) can be sliced across the whole sweep in a
+    single read. Requires `h5py` (`pip install 'quansys[hdf5]'`).
+
+    The store is only written by the workflow process, after the results
+    are on disk, so post-processing workers never contend for it. The JSON
+    files remain the reference: a missing or deleted store is rebuilt from
+    them on the next run.
+
+    Attributes:
+        file_name: Name of the HDF5 file in the root folder. default: 'results.h5'
+        identifiers: Simulations stored; all of them when `None`. default: None
+        compression: HDF5 compression filter of the datasets. default: 'gzip'
+        compression_level: gzip level (0-9). default: 4
+        chunk_rows: Iterations per dataset chunk. default: 64
+    """
+
+    file_name: str = "results.h5"
+    identifiers: list[str] | None = None
+    compression: Literal["gzip", "lzf"] | None = "gzip"
+    compression_level: int = Field(4, ge=0, le=9)
+    chunk_rows: int = Field(64, ge=1)
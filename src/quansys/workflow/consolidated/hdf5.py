@@ -0,0 +1,417 @@
+from __future__ import annotations
+
+import json
+import warnings
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any, Literal, Self
+
+import numpy as np
+from pycaddy.dict_utils import hash_dict
+from pycaddy.ledger import Status
+from pycaddy.project import Project
+from pydantic import BaseModel, TypeAdapter
+
+from ...simulation.storage import ARRAY_REF, load_result, use_array_store
+from ..aggregation.incremental import uid_key
+from ..aggregation.tree import BUILD
+from .config import ConsolidatedStoreConfig
+
+# per identifier group: the row index and the result values
+INDEX = "index"
+DATA = "data"
+INDEX_FIELDS = ("key", "uid", "params", "finished")
+
+
+def _require_h5py():
+    try:
+        import h5py
+    except ImportError as exc:
+        raise ImportError(
+            "The consolidated store requires h5py: pip install 'quansys[hdf5]'"
+        ) from exc
+    return h5py
+
+
+class Hdf5ResultStore:
+    """
+    One HDF5 file holding the results of a whole sweep.
+
+    Layout, per simulation identifier::
+
+        /<identifier>/index/key     parameter hash of every row
+        /<identifier>/index/uid     iteration uid of every row
+        /<identifier>/index/params  sweep parameters of every row (JSON)
+        /<identifier>/index/finished  when the run of every row finished
+        /<identifier>/data/<path>   one dataset per result value, e.g.
+                                    data/epr/chi of shape (rows, modes, modes)
+
+    Value datasets are resizable along every axis: rows whose arrays are
+    smaller (e.g. fewer modes) are padded with NaN (0 for integers, '' for
+    strings), and a dataset created after the first rows holds the fill value
+    for them.
+
+    Example:
+        ```python
+        with Hdf5ResultStore("results/results.h5") as store:
+            chi = store.read("quantum", "epr/chi")  # (rows, modes, modes)
+            params = store.params("quantum")  # one dict per row
+        ```
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        mode: Literal["r", "a"] = "r",
+        compression: Literal["gzip", "lzf"] | None = "gzip",
+        compression_level: int = 4,
+        chunk_rows: int = 64,
+    ):
+        self.path = Path(path)
+        self.mode = mode
+        self.compression = compression
+        self.compression_level = compression_level
+        self.chunk_rows = chunk_rows
+        self._file = None
+        self._rows: dict[str, dict[str, int]] = {}
+
+    def __enter__(self) -> Self:
+        h5py = _require_h5py()
+        if self.mode == "a":
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = h5py.File(self.path, self.mode)
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._file.close()
+        self._file = None
+        self._rows.clear()
+
+    # ------------------------------------------------------------------
+    # reading
+    # ------------------------------------------------------------------
+    def identifiers(self) -> list[str]:
+        return list(self._file)
+
+    def names(self, identifier: str) -> list[str]:
+        """The value datasets of `identifier`, as paths under its ``data`` group."""
+        names = []
+        self._file[identifier][DATA].visititems(
+            lambda name, item: names.append(name) if _is_dataset(item) else None
+        )
+        return names
+
+    def keys(self, identifier: str) -> list[str]:
+        return _strings(self._file[identifier][INDEX]["key"][()])
+
+    def uids(self, identifier: str) -> list[str]:
+        return _strings(self._file[identifier][INDEX]["uid"][()])
+
+    def stamps(self, identifier: str) -> dict[str, tuple[str, str]]:
+        """key -> (uid, finished) of the stored rows of `identifier`."""
+        if identifier not in self._file:
+            return {}
+        index = self._file[identifier][INDEX]
+        finished = index["finished"][()] if "finished" in index else None
+        keys, uids = self.keys(identifier), self.uids(identifier)
+        if finished is None or len(finished) != len(keys):
+            # written before rows were stamped: refreshed once
+            return {key: (uid, "") for key, uid in zip(keys, uids)}
+        return dict(zip(keys, zip(uids, _strings(finished))))
+
+    def params(self, identifier: str) -> list[dict]:
+        return [
+            json.loads(p) for p in _strings(self._file[identifier][INDEX]["params"][()])
+        ]
+
+    def row(self, identifier: str, params: dict) -> int:
+        """The row of the iteration with sweep parameters `params`."""
+        rows = self._index(identifier)
+        key = hash_dict(params)
+        if key not in rows:
+            raise KeyError(f"{params} not found under {identifier!r} in {self.path}")
+        return rows[key]
+
+    def read(self, identifier: str, name: str, rows: Any = slice(None)) -> np.ndarray:
+        """
+        Read the value `name` (e.g. ``"epr/chi"``) of the selected `rows`
+        (an index, slice or sorted index list) of `identifier`.
+        """
+        data = self._file[identifier][DATA][name][rows]
+        if data.dtype.kind == "O":
+            return np.vectorize(_decode, otypes=[object])(data)
+        return data
+
+    # ------------------------------------------------------------------
+    # writing
+    # ------------------------------------------------------------------
+    def __contains__(self, item: tuple[str, str]) -> bool:
+        identifier, key = item
+        return key in self._index(identifier)
+
+    def append(
+        self,
+        identifier: str,
+        key: str,
+        uid: str,
+        params: dict,
+        result: BaseModel,
+        finished: str = "",
+    ) -> int:
+        """
+        Store `result` under the parameter hash `key` of `identifier`; a row
+        with the same key is overwritten. `finished` records when its run
+        finished. Return the row.
+        """
+        group = self._file.require_group(identifier)
+        index = self._require_index(group)
+        rows = self._index(identifier)
+
+        row = rows.get(key)
+        if row is None:
+            row = rows[key] = len(rows)
+            for dataset in index.values():
+                dataset.resize((row + 1,))
+        index["key"][row] = key
+        index["uid"][row] = uid
+        index["params"][row] = json.dumps(params, default=str)
+        index["finished"][row] = finished
+
+        data = group.require_group(DATA)
+        written = set()
+        for name, value in _values(result):
+            if self._write(data, name, row, value):
+                written.add(name)
+
+        # values this result does not have: fill (and grow) the rest
+        for name in self.names(identifier):
+            if name not in written:
+                self._write(data, name, row, None)
+        return row
+
+    def _index(self, identifier: str) -> dict[str, int]:
+        if identifier not in self._rows:
+            keys = self.keys(identifier) if identifier in self._file else []
+            self._rows[identifier] = {key: row for row, key in enumerate(keys)}
+        return self._rows[identifier]
+
+    def _require_index(self, group):
+        h5py = _require_h5py()
+        index = group.require_group(INDEX)
+        rows = index["key"].shape[0] if "key" in index else 0
+        for name in INDEX_FIELDS:
+            if name not in index:
+                # (`finished` is missing in stores written before it existed)
+                index.create_dataset(
+                    name,
+                    shape=(rows,),
+                    maxshape=(None,),
+                    chunks=(self.chunk_rows,),
+                    dtype=h5py.string_dtype(),
+                )
+        return {name: index[name] for name in INDEX_FIELDS}
+
+    def _write(self, data, name: str, row: int, value: np.ndarray | None) -> bool:
+        """Write `value` into row `row` of the dataset `name` (None: the fill)."""
+        dataset = data.get(name)
+        if value is None:
+            if dataset.shape[0] <= row:
+                dataset.resize((row + 1, *dataset.shape[1:]))
+            dataset[row] = _fill(dataset.dtype)
+            return False
+
+        text = value.dtype.kind == "U"
+        if dataset is None:
+            dataset = self._create(data, name, row, value)
+        elif dataset.ndim != value.ndim + 1:
+            warnings.warn(
+                f"{name}: a {value.ndim}-d value cannot be stored in the "
+                f"{dataset.ndim - 1}-d dataset of {self.path}; skipped"
+            )
+            return False
+        elif not text and np.result_type(dataset.dtype, value.dtype) != dataset.dtype:
+            dataset = self._promote(
+                data, name, np.result_type(dataset.dtype, value.dtype)
+            )
+
+        shape = (
+            max(dataset.shape[0], row + 1),
+            *np.maximum(dataset.shape[1:], value.shape).tolist(),
+        )
+        if shape != dataset.shape:
+            dataset.resize(shape)
+        dataset[row] = _fill(dataset.dtype)
+        dataset[(row, *(slice(0, n) for n in value.shape))] = (
+            value.astype(object) if text else value.astype(dataset.dtype)
+        )
+        return True
+
+    def _create(self, data, name: str, rows: int, value: np.ndarray):
+        h5py = _require_h5py()
+        dtype = h5py.string_dtype() if value.dtype.kind == "U" else value.dtype
+        options = {}
+        if self.compression is not None:
+            options["compression"] = self.compression
+            if self.compression == "gzip":
+                options["compression_opts"] = self.compression_level
+        return data.create_dataset(
+            name,
+            shape=(rows, *value.shape),
+            maxshape=(None,) * (value.ndim + 1),
+            chunks=(self.chunk_rows, *(max(1, n) for n in value.shape)),
+            dtype=dtype,
+            fillvalue=_fill(np.dtype(dtype)),
+            **options,
+        )
+
+    def _promote(self, data, name: str, dtype: np.dtype):
+        """Recreate the dataset `name` with the wider `dtype` (e.g. real to complex)."""
+        values = data[name][()]
+        del data[name]
+        dataset = self._create(data, name, 0, np.zeros(values.shape[1:], dtype))
+        dataset.resize(values.shape)
+        dataset[()] = values.astype(dtype)
+        return dataset
+
+
+class ConsolidatedStore:
+    """
+    Keeps the HDF5 store of a workflow up to date with its finished runs.
+
+    The workflow updates it along with the aggregations: every `update`
+    stores the runs finished under the stored identifiers since the last one,
+    reading their result files. A run that finished again (a redo, or a re-run
+    after its result was removed) replaces its row.
+    """
+
+    name = "consolidated_store"
+
+    def __init__(
+        self,
+        config: ConsolidatedStoreConfig,
+        path: Path,
+        identifiers: list[str],
+        iteration_project: Project,
+        adapter: TypeAdapter | None = None,
+    ):
+        self.config = config
+        self.path = Path(path)
+        self.identifiers = list(dict.fromkeys(identifiers))
+        self.iteration_project = iteration_project
+        self.adapter = adapter
+
+    def open(self, mode: Literal["r", "a"] = "a") -> Hdf5ResultStore:
+        return Hdf5ResultStore(
+            self.path,
+            mode,
+            self.config.compression,
+            self.config.compression_level,
+            self.config.chunk_rows,
+        )
+
+    def update(self) -> int:
+        """Store the newly finished runs; return the number of rows written."""
+        ledger = self.iteration_project.ledger
+        relpath = self.iteration_project.relpath
+        build = ledger.get_uid_record_dict(BUILD, relpath=relpath)
+
+        added = 0
+        with self.open("a") as store:
+            for identifier in self.identifiers:
+                stored = store.stamps(identifier)
+                for uid, key, finished, path in self._finished(identifier):
+                    if stored.get(key) == (uid, finished):
+                        continue
+                    params = _read_params(build.get(uid))
+                    result = load_result(path, self.adapter)
+                    store.append(identifier, key, uid, params, result, finished)
+                    added += 1
+        return added
+
+    def _finished(self, identifier: str) -> Iterator[tuple[str, str, str, Path]]:
+        records = self.iteration_project.ledger.get_uid_record_dict(
+            identifier, relpath=self.iteration_project.relpath
+        )
+        for uid in sorted(records, key=uid_key):
+            record = records[uid]
+            if record.status == Status.DONE and "data" in record.files:
+                key = record.param_hash or uid
+                yield uid, key, _finished_at(record), Path(record.files["data"])
+
+
+# ---------------------------------------------------------------------------
+# helpers
+# ---------------------------------------------------------------------------
+class _ArrayCollector:
+    """An array store keeping the arrays of a dumped result as they are."""
+
+    def __init__(self):
+        self.arrays: dict[str, np.ndarray] = {}
+
+    def put(self, array: np.ndarray, name: str = "array") -> dict:
+        key = f"{name}_{len(self.arrays)}"
+        self.arrays[key] = np.asarray(array)
+        return {ARRAY_REF: key}
+
+
+def _values(result: Any) -> Iterator[tuple[str, np.ndarray]]:
+    """The storable values of `result`, by '/'-separated path."""
+    if isinstance(result, BaseModel):
+        collector = _ArrayCollector()
+        with use_array_store(collector):
+            data = result.model_dump()
+        return _leaves(data, collector.arrays, "")
+    return _leaves(result, {}, "")
+
+
+def _leaves(data: Any, arrays: dict, prefix: str) -> Iterator[tuple[str, np.ndarray]]:
+    if isinstance(data, dict):
+        if set(data) == {ARRAY_REF}:
+            yield prefix, arrays[data[ARRAY_REF]]
+            return
+        for key, value in data.items():
+            yield from _leaves(value, arrays, f"{prefix}/{key}" if prefix else str(key))
+        return
+    if data is None:
+        return
+
+    # numbers, strings and (nested) lists of either; anything else stays in
+    # the JSON files
+    try:
+        value = np.asarray(data)
+    except ValueError:  # ragged
+        return
+    if value.dtype.kind in "biufcU" and prefix:
+        yield prefix, value
+
+
+def _finished_at(record) -> str:
+    """When `record` last became done, from its status history."""
+    done = [t for t, status in record.timestamp_status_lst if status == Status.DONE]
+    return done[-1].isoformat() if done else ""
+
+
+def _read_params(record) -> dict:
+    if record is None or "data" not in record.files:
+        return {}
+    return json.loads(Path(record.files["data"]).read_text())
+
+
+def _fill(dtype: np.dtype) -> Any:
+    if dtype.kind in "fc":
+        return np.full((), np.nan, dtype)
+    if dtype.kind == "O":
+        return ""
+    return 0
+
+
+def _is_dataset(item) -> bool:
+    return hasattr(item, "dtype")
+
+
+def _decode(value: Any) -> Any:
+    return value.decode() if isinstance(value, bytes) else value
+
+
+def _strings(values: np.ndarray) -> list[str]:
+    return [_decode(v) for v in values.tolist()]
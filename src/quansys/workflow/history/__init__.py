@@ -0,0 +1,23 @@
+from .estimate import (
+    AnalysisEstimate,
+    Plan,
+    Resources,
+    format_hhmm,
+    make_plan,
+    pending_runs,
+    recommend,
+)
+from .samples import RunSample, collect_history, collect_samples
+
+__all__ = [
+    "AnalysisEstimate",
+    "Plan",
+    "Resources",
+    "RunSample",
+    "collect_history",
+    "collect_samples",
+    "format_hhmm",
+    "make_plan",
+    "pending_runs",
+    "recommend",
+]
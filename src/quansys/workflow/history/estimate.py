@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from pycaddy.dict_utils import hash_dict
+from pycaddy.ledger import Status
+
+from ..config import WorkflowConfig
+from ..ledger import open_ledger
+from ..sweep import expand_sweep
+from .samples import (
+    ITERATIONS,
+    RunSample,
+    collect_history,
+    collect_samples,
+    identifier_simulations,
+    resolve_root,
+    signatures,
+)
+
+
+@dataclass
+class AnalysisEstimate:
+    """Predicted cost of the pending runs of one identifier."""
+
+    identifier: str
+    pending: int
+    samples: int = 0
+    seconds_per_run: float | None = None
+    memory_gb: float | None = None
+
+    @property
+    def total_seconds(self) -> float | None:
+        if self.seconds_per_run is None:
+            return None
+        return self.pending * self.seconds_per_run
+
+
+@dataclass
+class Plan:
+    """
+    Predicted cost of the pending part of a workflow.
+
+    `cores` is what the config asks for; the runs it is predicted from have the
+    same analysis definition, cores included (see `signatures`).
+    """
+
+    estimates: list[AnalysisEstimate]
+    cores: int = 1
+    post_processing: bool = False
+
+    @property
+    def pending(self) -> int:
+        return sum(e.pending for e in self.estimates)
+
+    @property
+    def total_seconds(self) -> float:
+        # the iteration loop runs one solve at a time
+        return sum(e.total_seconds or 0.0 for e in self.estimates)
+
+    @property
+    def peak_memory_gb(self) -> float | None:
+        memory = [e.memory_gb for e in self.estimates if e.pending and e.memory_gb]
+        return max(memory, default=None)
+
+    @property
+    def unknown(self) -> list[str]:
+        """Identifiers with pending runs but no history to predict them from."""
+        return [e.identifier for e in self.estimates if e.pending and not e.samples]
+
+
+@dataclass
+class Resources:
+    """Recommended cluster reservation for a plan."""
+
+    cores: int
+    workers: int
+    seconds: float | None = None
+    mem_mb: int | None = None
+    notes: list[str] = field(default_factory=list)
+
+    @property
+    def timeout(self) -> str | None:
+        return None if self.seconds is None else format_hhmm(self.seconds)
+
+
+def pending_runs(config: WorkflowConfig, config_path: Path) -> dict[str, int]:
+    """Runs still to do per identifier; finished ledger sessions are excluded."""
+    points, _, adaptive = expand_sweep(config.builder_sweep, config.deduplicate_sweep)
+
+    done: dict[str, set] = {}
+    ledger = open_ledger(resolve_root(config, config_path))
+    identifiers = identifier_simulations(config)
+    for identifier in identifiers:
+        records = {}
+        if ledger is not None:
+            records = ledger.get_uid_record_dict(identifier, relpath=ITERATIONS)
+        done[identifier] = {
+            r.param_hash for r in records.values() if r.status == Status.DONE
+        }
+
+    hashes = [hash_dict(params) for params in points]
+    pending = {}
+    for identifier in identifiers:
+        remaining = sum(h not in done[identifier] for h in hashes)
+        if adaptive is not None:
+            # points are proposed at run time; the budget bounds them
+            remaining = max(0, len(points) * adaptive.budget - len(done[identifier]))
+        elif config.screening is not None and identifier in config.simulations:
+            # only the selected points reach the full-fidelity stage
+            selected = config.screening.top_k or len(points)
+            finished = len(points) - remaining
+            remaining = max(0, min(selected, len(points)) - finished)
+        pending[identifier] = remaining
+    return pending
+
+
+def make_plan(
+    config_path: Path, history: list[Path] = (), quantile: float = 0.9
+) -> Plan:
+    """
+    Predict the cost of the pending runs of a workflow.
+
+    Every identifier is predicted from finished runs with the same signature
+    (template and analysis definition), falling back to runs of the same
+    template, design and setup. The workflow's own finished runs are always
+    part of the history.
+
+    Args:
+        config_path: The workflow config.
+        history: More workflow configs, or folders to search for them.
+        quantile: Quantile of the historical wall times used per run.
+    """
+    config = WorkflowConfig.load_from_yaml(config_path)
+    samples = collect_samples(config_path) + collect_history(list(history))
+    pending = pending_runs(config, config_path)
+    template = config.pyaedt_file_parameters.file_path
+
+    estimates = []
+    for identifier, simulation in identifier_simulations(config).items():
+        exact, coarse = signatures(template, identifier, simulation)
+        matching = [s for s in samples if s.signature == exact] or [
+            s for s in samples if s.coarse_signature == coarse
+        ]
+        estimates.append(_estimate(identifier, pending[identifier], matching, quantile))
+
+    simulations = list(config.simulations.values())
+    cores = max((getattr(s, "cores", 1) for s in simulations), default=1)
+    if config.multi_variation.enabled:
+        cores = max(cores, config.multi_variation.cores)
+    post_processing = any(s.type == "quantum_epr" for s in simulations)
+
+    return Plan(estimates=estimates, cores=cores, post_processing=post_processing)
+
+
+def recommend(plan: Plan, margin: float = 0.25) -> Resources:
+    """Reservation covering the plan with a relative safety `margin`."""
+    resources = Resources(cores=plan.cores, workers=1 if plan.post_processing else 0)
+
+    if plan.unknown:
+        resources.notes.append(
+            "no history for: " + ", ".join(plan.unknown) + " (not included)"
+        )
+    if any(e.pending and e.samples for e in plan.estimates):
+        # at least 10 minutes: AEDT start-up alone is a few
+        resources.seconds = max(600.0, plan.total_seconds * (1 + margin))
+
+    if plan.peak_memory_gb is not None:
+        mb = plan.peak_memory_gb * 1000 * (1 + margin)
+        resources.mem_mb = int(math.ceil(mb / 1000) * 1000)
+
+    return resources
+
+
+def format_hhmm(seconds: float) -> str:
+    minutes = math.ceil(seconds / 60)
+    return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+
+def _estimate(
+    identifier: str, pending: int, samples: list[RunSample], quantile: float
+) -> AnalysisEstimate:
+    seconds = []
+    for s in samples:
+        if s.wall_seconds is None and not s.solve_minutes:
+            continue
+        # the ledger wall time includes the solve; take whichever is larger
+        seconds.append(max(s.wall_seconds or 0.0, (s.solve_minutes or 0.0) * 60))
+    seconds.sort()
+    memory = [s.memory_gb for s in samples if s.memory_gb]
+
+    return AnalysisEstimate(
+        identifier=identifier,
+        pending=pending,
+        samples=len(samples),
+        seconds_per_run=_quantile(seconds, quantile) if seconds else None,
+        memory_gb=max(memory, default=None),
+    )
+
+
+def _quantile(values: list[float], q: float) -> float:
+    # nearest-rank, so the estimate is always an observed value
+    index = min(len(values) - 1, max(0, math.ceil(q * len(values)) - 1))
+    return values[index]
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from pathlib import Path
+
+from pint.errors import PintError
+from pycaddy.dict_utils import hash_dict
+from pycaddy.ledger import RunRecord, Status
+
+from ...simulation.eigenmode.profile import memory_to_gb
+from ..config import WorkflowConfig
+from ..ledger import open_ledger
+
+# phases without an analysis, recorded in the ledger like the simulations
+PHASES = ("prepare", "build")
+ITERATIONS = Path("iterations")
+
+
+@dataclass
+class RunSample:
+    """The measured cost of one finished run of one identifier."""
+
+    identifier: str
+    signature: str
+    coarse_signature: str
+    wall_seconds: float | None = None
+    solve_minutes: float | None = None
+    memory_gb: float | None = None
+
+
+def signatures(template: Path, identifier: str, simulation=None) -> tuple[str, str]:
+    """
+    Keys under which runs are expected to cost alike.
+
+    The exact signature covers the template and the full analysis definition;
+    the coarse one only the template, analysis type, design and setup.
+    """
+    if simulation is None:
+        key = {"template": template.name, "phase": identifier}
+        return hash_dict(key), hash_dict(key)
+
+    dumped = simulation.model_dump(mode="json")
+    exact = {"template": template.name, "analysis": dumped}
+    coarse = {
+        "template": template.name,
+        "type": dumped.get("type"),
+        "design_name": dumped.get("design_name"),
+        "setup_name": dumped.get("setup_name"),
+    }
+    return hash_dict(exact), hash_dict(coarse)
+
+
+def identifier_simulations(config: WorkflowConfig) -> dict:
+    """Every identifier a workflow records per iteration, mapped to its analysis."""
+    identifiers = {phase: None for phase in PHASES}
+    identifiers.update(config.simulations)
+    if config.screening is not None:
+        identifiers.update(config.screening.screening_simulations(config.simulations))
+    return identifiers
+
+
+def resolve_root(config: WorkflowConfig, config_path: Path) -> Path:
+    """
+    The results folder of a workflow: relative roots are taken from the
+    working directory if they exist there (as `quansys run` does), otherwise
+    from the folder holding the config (as `quansys submit` lays it out).
+    """
+    root = Path(config.root_folder)
+    if root.is_absolute() or root.exists():
+        return root
+    return Path(config_path).parent / root
+
+
+def collect_samples(config_path: Path) -> list[RunSample]:
+    """Samples of every finished run of the workflow defined by `config_path`."""
+    config = WorkflowConfig.load_from_yaml(config_path)
+    ledger = open_ledger(resolve_root(config, config_path))
+    if ledger is None:
+        return []
+
+    template = config.pyaedt_file_parameters.file_path
+    samples = []
+    for identifier, simulation in identifier_simulations(config).items():
+        exact, coarse = signatures(template, identifier, simulation)
+        records = ledger.get_uid_record_dict(identifier, relpath=ITERATIONS)
+        for record in records.values():
+            if record.status != Status.DONE:
+                continue
+            sample = RunSample(
+                identifier=identifier,
+                signature=exact,
+                coarse_signature=coarse,
+                wall_seconds=wall_seconds(record),
+            )
+            if simulation is not None:
+                _read_profile(record, sample)
+            samples.append(sample)
+    return samples
+
+
+def collect_history(paths: list[Path]) -> list[RunSample]:
+    """Samples from workflow configs, or folders searched for ``config.yaml``."""
+    samples = []
+    for path in paths:
+        path = Path(path)
+        configs = sorted(path.rglob("config.yaml")) if path.is_dir() else [path]
+        for config_path in configs:
+            try:
+                samples.extend(collect_samples(config_path))
+            except (OSError, ValueError):
+                # not a workflow config, or an incompatible one
+                continue
+    return samples
+
+
+def wall_seconds(record: RunRecord) -> float | None:
+    """Time from the last start of a run to its completion."""
+    started = None
+    for timestamp, status in record.timestamp_status_lst:
+        if status == Status.RUNNING:
+            started = timestamp
+        elif status == Status.DONE and started is not None:
+            return (timestamp - started).total_seconds()
+    return None
+
+
+def _read_profile(record: RunRecord, sample: RunSample) -> None:
+    path = record.files.get("data")
+    if path is None or not Path(path).exists():
+        return
+    with open(path) as f:
+        profile = json.load(f).get("profile")
+    if not profile:
+        return
+
+    sample.solve_minutes = profile.get("total_time_min") or None
+    try:
+        sample.memory_gb = memory_to_gb(profile["memory"])
+    except (KeyError, ValueError, PintError):
+        sample.memory_gb = None
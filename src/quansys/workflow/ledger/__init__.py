@@ -0,0 +1,20 @@
+from .project import (
+    JSON_LEDGER_FILE,
+    SQLITE_LEDGER_FILE,
+    IndexedProject,
+    LedgerBackend,
+    open_ledger,
+    open_project,
+)
+from .sqlite import SqliteLedger, import_json_ledger
+
+__all__ = [
+    "JSON_LEDGER_FILE",
+    "SQLITE_LEDGER_FILE",
+    "IndexedProject",
+    "LedgerBackend",
+    "SqliteLedger",
+    "import_json_ledger",
+    "open_ledger",
+    "open_project",
+]
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Literal
+
+from pycaddy.ledger import Ledger
+from pycaddy.project import Project
+
+from .sqlite import SqliteLedger
+
+JSON_LEDGER_FILE = "metadata.json"
+SQLITE_LEDGER_FILE = "metadata.sqlite"
+
+LedgerBackend = Literal["json", "sqlite"]
+
+
+class IndexedProject(Project):
+    """A `pycaddy` Project whose runs are kept in a `SqliteLedger`."""
+
+    @property
+    def ledger_path(self) -> Path:
+        return Path(self.root) / SQLITE_LEDGER_FILE
+
+    @property
+    def ledger(self) -> SqliteLedger:
+        if self._ledger is None:
+            self._ledger = SqliteLedger(path=self.ledger_path)
+        return self._ledger
+
+    def sub(self, name: str) -> IndexedProject:
+        child = IndexedProject(
+            root=self.root,
+            relpath=self.relpath / name,
+            existing_run_strategy=self.existing_run_strategy,
+            storage_mode=self.storage_mode,
+        )
+        child.ensure_folder()
+        return child
+
+
+def open_project(root: Path, backend: LedgerBackend = "json") -> Project:
+    """
+    The results project under `root`, with the requested ledger backend.
+
+    Switching an existing JSON project to ``sqlite`` requires importing its
+    ledger first (`quansys ledger import`), otherwise every run would be
+    allocated again.
+    """
+    if backend == "json":
+        return Project(root=root)
+
+    root = Path(root)
+    if (root / JSON_LEDGER_FILE).exists() and not (root / SQLITE_LEDGER_FILE).exists():
+        raise ValueError(
+            f"{root} has a JSON ledger; import it first with "
+            f"`quansys ledger import {root}`"
+        )
+    return IndexedProject(root=root)
+
+
+def open_ledger(root: Path) -> Ledger | None:
+    """The existing ledger under `root` (SQLite preferred), if any."""
+    root = Path(root)
+    if (root / SQLITE_LEDGER_FILE).exists():
+        return SqliteLedger(root / SQLITE_LEDGER_FILE)
+    if (root / JSON_LEDGER_FILE).exists():
+        return Ledger(root / JSON_LEDGER_FILE)
+    return None
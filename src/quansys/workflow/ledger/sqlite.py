@@ -0,0 +1,284 @@
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+from collections.abc import Iterable
+from contextlib import contextmanager
+from math import ceil, log10
+from pathlib import Path
+
+from pycaddy.ledger import Ledger, RunRecord, Status
+from pycaddy.ledger.ledger import DATA_ADAPTER, DATA_STRUCTURE, _relkey
+from pycaddy.ledger.naming_strategy import uid_formatting
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    identifier TEXT NOT NULL,
+    relpath    TEXT NOT NULL,
+    uid        TEXT NOT NULL,
+    status     TEXT NOT NULL,
+    param_hash TEXT,
+    files      TEXT NOT NULL,
+    history    TEXT NOT NULL,
+    PRIMARY KEY (identifier, relpath, uid)
+);
+CREATE INDEX IF NOT EXISTS runs_by_hash ON runs (identifier, relpath, param_hash);
+CREATE TABLE IF NOT EXISTS counters (
+    identifier TEXT NOT NULL,
+    relpath    TEXT NOT NULL,
+    next_uid   INTEGER NOT NULL,
+    PRIMARY KEY (identifier, relpath)
+);
+"""
+
+_COLUMNS = "uid, status, param_hash, files, history"
+
+
+class SqliteLedger(Ledger):
+    """
+    Drop-in replacement for the JSON `pycaddy.ledger.Ledger`, backed by SQLite.
+
+    The JSON ledger re-reads and re-writes the whole ``metadata.json`` for
+    every lookup and status change, so resuming a large sweep slows down with
+    its size. Here every run is one row, indexed by
+    (identifier, relpath, param_hash): the `find_by_param_hash` and
+    `get_record` lookups behind `project.session(...).is_done()` are index
+    lookups, and a status change rewrites one row.
+
+    The database is in WAL mode, so readers never block the writer. Writes
+    take the database lock (`BEGIN IMMEDIATE`, waiting up to `timeout`
+    seconds), which makes concurrent writers from several threads or
+    processes safe; uids are allocated inside that lock, from a per
+    (identifier, relpath) counter. WAL needs every
+    process to be on the same host, so workers on other machines must not
+    share a database on a network filesystem.
+    """
+
+    def __init__(
+        self, path: str | Path, maxsize: int = 1000, timeout: float = 60.0
+    ) -> None:
+        self.file: Path = Path(path).expanduser().resolve()
+        self.file.parent.mkdir(parents=True, exist_ok=True)
+        self.maxsize = maxsize
+        self.timeout = timeout
+        # a connection per thread and process (connections must not cross either)
+        self._local = threading.local()
+
+        self._connection().executescript(_SCHEMA)
+
+    # -----------------------------------------------------------------
+    def allocate(
+        self,
+        identifier: str,
+        *,
+        status: Status = Status.PENDING,
+        relpath: Path = Path(""),
+        param_hash: str | None = None,
+    ) -> str:
+        rkey = _relkey(relpath)
+        record = RunRecord(status=status, param_hash=param_hash)
+        record.timestamp_status()
+        padding = ceil(log10(self.maxsize))
+
+        with self._transaction() as db:
+            uid = uid_formatting(self._take_number(db, identifier, rkey), padding)
+            db.execute(
+                "INSERT INTO runs VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (identifier, rkey, uid, *_row(record)),
+            )
+        return uid
+
+    def log(
+        self,
+        identifier: str,
+        uid: str,
+        *,
+        relpath: Path = Path(""),
+        status: Status | None = None,
+        path_dict: dict[str, Path] | None = None,
+    ) -> None:
+        if not (status or path_dict):
+            return
+
+        rkey = _relkey(relpath)
+        with self._transaction() as db:
+            record = self._select(db, identifier, rkey, uid)
+            if status:
+                record.status = status
+                record.timestamp_status()
+            if path_dict:
+                record.files.update(path_dict)
+            db.execute(
+                "UPDATE runs SET status = ?, param_hash = ?, files = ?, history = ? "
+                "WHERE identifier = ? AND relpath = ? AND uid = ?",
+                (*_row(record), identifier, rkey, uid),
+            )
+
+    def get_record(
+        self, identifier: str, uid: str, *, relpath: Path = Path("")
+    ) -> RunRecord:
+        return self._select(self._connection(), identifier, _relkey(relpath), uid)
+
+    def get_uid_record_dict(self, identifier: str, *, relpath: Path = Path("")):
+        rows = self._connection().execute(
+            f"SELECT {_COLUMNS} FROM runs WHERE identifier = ? AND relpath = ? "
+            "ORDER BY length(uid), uid",
+            (identifier, _relkey(relpath)),
+        )
+        return {row[0]: _record(row) for row in rows}
+
+    def get_uid_record_dict_after(
+        self,
+        identifier: str,
+        uid: str | None,
+        *,
+        relpath: Path = Path(""),
+        include: Iterable[str] = (),
+    ) -> dict[str, RunRecord]:
+        """
+        The records of `identifier` allocated after `uid` (all of them for
+        None), and those of the uids in `include`. Unlike
+        `get_uid_record_dict`, the runs before `uid` are not read.
+        """
+        after = ("", -1) if uid is None else (uid, len(uid))
+        rows = self._connection().execute(
+            f"SELECT {_COLUMNS} FROM runs WHERE identifier = ? AND relpath = ? "
+            "AND (length(uid) > ? OR (length(uid) = ? AND uid > ?) "
+            "OR uid IN (SELECT value FROM json_each(?))) "
+            "ORDER BY length(uid), uid",
+            (
+                identifier,
+                _relkey(relpath),
+                after[1],
+                after[1],
+                after[0],
+                json.dumps(list(include)),
+            ),
+        )
+        return {row[0]: _record(row) for row in rows}
+
+    def load(self) -> DATA_STRUCTURE:
+        data: DATA_STRUCTURE = {}
+        rows = self._connection().execute(
+            f"SELECT identifier, relpath, {_COLUMNS} FROM runs "
+            "ORDER BY length(uid), uid"
+        )
+        for identifier, rkey, *row in rows:
+            data.setdefault(identifier, {}).setdefault(rkey, {})[row[0]] = _record(row)
+        return data
+
+    def find_by_param_hash(
+        self, identifier: str, param_hash: str, *, relpath: Path = Path("")
+    ) -> tuple[str, RunRecord] | None:
+        row = (
+            self._connection()
+            .execute(
+                f"SELECT {_COLUMNS} FROM runs "
+                "WHERE identifier = ? AND relpath = ? AND param_hash = ? "
+                "ORDER BY length(uid), uid LIMIT 1",
+                (identifier, _relkey(relpath), param_hash),
+            )
+            .fetchone()
+        )
+        return None if row is None else (row[0], _record(row))
+
+    # -----------------------------------------------------------------
+    def _connection(self) -> sqlite3.Connection:
+        local = self._local
+        if getattr(local, "pid", None) != os.getpid():
+            db = sqlite3.connect(self.file, timeout=self.timeout, isolation_level=None)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            local.db, local.pid = db, os.getpid()
+        return local.db
+
+    @contextmanager
+    def _transaction(self):
+        db = self._connection()
+        db.execute("BEGIN IMMEDIATE")
+        try:
+            yield db
+        except BaseException:
+            db.execute("ROLLBACK")
+            raise
+        db.execute("COMMIT")
+
+    @staticmethod
+    def _take_number(db, identifier: str, rkey: str) -> int:
+        """The next uid number of (identifier, relpath), advancing its counter."""
+        row = db.execute(
+            "SELECT next_uid FROM counters WHERE identifier = ? AND relpath = ?",
+            (identifier, rkey),
+        ).fetchone()
+        if row is None:
+            # first allocation (or the first after an import): after the last run
+            (last,) = db.execute(
+                "SELECT MAX(CAST(uid AS INTEGER)) FROM runs "
+                "WHERE identifier = ? AND relpath = ?",
+                (identifier, rkey),
+            ).fetchone()
+            number = 0 if last is None else last + 1
+        else:
+            number = row[0]
+        db.execute(
+            "INSERT OR REPLACE INTO counters VALUES (?, ?, ?)",
+            (identifier, rkey, number + 1),
+        )
+        return number
+
+    @staticmethod
+    def _select(db, identifier: str, rkey: str, uid: str) -> RunRecord:
+        row = db.execute(
+            f"SELECT {_COLUMNS} FROM runs "
+            "WHERE identifier = ? AND relpath = ? AND uid = ?",
+            (identifier, rkey, uid),
+        ).fetchone()
+        if row is None:
+            raise KeyError(
+                f"run not found: identifier='{identifier}', relpath='{rkey}', "
+                f"uid='{uid}'"
+            )
+        return _record(row)
+
+
+def _row(record: RunRecord) -> tuple:
+    dumped = record.model_dump(mode="json")
+    return (
+        dumped["status"],
+        dumped["param_hash"],
+        json.dumps(dumped["files"]),
+        json.dumps(dumped["timestamp_status_lst"]),
+    )
+
+
+def _record(row) -> RunRecord:
+    _, status, param_hash, files, history = row
+    return RunRecord(
+        status=status,
+        param_hash=param_hash,
+        files=json.loads(files),
+        timestamp_status_lst=json.loads(history),
+    )
+
+
+def import_json_ledger(source: Path, ledger: SqliteLedger) -> int:
+    """
+    Copy every run of a JSON ``metadata.json`` into `ledger`, keeping uids.
+
+    Runs already in `ledger` under the same (identifier, relpath, uid) are
+    replaced. Returns the number of runs imported.
+    """
+    data = DATA_ADAPTER.validate_json(Path(source).read_bytes())
+    rows = [
+        (identifier, rkey, uid, *_row(record))
+        for identifier, relpaths in data.items()
+        for rkey, records in relpaths.items()
+        for uid, record in records.items()
+    ]
+    with ledger._transaction() as db:
+        db.executemany("INSERT OR REPLACE INTO runs VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+        # recounted from the runs on the next allocation
+        db.execute("DELETE FROM counters")
+    return len(rows)
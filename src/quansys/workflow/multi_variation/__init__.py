@@ -0,0 +1,3 @@
+from .config import MultiVariationConfig
+
+__all__ = ["MultiVariationConfig"]
@@ -0,0 +1,35 @@
+from pydantic import BaseModel, Field
+
+
+class MultiVariationConfig(BaseModel):
+    """
+    Configuration for solving the whole sweep natively in HFSS.
+
+    Instead of copying the template for every sweep point and solving each copy
+    in its own AEDT session, the template is copied once, every sweep point is
+    added as a row of a parametric setup, and HFSS solves all variations in a
+    single analysis (optionally distributing them over several tasks). The
+    results of each variation are then extracted into the usual
+    `iterations/<uid>` layout, so resume and aggregation work unchanged.
+
+    Requires a [`DesignVariableBuilder`][quansys.workflow.builder.design_variable_builder.DesignVariableBuilder],
+    with flat sweep parameters naming HFSS design variables.
+
+    Attributes:
+        enabled: If True, the sweep is solved as a single parametric analysis. default: False
+        tasks: Number of variations solved in parallel (distributed variations). default: 1
+        cores: Total number of cores for the parametric analysis. default: 4
+        gpus: Number of GPUs for the parametric analysis. default: 0
+        copy_mesh: If True, every variation starts its adaptive meshing from the mesh
+            of a geometrically equivalent variation already solved. default: True
+        sweep_name: Name of the parametric setup created in the project. default: 'quansys_sweep'
+        dest_name: Filename of the single project copy. default: 'variations.aedt'
+    """
+
+    enabled: bool = False
+    tasks: int = Field(1, ge=1)
+    cores: int = Field(4, ge=1)
+    gpus: int = Field(0, ge=0)
+    copy_mesh: bool = True
+    sweep_name: str = "quansys_sweep"
+    dest_name: str = "variations.aedt"
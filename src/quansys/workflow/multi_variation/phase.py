@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+import csv
+import re
+from functools import partial
+from pathlib import Path
+
+from pycaddy.project import Project
+
+from ..config import WorkflowConfig
+from ..prepare import TransferStats, place_project
+from ..pipeline import PostProcessingPipeline
+from ..telemetry import NO_TELEMETRY, Telemetry
+from ..sweep import params_key
+from ..builder import DesignVariableBuilder
+from ..builder.design_variables_handler import format_variables, normalize_value
+from ..phases import (
+    CachedTemplate,
+    pending_sessions,
+    record_build_parameters,
+    record_transfer,
+    restore_from_cache,
+)
+from ...simulation.base import set_design_and_get_setup, update_setup_parameters
+
+
+def multi_variation_phase(
+    config: WorkflowConfig,
+    points: list[dict],
+    project: Project,
+    pipeline: PostProcessingPipeline,
+    cache: CachedTemplate | None = None,
+    transfers: list[TransferStats] | None = None,
+    telemetry: Telemetry = NO_TELEMETRY,
+):
+    """
+    Prepare, build and simulate all sweep points with one parametric solve.
+
+    Every point still gets its ``prepare``, ``build`` and simulation sessions
+    under ``iterations``, allocated in sweep order so uids line up with the
+    per-iteration strategy. The single project copy and its solve are tracked
+    under ``variations``.
+    """
+    builder, mv = config.builder, config.multi_variation
+    if not isinstance(builder, DesignVariableBuilder):
+        raise TypeError(
+            "multi_variation requires a DesignVariableBuilder, "
+            f"got {type(builder).__name__}"
+        )
+
+    iteration_proj = project.sub("iterations")
+    variations_proj = project.sub("variations")
+    variations_params = {"points": [params_key(params) for params in points]}
+
+    # one project copy for the whole sweep
+    prepare = variations_proj.session("prepare", params=variations_params)
+    if not prepare.is_done():
+        with telemetry.phase("prepare", identifier=mv.sweep_name):
+            prepare.start()
+            dest = prepare.path(mv.dest_name, include_identifier=False)
+            stats = place_project(
+                config.pyaedt_file_parameters.file_path,
+                dest,
+                config.prepare_folder.link_mode,
+            )
+            record_transfer(prepare, stats, transfers)
+            prepare.attach_files({"hfss": dest})
+            prepare.done()
+    run_params = config.pyaedt_file_parameters.model_copy(
+        update={"file_path": prepare.files["hfss"], "design_name": builder.design_name}
+    )
+
+    # allocate every iteration's sessions in sweep order, recording the points
+    pending_points = []
+    for params in points:
+        session = iteration_proj.session("prepare", params=params)
+        if not session.is_done():
+            session.start()
+            session.attach_files({"hfss": run_params.file_path})
+            session.done()
+
+        session = iteration_proj.session("build", params=params)
+        if not session.is_done():
+            session.start()
+            record_build_parameters(session, params)
+            session.done()
+
+        pending = pending_sessions(config.simulations, params, iteration_proj)
+        if not pending:
+            continue
+        if cache is not None and restore_from_cache(
+            cache, params, config.simulations, pending
+        ):
+            continue
+        pending_points.append((params, pending))
+
+    if not pending_points:
+        return
+
+    # a single parametric analysis over all points still to be extracted
+    solve = variations_proj.session("solve", params=variations_params)
+    if not solve.is_done():
+        solve.start()
+        table_path = solve.path("table.csv")
+        _write_variations_table(table_path, [params for params, _ in pending_points])
+
+        with (
+            telemetry.phase("simulate", identifier=mv.sweep_name),
+            run_params.open_pyaedt_file() as hfss,
+        ):
+            for simulation in config.simulations.values():
+                setup_parameters = getattr(simulation, "setup_parameters", None)
+                if setup_parameters:
+                    setup = set_design_and_get_setup(
+                        hfss, simulation.design_name, simulation.setup_name
+                    )
+                    update_setup_parameters(setup, setup_parameters)
+
+            hfss.set_active_design(builder.design_name)
+            sweep = hfss.parametrics.add_from_file(str(table_path), mv.sweep_name)
+            _keep_variation_solutions(sweep, mv.copy_mesh)
+            sweep.analyze(cores=mv.cores, tasks=mv.tasks, gpus=mv.gpus)
+            hfss.save_project()
+
+        solve.attach_files({"table": table_path})
+        solve.done()
+
+    # extraction: make each variation the nominal one and read its solution
+    designs = set()
+    with run_params.open_pyaedt_file() as hfss:
+        for params, pending in pending_points:
+            builder.build(hfss, parameters=params)
+
+            for identifier, session in pending.items():
+                simulation = config.simulations[identifier]
+                designs.add(simulation.design_name)
+                _validate_variation_solved(hfss, simulation, params)
+
+                on_done = None
+                if cache is not None:
+                    on_done = partial(cache.store, params, simulation)
+
+                with telemetry.phase("simulate", params, identifier):
+                    session.start()
+                    collected = simulation.extract(hfss=hfss)
+                pipeline.submit(
+                    session,
+                    simulation,
+                    collected,
+                    session.path(suffix=".json"),
+                    on_done,
+                )
+
+        if not config.keep_hfss_solutions:
+            with telemetry.phase("cleanup", identifier=mv.sweep_name):
+                for design_name in designs:
+                    hfss.set_active_design(design_name)
+                    hfss.cleanup_solution()
+
+
+def _keep_variation_solutions(sweep, copy_mesh: bool) -> None:
+    """
+    Make the parametric setup keep the fields of every variation. By default
+    only the nominal one is kept, and extracting any other variation would
+    read no fields (or those of the nominal).
+    """
+    sweep.props["ProdOptiSetupDataV2"] = {
+        **sweep.props.get("ProdOptiSetupDataV2", {}),
+        "SaveFields": True,
+        "CopyMesh": copy_mesh,
+        # every variation still runs its own adaptive passes
+        "SolveWithCopiedMeshOnly": False,
+    }
+    sweep.update()
+
+
+def _validate_variation_solved(hfss, simulation, params: dict) -> None:
+    """
+    Raise if the setup of `simulation` has no solution at the sweep point
+    `params`. The setup's ``is_solved`` only tells that some variation is.
+    """
+    setup_name = getattr(simulation, "setup_name", None)
+    if setup_name is None:
+        return
+
+    wanted = {
+        name: normalize_value(value) for name, value in format_variables(params).items()
+    }
+    hfss.set_active_design(simulation.design_name)
+    for variation in hfss.list_of_variations(setup_name, "LastAdaptive") or []:
+        solved = _parse_variation(variation)
+        if solved and all(
+            normalize_value(solved[name]) == value
+            for name, value in wanted.items()
+            if name in solved
+        ):
+            return
+
+    raise ValueError(
+        f"{simulation.design_name}:{setup_name} has no solution for the "
+        f"variation {params}"
+    )
+
+
+_VARIATION_VALUE = re.compile(r"(\$?\w+)='([^']*)'")
+
+
+def _parse_variation(variation: str) -> dict[str, str]:
+    """Split an HFSS variation string (``"l='10nH' w='3mm'"``) into its values."""
+    return dict(_VARIATION_VALUE.findall(variation or ""))
+
+
+def _write_variations_table(path: Path, points: list[dict]) -> None:
+    """Write sweep points as an HFSS parametric table (``*`` index column)."""
+    rows = [format_variables(params) for params in points]
+    names = list(rows[0])
+
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=["*", *names])
+        writer.writeheader()
+        for index, row in enumerate(rows, start=1):
+            writer.writerow({"*": index, **row})
@@ -0,0 +1,282 @@
+"""
+The phases of one sweep point: prepare, build, simulate and aggregate, and
+the ways a point is recorded without solving it (cache hits, duplicates).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+
+from pycaddy.project import Project
+from pycaddy.save import save_json
+
+from .session_handler import PyaedtFileParameters
+from .prepare import PrepareFolderConfig, TransferStats, place_project
+from .pipeline import PostProcessingPipeline
+from .cache import ResultCache
+from .telemetry import NO_TELEMETRY, Telemetry
+from .aggregation import IncrementalAggregation
+from .consolidated import ConsolidatedStore
+from .builder import DesignVariableBuilder
+from .builder.design_variables_handler import format_variables
+from ..simulation import SIMULATION_RESULTS_ADAPTER
+from ..simulation.storage import copy_result, load_result
+from ..simulation.eigenmode import MeshSeed
+
+
+def prepare_folder_phase(
+    cfg: PrepareFolderConfig,
+    pyaedt: PyaedtFileParameters,
+    params: dict,
+    project: Project,
+    transfers: list[TransferStats] | None = None,
+) -> PyaedtFileParameters:
+    """
+    • Optionally copy the template AEDT into the run folder.
+    • Return a **new** PyaedtFileParameters whose file_path points at that copy.
+    • Record what the copy cost in ``prepare_stats.json`` and in `transfers`.
+    • Nothing is mutated in-place.
+    """
+    # ── skip entirely if policy disabled ────────────────────────────────────
+    # if not cfg.copy_enabled:
+    #     return pyaedt
+
+    session = project.session("prepare", params=params)
+
+    if session.is_done():
+        hfss_path = session.files["hfss"]
+        return pyaedt.model_copy(update={"file_path": hfss_path})
+
+    session.start()
+    dest: Path = session.path(cfg.dest_name, include_identifier=False)
+
+    # Template missing -> just fall through without copy
+    if pyaedt.file_path.exists():
+        stats = place_project(pyaedt.file_path, dest, cfg.link_mode)
+        record_transfer(session, stats, transfers)
+
+    session.attach_files({"hfss": dest})
+
+    session.done()
+    return pyaedt.model_copy(update={"file_path": dest})
+
+
+def record_transfer(session, stats: TransferStats, transfers: list | None) -> None:
+    stats_path = session.path("prepare_stats.json", include_identifier=False)
+    save_json(stats_path, stats.to_dict())
+    session.attach_files({"stats": stats_path})
+    if transfers is not None:
+        transfers.append(stats)
+
+
+def build_phase(builder, pyaedt_params, params, project, rebuild: bool = False):
+    session = project.session("build", params=params)
+
+    if session.is_done() and not rebuild:
+        return
+
+    session.start()
+    record_build_parameters(session, params)
+
+    with pyaedt_params.open_pyaedt_file() as hfss:
+        builder.build(hfss, parameters=params)
+    session.done()
+
+
+def record_build_parameters(session, params: dict) -> None:
+    parameters_path = session.path("parameters.json")
+    save_json(parameters_path, params)
+    session.attach_files({"data": parameters_path})
+
+
+def skip_prepare_and_build(params: dict, project: Project) -> None:
+    """
+    Record the build of an iteration that needs no project: the ``prepare``
+    session is only allocated (keeping uids aligned), and stays pending until
+    a later run has something to solve.
+    """
+    project.session("prepare", params=params)
+
+    build = project.session("build", params=params)
+    if not build.is_done():
+        build.start()
+        record_build_parameters(build, params)
+        build.done()
+
+
+def pending_sessions(
+    identifier_simulation_dict: dict, params: dict, project: Project
+) -> dict:
+    """The sessions of the analyses of `params` that are not done yet."""
+    pending = {}
+    for identifier in identifier_simulation_dict:
+        session = project.session(identifier, params=params)
+        if not session.is_done():
+            pending[identifier] = session
+    return pending
+
+
+def simulations_phase(
+    identifier_simulation_dict,
+    params: dict,
+    run_params: PyaedtFileParameters,
+    keep_hfss_solutions: bool,
+    project: Project,
+    pipeline: PostProcessingPipeline,
+    cache: CachedTemplate | None = None,
+    mesh_seed: MeshSeed | None = None,
+    telemetry: Telemetry = NO_TELEMETRY,
+) -> list[str]:
+    """Run the pending analyses of one iteration; return the designs solved."""
+    designs = []
+
+    # the cache was checked before the project was prepared; it only stores
+    # the results of these analyses
+    pending = pending_sessions(identifier_simulation_dict, params, project)
+    for identifier, session in pending.items():
+        simulation = identifier_simulation_dict[identifier]
+        designs.append(simulation.design_name)
+
+        if mesh_seed is not None and getattr(simulation, "reuse_mesh", False):
+            simulation = simulation.model_copy(update={"mesh_seed": mesh_seed})
+
+        on_done = None
+        if cache is not None:
+            on_done = partial(cache.store, params, simulation)
+
+        run_params.design_name = simulation.design_name
+        with (
+            telemetry.phase("simulate", params, identifier),
+            run_params.open_pyaedt_file() as hfss,
+        ):
+            session.start()
+            collected = simulation.collect(hfss=hfss)
+
+        # post-processing and saving, possibly on the background pool
+        pipeline.submit(
+            session, simulation, collected, session.path(suffix=".json"), on_done
+        )
+
+    if not keep_hfss_solutions and designs:
+        with telemetry.phase("cleanup", params):
+            cleanup_solutions(run_params, designs)
+
+    return designs
+
+
+def cleanup_solutions(run_params: PyaedtFileParameters, designs: list[str]):
+    with run_params.open_pyaedt_file() as hfss:
+        for design_name in set(designs):
+            hfss.set_active_design(design_name)
+            hfss.cleanup_solution()
+
+
+def mesh_seed(builder, params: dict, run_params: PyaedtFileParameters) -> MeshSeed:
+    """The solved project of `params`, and the design variables it was solved at."""
+    variables = {}
+    if isinstance(builder, DesignVariableBuilder):
+        variables = format_variables(params)
+    return MeshSeed(project=run_params.file_path, variables=variables)
+
+
+def fan_out_phase(
+    identifier_simulation_dict: dict,
+    params: dict,
+    representative: dict,
+    project: Project,
+):
+    """
+    Record a duplicate sweep point without solving it.
+
+    The duplicate keeps its own sessions (and thus its own uid and
+    ``build_parameters.json`` with the values as written), while its results
+    are copies of the representative's.
+    """
+    prepare = project.session("prepare", params=params)
+    if not prepare.is_done():
+        source = project.session("prepare", params=representative)
+        prepare.start()
+        prepare.attach_files(source.files)
+        prepare.done()
+
+    build = project.session("build", params=params)
+    if not build.is_done():
+        build.start()
+        record_build_parameters(build, params)
+        build.done()
+
+    for identifier in identifier_simulation_dict:
+        session = project.session(identifier, params=params)
+        source = project.session(identifier, params=representative)
+        if session.is_done() or not source.is_done():
+            continue
+
+        session.start()
+        path = session.path(suffix=".json")
+        copy_result(source.files["data"], path)
+        session.attach_files({"data": path})
+        session.done()
+
+
+@dataclass
+class CachedTemplate:
+    """A result cache bound to the digest of the workflow's template."""
+
+    cache: ResultCache
+    template_digest: str
+
+    def key(self, params: dict, simulation) -> str:
+        return self.cache.key(self.template_digest, params, simulation)
+
+    def store(self, params: dict, simulation, path: Path) -> None:
+        self.cache.put(self.key(params, simulation), path)
+
+
+def restore_from_cache(
+    cache: CachedTemplate,
+    params: dict,
+    identifier_simulation_dict: dict,
+    pending: dict,
+) -> bool:
+    """
+    Copy cached results into every pending session, only if all of them hit.
+    A partial hit is not enough: later analyses (e.g. QuantumEPR) read the
+    solution left in the project by earlier ones.
+    """
+    hits = {}
+    for identifier in pending:
+        hit = cache.cache.get(cache.key(params, identifier_simulation_dict[identifier]))
+        if hit is None:
+            return False
+        hits[identifier] = hit
+
+    for identifier, hit in hits.items():
+        session = pending[identifier]
+        session.start()
+        path = session.path(suffix=".json")
+        copy_result(hit, path)
+        session.attach_files({"data": path})
+        session.done()
+    return True
+
+
+def aggregation_phase(
+    aggregations: list[IncrementalAggregation | ConsolidatedStore],
+    telemetry: Telemetry = NO_TELEMETRY,
+    final: bool = False,
+) -> None:
+    """Append the newly finished runs to every aggregation."""
+    for aggregation in aggregations:
+        with telemetry.phase("aggregate", identifier=aggregation.name):
+            if isinstance(aggregation, ConsolidatedStore):
+                aggregation.update()
+            else:
+                aggregation.update(final=final)
+
+
+def read_flat_result(project: Project, identifier: str, params: dict) -> dict:
+    session = project.session(identifier, params=params)
+    result = load_result(session.files["data"], SIMULATION_RESULTS_ADAPTER)
+    return result.flatten()
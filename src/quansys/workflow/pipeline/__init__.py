@@ -0,0 +1,4 @@
+from .config import PipelineConfig
+from .executor import PostProcessingPipeline
+
+__all__ = ["PipelineConfig", "PostProcessingPipeline"]
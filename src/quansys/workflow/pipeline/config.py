@@ -0,0 +1,23 @@
+from pydantic import BaseModel, Field
+
+
+class PipelineConfig(BaseModel):
+    """
+    Configuration for overlapping HFSS solves with CPU post-processing.
+
+    When enabled, the HFSS-bound part of every analysis (`collect`) runs in the
+    main process, while the CPU-only part (`post_process`, e.g. the EPR
+    diagonalization) and the result writing run on a background process pool.
+    The next iteration's build and solve start without waiting for them.
+
+    Attributes:
+        enabled: If True, post-processing runs on the background pool. default: False
+        workers: Number of background post-processing processes. default: 1
+        max_pending: Maximum number of post-processing jobs in flight. When reached,
+            the workflow waits for the oldest job before continuing, so memory stays
+            bounded. default: 2
+    """
+
+    enabled: bool = False
+    workers: int = Field(1, ge=1)
+    max_pending: int = Field(2, ge=1)
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import Future, ProcessPoolExecutor
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Any, Self
+
+from pycaddy.project import Session
+
+from ...simulation import BaseAnalysis
+from ...simulation.storage import ArrayStorage, save_result
+from .config import PipelineConfig
+
+OnDone = Callable[[Path], None]
+
+
+def post_process_and_save(
+    simulation: BaseAnalysis, collected: Any, path: Path, arrays: ArrayStorage = "json"
+) -> Path:
+    """Finish an analysis from its collected data and write the JSON result."""
+    result = simulation.post_process(collected)
+    return save_result(path, result, arrays)
+
+
+class PostProcessingPipeline:
+    """
+    Bounded queue of post-processing jobs, backed by a process pool.
+
+    Sessions are marked done (and their result file attached) only in the
+    main process, after the corresponding job has finished. A job that never
+    finishes leaves its session running, so it is re-run on resume.
+
+    With a disabled config, every job runs inline on `submit`, which is the
+    plain sequential behaviour. `arrays` selects where result arrays are
+    stored (see `quansys.simulation.storage`). `listeners` are called with
+    every session marked done.
+    """
+
+    def __init__(
+        self,
+        config: PipelineConfig,
+        arrays: ArrayStorage = "json",
+        listeners: tuple[Callable[[Session], None], ...] = (),
+    ):
+        self.config = config
+        self.arrays = arrays
+        self.listeners = list(listeners)
+        self._pending: deque[tuple[Session, Future, OnDone | None]] = deque()
+        self._executor: ProcessPoolExecutor | None = None
+
+        if config.enabled:
+            # spawn keeps the workers free of the parent's AEDT/gRPC state
+            self._executor = ProcessPoolExecutor(
+                max_workers=config.workers, mp_context=get_context("spawn")
+            )
+
+    def submit(
+        self,
+        session: Session,
+        simulation: BaseAnalysis,
+        collected: Any,
+        path: Path,
+        on_done: OnDone | None = None,
+    ) -> None:
+        """
+        Queue the post-processing of `collected` into `path`.
+
+        `on_done(path)` is called in the main process once the session has
+        been marked done.
+        """
+        if self._executor is None:
+            path = post_process_and_save(simulation, collected, path, self.arrays)
+            self._finalize(session, path, on_done)
+            return
+
+        while len(self._pending) >= self.config.max_pending:
+            self._complete_oldest()
+
+        future = self._executor.submit(
+            post_process_and_save, simulation, collected, path, self.arrays
+        )
+        self._pending.append((session, future, on_done))
+
+    def drain(self) -> None:
+        """Wait for every pending job and finalize its session."""
+        while self._pending:
+            self._complete_oldest()
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type, *_) -> None:
+        try:
+            if exc_type is None:
+                self.drain()
+        finally:
+            self.close()
+
+    def _complete_oldest(self) -> None:
+        session, future, on_done = self._pending.popleft()
+        try:
+            path = future.result()
+        except Exception:
+            session.error()
+            raise
+        self._finalize(session, path, on_done)
+
+    def _finalize(self, session: Session, path: Path, on_done: OnDone | None) -> None:
+        session.attach_files({"data": path})
+        session.done()
+        if on_done is not None:
+            on_done(path)
+        for listener in self.listeners:
+            listener(session)
@@ -1,3 +1,4 @@
 from .config import PrepareFolderConfig
+from .transfer import TransferStats, place_project, summarize
 
-__all__ = ["PrepareFolderConfig"]
+__all__ = ["PrepareFolderConfig", "TransferStats", "place_project", "summarize"]
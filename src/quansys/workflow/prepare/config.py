@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic import BaseModel
 
 
@@ -8,10 +10,24 @@ class PrepareFolderConfig(BaseModel):
     This determines how the working directory is initialized
     before the simulation is executed.
 
+    Only the `.aedt` project definition is placed in each run folder; the
+    template's `.aedtresults` (solved data) is never copied.
+
     Attributes:
         copy_enabled: If True, the source AEDT file will be copied; otherwise, it runs in-place.
         dest_name: Filename to use for the copied AEDT file inside each simulation folder.
+        link_mode: How the project file is placed in each run folder.
+
+            - `auto`: copy-on-write clone (reflink) where the filesystem supports it
+              (btrfs, XFS, ...), otherwise a plain copy.
+            - `copy`: always a plain copy.
+
+            Every run folder gets its own file, as AEDT saves into the project
+            it opened.
+
+            default: 'auto'
     """
 
     copy_enabled: bool = True  # switch off to run in-place
     dest_name: str = "build.aedt"  # file name inside each run folder
+    link_mode: Literal["auto", "copy"] = "auto"
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import errno
+import shutil
+import sys
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+# linux/fs.h: _IOW(0x94, 9, int)
+FICLONE = 0x40049409
+
+# errors meaning "this filesystem (pair) cannot do it", not "something is wrong"
+_UNSUPPORTED = {
+    errno.EXDEV,
+    errno.EOPNOTSUPP,
+    errno.ENOTTY,
+    errno.EINVAL,
+    errno.EPERM,
+    errno.EMLINK,
+}
+
+
+@dataclass
+class TransferStats:
+    """What placing one project file in a run folder cost."""
+
+    method: str
+    bytes_written: int
+    seconds: float
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+def place_project(src: Path, dest: Path, link_mode: str = "auto") -> TransferStats:
+    """
+    Place the project definition `src` (the ``.aedt`` file only) at `dest`.
+
+    Solved data lives next to the project in ``<name>.aedtresults`` and is
+    never carried along. Depending on `link_mode`:
+
+    * ``"auto"`` – reflink (copy-on-write clone) when the filesystem supports
+      it (btrfs, XFS, ...), otherwise a plain copy.
+    * ``"copy"`` – always a plain copy.
+
+    Returns:
+        TransferStats: the method used, bytes written and time spent.
+    """
+    start = time.perf_counter()
+    method = "copy"
+
+    if link_mode == "auto" and _reflink(src, dest):
+        method = "reflink"
+    else:
+        shutil.copy2(src, dest)
+
+    bytes_written = dest.stat().st_size if method == "copy" else 0
+    return TransferStats(method, bytes_written, time.perf_counter() - start)
+
+
+def _reflink(src: Path, dest: Path) -> bool:
+    if not sys.platform.startswith("linux"):
+        return False
+
+    import fcntl
+
+    with open(src, "rb") as fsrc, open(dest, "wb") as fdest:
+        try:
+            fcntl.ioctl(fdest.fileno(), FICLONE, fsrc.fileno())
+        except OSError as e:
+            if e.errno not in _UNSUPPORTED:
+                raise
+            failed = True
+        else:
+            failed = False
+
+    if failed:
+        dest.unlink()
+        return False
+
+    shutil.copystat(src, dest)
+    return True
+
+
+def summarize(stats: list[TransferStats]) -> str:
+    """One-line summary of the prepare phases of a run, e.g. for logging."""
+    methods = {}
+    for s in stats:
+        methods[s.method] = methods.get(s.method, 0) + 1
+
+    by_method = ", ".join(f"{count} {method}" for method, count in methods.items())
+    megabytes = sum(s.bytes_written for s in stats) / 1e6
+    seconds = sum(s.seconds for s in stats)
+    return (
+        f"prepare: {len(stats)} project(s) placed ({by_method}), "
+        f"{megabytes:.1f} MB written in {seconds:.2f} s"
+    )
@@ -0,0 +1,3 @@
+from .index import PROGRESS_FILE, ProgressIndex, expected_runs
+
+__all__ = ["PROGRESS_FILE", "ProgressIndex", "expected_runs"]
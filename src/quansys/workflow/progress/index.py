@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import json
+import os
+import time
+from collections import deque
+from datetime import datetime
+from pathlib import Path
+
+from pycaddy.ledger import Ledger, Status
+from pycaddy.project import Session
+
+from ..config import WorkflowConfig
+from ..sweep import AdaptiveSweep
+
+PROGRESS_FILE = "progress.json"
+ITERATIONS = Path("iterations")
+
+
+def expected_runs(
+    config: WorkflowConfig, points: int, adaptive: AdaptiveSweep | None = None
+) -> dict[str, int]:
+    """
+    Runs each identifier is expected to record under ``iterations``. With an
+    `AdaptiveSweep` this is the upper bound set by its budget.
+    """
+    if adaptive is not None:
+        points *= adaptive.budget
+
+    totals = {"prepare": points, "build": points}
+    totals.update({identifier: points for identifier in config.simulations})
+    if config.screening is not None:
+        screening = config.screening
+        for identifier in screening.screening_simulations(config.simulations):
+            totals[identifier] = points
+        if screening.top_k is not None:
+            totals.update({i: min(screening.top_k, points) for i in config.simulations})
+    return totals
+
+
+class ProgressIndex:
+    """
+    Small summary of a running workflow's progress, kept in
+    ``<root_folder>/progress.json`` so `quansys status` never has to read the
+    ledger.
+
+    It is seeded from the ledger, then follows the run: it is a `Telemetry`
+    listener, for the running and failed phases, and a
+    `PostProcessingPipeline` listener (`finished`), since an analysis is only
+    done once its result is post-processed and saved. The file is rewritten
+    atomically, so readers always see a complete one, and at most every
+    `min_interval` seconds.
+
+    Per identifier the file holds the expected total, the number of finished
+    and failed runs, the start time of the running one, and the completion
+    times of the last `window` runs (for throughput).
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        totals: dict[str, int],
+        window: int = 100,
+        min_interval: float = 5.0,
+    ):
+        self.path = Path(path)
+        self.totals = totals
+        self.min_interval = min_interval
+        self._written = float("-inf")
+        self.started = datetime.now().isoformat(timespec="seconds")
+        self.done: dict[str, set[str]] = {i: set() for i in totals}
+        self.failed: dict[str, set[str]] = {i: set() for i in totals}
+        self.running: dict[str, str] = {}
+        self.recent: dict[str, deque] = {i: deque(maxlen=window) for i in totals}
+
+    def sync(self, ledger: Ledger) -> None:
+        """Recount finished and failed runs from the ledger, then write."""
+        for identifier in self.totals:
+            records = ledger.get_uid_record_dict(identifier, relpath=ITERATIONS)
+            statuses = [(r.param_hash, r.status) for r in records.values()]
+            self.done[identifier] = {h for h, s in statuses if s == Status.DONE}
+            self.failed[identifier] = {h for h, s in statuses if s == Status.ERROR}
+        self.flush()
+
+    def __call__(self, event: dict) -> None:
+        # prepare/build are ledger identifiers of their own
+        phase, params_hash = event["phase"], event["params_hash"]
+        identifier = event["identifier"] if phase == "simulate" else phase
+        if params_hash is None or identifier not in self.totals:
+            return
+
+        outcome = event["outcome"]
+        if outcome == "running":
+            self.running[identifier] = event["timestamp"]
+        else:
+            self.running.pop(identifier, None)
+            if outcome != "ok":
+                self.failed[identifier].add(params_hash)
+            elif phase != "simulate":
+                # a simulation is done once saved, see `finished`
+                self._complete(identifier, params_hash)
+        self.write()
+
+    def finished(self, session: Session) -> None:
+        """Count the run of a session the pipeline has marked done."""
+        if session.identifier in self.totals and session.param_hash is not None:
+            self._complete(session.identifier, session.param_hash)
+            self.write()
+
+    def _complete(self, identifier: str, params_hash: str) -> None:
+        # a resumed, already finished run is not a completion
+        if params_hash not in self.done[identifier]:
+            self.done[identifier].add(params_hash)
+            self.failed[identifier].discard(params_hash)
+            self.recent[identifier].append(time.time())
+
+    def to_dict(self) -> dict:
+        return {
+            "started": self.started,
+            "updated": time.time(),
+            "identifiers": {
+                identifier: {
+                    "total": total,
+                    "done": len(self.done[identifier]),
+                    "failed": len(self.failed[identifier]),
+                    "running_since": self.running.get(identifier),
+                    "recent": list(self.recent[identifier]),
+                }
+                for identifier, total in self.totals.items()
+            },
+        }
+
+    def write(self) -> None:
+        """Rewrite the file, unless it was within the last `min_interval` s."""
+        if time.monotonic() - self._written >= self.min_interval:
+            self.flush()
+
+    def flush(self) -> None:
+        self._written = time.monotonic()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(f".{self.path.name}.{os.getpid()}")
+        tmp.write_text(json.dumps(self.to_dict()))
+        os.replace(tmp, self.path)
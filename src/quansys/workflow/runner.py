@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+from pycaddy.project import Project
+
+from .session_handler import PyaedtFileParameters
+from .config import WorkflowConfig
+from .prepare import TransferStats
+from .pipeline import PostProcessingPipeline
+from .telemetry import NO_TELEMETRY, Telemetry
+from .aggregation import IncrementalAggregation
+from .phases import (
+    CachedTemplate,
+    aggregation_phase,
+    build_phase,
+    cleanup_solutions,
+    mesh_seed,
+    pending_sessions,
+    prepare_folder_phase,
+    restore_from_cache,
+    simulations_phase,
+    skip_prepare_and_build,
+)
+from ..simulation.eigenmode import MeshSeed
+
+
+@dataclass
+class _MeshSource:
+    """A solved iteration, kept until the next one has reused its mesh."""
+
+    mesh: MeshSeed
+    run_params: PyaedtFileParameters
+    designs: list[str]
+    params: dict
+
+
+@dataclass
+class IterationRunner:
+    """Runs phases 1-3 for one sweep point at a time."""
+
+    config: WorkflowConfig
+    project: Project
+    pipeline: PostProcessingPipeline
+    cache: CachedTemplate | None
+    transfers: list[TransferStats]
+    reuse_mesh: bool = False
+    telemetry: Telemetry = NO_TELEMETRY
+    aggregations: list[IncrementalAggregation] = field(default_factory=list)
+
+    # the last solved iteration, whose solution seeds the next mesh
+    seed: _MeshSource | None = None
+
+    def run(self, params: dict, simulations: dict | None = None) -> None:
+        config = self.config
+        simulations = config.simulations if simulations is None else simulations
+
+        # nothing to solve (all done, or all restored from the cache): neither
+        # the project copy nor AEDT is needed
+        pending = pending_sessions(simulations, params, self.project)
+        if not pending or (
+            self.cache is not None
+            and restore_from_cache(self.cache, params, simulations, pending)
+        ):
+            skip_prepare_and_build(params, self.project)
+            aggregation_phase(self.aggregations, self.telemetry)
+            return
+
+        # 1. PREPARE (copy template .aedt if policy allows)
+        placed = self.project.session("prepare", params=params).is_done()
+        with self.telemetry.phase("prepare", params):
+            run_params = prepare_folder_phase(
+                cfg=config.prepare_folder,
+                pyaedt=config.pyaedt_file_parameters,
+                params=params,
+                project=self.project,
+                transfers=self.transfers,
+            )
+
+        # 2. BUILD (apply parameter sweep values); a project copied just now
+        # is built even if a cache hit has recorded the build already
+        with self.telemetry.phase("build", params):
+            build_phase(
+                config.builder, run_params, params, self.project, rebuild=not placed
+            )
+
+        # 3. SIMULATIONS
+        solved = simulations_phase(
+            simulations,
+            params,
+            run_params.model_copy(),
+            config.keep_hfss_solutions or self.reuse_mesh,
+            self.project,
+            self.pipeline,
+            self.cache,
+            mesh_seed=self.seed.mesh if self.seed else None,
+            telemetry=self.telemetry,
+        )
+
+        # keep this solution until the next point has used it
+        if self.reuse_mesh and solved:
+            self.close()
+            self.seed = _MeshSource(
+                mesh_seed(config.builder, params, run_params),
+                run_params,
+                solved,
+                params,
+            )
+
+        # 4. AGGREGATION, as results come in
+        aggregation_phase(self.aggregations, self.telemetry)
+
+    def close(self) -> None:
+        """Clean up the solution kept for mesh reuse, if any."""
+        if self.seed and not self.config.keep_hfss_solutions:
+            with self.telemetry.phase("cleanup", self.seed.params):
+                cleanup_solutions(self.seed.run_params, self.seed.designs)
+        self.seed = None
@@ -0,0 +1,4 @@
+from .config import ScreeningConfig
+from .select import select_points
+
+__all__ = ["ScreeningConfig", "select_points"]
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from pydantic import BaseModel, Field, model_validator
+
+
+class ScreeningConfig(BaseModel):
+    """
+    Configuration for a two-stage, multi-fidelity sweep.
+
+    Every sweep point is first solved cheaply: each simulation runs as
+    `<identifier><suffix>` with `setup_parameters` applied on top of its own.
+    Only the points selected from the screening results are then solved at
+    full fidelity under their original identifiers. Both stages are stored
+    side by side in each iteration, so aggregation can compare them.
+
+    Points are selected either by the `top_k` best values of `metric`, or by a
+    `predicate` function called as `predicate(parameters, results) -> bool`,
+    where `results` is the flattened screening result of `identifier`.
+
+    Attributes:
+        identifier: Simulation identifier whose screening results drive the selection.
+        setup_parameters: HFSS setup overrides for the screening stage.
+            default: {'MaximumPasses': 3, 'MaxDeltaFreq': 5}
+        suffix: Suffix of the screening stage identifiers. default: '_screening'
+        metric: Key of the ranking quantity in the flattened screening results
+            (e.g. 'Mode 1 Quality Factor'). Used with `top_k`.
+        top_k: Number of points refined at full fidelity. Used with `metric`.
+        maximize: If True the largest `metric` values are selected, otherwise the
+            smallest. default: True
+        predicate: Selection function as 'module:function', instead of `metric`/`top_k`.
+    """
+
+    identifier: str
+    setup_parameters: dict = {"MaximumPasses": 3, "MaxDeltaFreq": 5}
+    suffix: str = "_screening"
+    metric: str | None = None
+    top_k: int | None = Field(None, ge=1)
+    maximize: bool = True
+    predicate: str | None = None
+
+    @model_validator(mode="after")
+    def _check_selection(self) -> ScreeningConfig:
+        ranked = self.metric is not None and self.top_k is not None
+        if ranked == (self.predicate is not None):
+            raise ValueError("set either metric and top_k, or predicate")
+        if self.predicate is not None and ":" not in self.predicate:
+            raise ValueError("predicate must be given as 'module:function'")
+        return self
+
+    def screening_simulations(self, simulations: dict) -> dict:
+        """The screening stage: every simulation, renamed and with the overrides."""
+        screening = {}
+        for identifier, simulation in simulations.items():
+            if hasattr(simulation, "setup_parameters"):
+                simulation = simulation.model_copy(
+                    update={
+                        "setup_parameters": {
+                            **simulation.setup_parameters,
+                            **self.setup_parameters,
+                        }
+                    }
+                )
+            screening[identifier + self.suffix] = simulation
+        return screening
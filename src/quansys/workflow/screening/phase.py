@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import shutil
+
+from pycaddy.load import load_json
+from pycaddy.project import Project
+from pycaddy.save import save_json
+
+from ..config import WorkflowConfig
+from ..prepare import place_project
+from ..phases import read_flat_result
+from ..runner import IterationRunner
+from ..sweep import AdaptiveSweep
+from ...simulation.base import set_design_and_get_setup
+from .config import ScreeningConfig
+from .select import select_points
+
+
+def validate_screening(config: WorkflowConfig, adaptive: AdaptiveSweep | None):
+    if config.multi_variation.enabled or adaptive is not None:
+        raise ValueError(
+            "screening cannot be combined with multi_variation or an AdaptiveSweep"
+        )
+    if config.screening.identifier not in config.simulations:
+        raise ValueError(
+            f"screening identifier {config.screening.identifier!r} is not one of the "
+            f"simulations: {list(config.simulations)}"
+        )
+
+
+def screening_phase(
+    runner: IterationRunner,
+    points: list[dict],
+    screening: ScreeningConfig,
+    project: Project,
+) -> None:
+    """Screen every point cheaply, then solve the selected ones at full fidelity."""
+    config = runner.config
+
+    # stage 1: every point, with the cheap setup overrides
+    screening_simulations = screening.screening_simulations(config.simulations)
+    for params in points:
+        runner.run(params, screening_simulations)
+
+    runner.pipeline.drain()
+    results = [
+        read_flat_result(runner.project, screening.identifier + screening.suffix, p)
+        for p in points
+    ]
+    selected = set(select_points(points, results, screening))
+
+    # stage 2: full-fidelity sessions are allocated for every point, so their
+    # uids line up, but only the selected ones are run
+    full = None
+    for index, params in enumerate(points):
+        if index not in selected:
+            for identifier in config.simulations:
+                runner.project.session(identifier, params=params)
+            continue
+
+        # the screening overrides were saved into each iteration's project
+        if full is None:
+            full = _full_fidelity_simulations(config, screening, project)
+        runner.run(params, full)
+
+
+def _full_fidelity_simulations(
+    config: WorkflowConfig, screening: ScreeningConfig, project: Project
+) -> dict:
+    """
+    The simulations with the template's values of every overridden setup
+    parameter made explicit, undoing the screening overrides.
+    """
+    keys = sorted(screening.setup_parameters)
+    targets = {
+        identifier: (simulation.design_name, simulation.setup_name)
+        for identifier, simulation in config.simulations.items()
+        if hasattr(simulation, "setup_parameters")
+    }
+
+    session = project.sub("screening").session(
+        "setup_defaults",
+        params={"keys": keys, "setups": sorted(set(targets.values()))},
+    )
+    if not session.is_done():
+        session.start()
+
+        # read from a throwaway copy: opening the template would save it
+        dest = session.path("template.aedt", include_identifier=False)
+        place_project(config.pyaedt_file_parameters.file_path, dest, "auto")
+        defaults = {}
+        with config.pyaedt_file_parameters.model_copy(
+            update={"file_path": dest}
+        ).open_pyaedt_file() as hfss:
+            for design_name, setup_name in set(targets.values()):
+                setup = set_design_and_get_setup(hfss, design_name, setup_name)
+                defaults[f"{design_name}:{setup_name}"] = {
+                    key: setup.props[key] for key in keys if key in setup.props
+                }
+        shutil.rmtree(dest.with_suffix(".aedtresults"), ignore_errors=True)
+        dest.unlink(missing_ok=True)
+
+        path = session.path("defaults.json")
+        save_json(path, defaults)
+        session.attach_files({"data": path})
+        session.done()
+
+    defaults = load_json(session.files["data"])
+    full = dict(config.simulations)
+    for identifier, (design_name, setup_name) in targets.items():
+        simulation = full[identifier]
+        full[identifier] = simulation.model_copy(
+            update={
+                "setup_parameters": {
+                    **defaults[f"{design_name}:{setup_name}"],
+                    **simulation.setup_parameters,
+                }
+            }
+        )
+    return full
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import importlib
+from collections.abc import Callable
+
+from .config import ScreeningConfig
+
+
+def load_predicate(spec: str) -> Callable[[dict, dict], bool]:
+    """Import a 'module:function' selection predicate."""
+    module, function = spec.split(":", 1)
+    imported_module = importlib.import_module(module)
+    try:
+        return getattr(imported_module, function)
+    except AttributeError:
+        raise AttributeError(f"Function '{function}' not found in module '{module}'.")
+
+
+def select_points(
+    points: list[dict], results: list[dict], screening: ScreeningConfig
+) -> list[int]:
+    """
+    Indices of the points to solve at full fidelity, in sweep order.
+
+    Args:
+        points: Sweep points, as passed to the builder.
+        results: Flattened screening results of `screening.identifier`, one per point.
+        screening: The selection rule.
+    """
+    if screening.predicate is not None:
+        predicate = load_predicate(screening.predicate)
+        return [
+            i
+            for i, (params, result) in enumerate(zip(points, results))
+            if predicate(params, result)
+        ]
+
+    missing = [i for i, result in enumerate(results) if screening.metric not in result]
+    if missing:
+        raise ValueError(
+            f"metric {screening.metric!r} missing from the screening results "
+            f"of {len(missing)} point(s); available: {list(results[missing[0]])}"
+        )
+
+    ranked = sorted(
+        range(len(results)),
+        key=lambda i: results[i][screening.metric],
+        reverse=screening.maximize,
+    )
+    return sorted(ranked[: screening.top_k])
@@ -0,0 +1,35 @@
+from typing import Annotated, TypeAlias
+
+from pycaddy.sweeper import DictSweep
+from pydantic import Discriminator, Tag
+
+from .adaptive import AdaptiveSweep
+from .dedup import deduplicate, normalize_params, params_key
+from .ordering import SweepOrder, order_by_similarity, order_points
+from .points import expand_sweep
+
+
+def _sweep_kind(value) -> str:
+    kind = (
+        value.get("type") if isinstance(value, dict) else getattr(value, "type", None)
+    )
+    return "adaptive" if kind == "adaptive" else "dict"
+
+
+# DictSweep has no `type` field; anything not tagged "adaptive" is a DictSweep
+SUPPORTED_SWEEPS: TypeAlias = Annotated[
+    Annotated[DictSweep, Tag("dict")] | Annotated[AdaptiveSweep, Tag("adaptive")],
+    Discriminator(_sweep_kind),
+]
+
+__all__ = [
+    "SUPPORTED_SWEEPS",
+    "AdaptiveSweep",
+    "SweepOrder",
+    "deduplicate",
+    "expand_sweep",
+    "normalize_params",
+    "order_by_similarity",
+    "order_points",
+    "params_key",
+]
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+from itertools import pairwise
+from typing import Literal
+
+import numpy as np
+from pydantic import BaseModel, Field, model_validator
+
+
+class AdaptiveSweep(BaseModel):
+    """
+    Sweep one parameter adaptively, guided by the results seen so far.
+
+    The parameter is first sampled at `initial_points` evenly spaced values
+    between `start` and `stop`. Then, one point at a time, the interval
+    between two neighbouring samples that is resolved worst is bisected:
+
+    * without `target_value`, the interval where `target` changes the most;
+    * with `target_value`, the widest interval where `target` crosses it.
+
+    Refinement stops once `budget` points have been solved, or when no interval
+    changes `target` by more than `tolerance` (or is wider than `min_step`).
+
+    Used as an entry of `WorkflowConfig.builder_sweep`, it refines the
+    parameter for every combination produced by the other sweepers. Each
+    solved point is an ordinary iteration, so resuming replays the same
+    proposals from the stored results.
+
+    Attributes:
+        type: Identifier for this sweep type.
+        parameter: Name of the swept parameter (as passed to the builder).
+        start: Lower bound of the parameter, in `unit`.
+        stop: Upper bound of the parameter, in `unit`.
+        unit: Unit appended to the values handed to the builder (e.g. 'mm');
+            if empty, plain floats are used. default: ''
+        identifier: Simulation identifier whose results drive the refinement.
+        target: Key of the target quantity in that simulation's flattened results
+            (e.g. 'Mode 1 Freq. (GHz)').
+        target_value: If set, refine around the parameter values where `target`
+            crosses this value, instead of where it changes fastest. default: None
+        initial_points: Number of evenly spaced initial samples. default: 5
+        budget: Maximum number of solved points, initial ones included. default: 20
+        tolerance: Intervals whose change in `target` is at most this are
+            considered resolved. default: 0.0
+        min_step: Intervals narrower than this (in `unit`) are never split. default: 0.0
+    """
+
+    type: Literal["adaptive"] = "adaptive"
+    parameter: str
+    start: float
+    stop: float
+    unit: str = ""
+    identifier: str
+    target: str
+    target_value: float | None = None
+    initial_points: int = Field(5, ge=2)
+    budget: int = Field(20, ge=2)
+    tolerance: float = Field(0.0, ge=0)
+    min_step: float = Field(0.0, ge=0)
+
+    @model_validator(mode="after")
+    def _check_range(self) -> AdaptiveSweep:
+        if self.stop <= self.start:
+            raise ValueError("stop must be greater than start")
+        if self.budget < self.initial_points:
+            raise ValueError("budget must be at least initial_points")
+        return self
+
+    def initial(self) -> list[float]:
+        """The evenly spaced initial samples."""
+        return [
+            _round(x) for x in np.linspace(self.start, self.stop, self.initial_points)
+        ]
+
+    def point(self, base: dict, x: float) -> dict:
+        """The builder parameters for sample `x` on top of `base`."""
+        value = f"{_round(x):.12g}{self.unit}" if self.unit else _round(x)
+        return {**base, self.parameter: value}
+
+    def propose(self, samples: dict[float, float]) -> float | None:
+        """
+        The next sample, given the target value at every solved sample.
+
+        Returns:
+            The parameter value to solve next, or None once the budget is used
+            up or every interval is resolved.
+        """
+        if len(samples) >= self.budget:
+            return None
+
+        xs = sorted(samples)
+        smallest = max(self.min_step, 1e-9 * (self.stop - self.start))
+
+        best, best_score = None, 0.0
+        for x0, x1 in pairwise(xs):
+            y0, y1 = samples[x0], samples[x1]
+            if x1 - x0 <= smallest or abs(y1 - y0) <= self.tolerance:
+                continue
+
+            if self.target_value is None:
+                score = abs(y1 - y0)
+            elif (y0 - self.target_value) * (y1 - self.target_value) <= 0:
+                score = x1 - x0
+            else:
+                continue
+
+            if score > best_score:
+                best, best_score = (x0, x1), score
+
+        if best is None:
+            return None
+        return _round((best[0] + best[1]) / 2)
+
+
+def _round(x: float) -> float:
+    # stable, readable values: the same sample always hashes the same
+    return float(f"{x:.12g}")
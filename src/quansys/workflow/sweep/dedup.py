@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from pycaddy.dict_utils import flatten, hash_dict, unflatten
+
+from ..builder.design_variables_handler import normalize_value
+
+
+def normalize_params(params: dict) -> dict:
+    """
+    Return a copy of `params` with every leaf value normalized to SI.
+
+    `Value`-like leaves ({"value": ..., "unit": ...}) are normalized as a whole,
+    so {"value": 10, "unit": "nH"}, "10nh" and 1e-8 all become 1e-08.
+    """
+    flat = flatten(params)
+
+    # fold {..., "value": v, "unit": u} leaves back into a single Value-like dict
+    values: dict[tuple, object] = {}
+    for key, value in flat.items():
+        if key[-1] == "unit" and key[:-1] + ("value",) in flat:
+            continue
+        if key[-1] == "value" and key[:-1] + ("unit",) in flat:
+            value = {"value": value, "unit": flat[key[:-1] + ("unit",)]}
+            key = key[:-1]
+        values[key] = normalize_value(value)
+
+    return unflatten(values)
+
+
+def params_key(params: dict) -> str:
+    """Hash of the normalized parameters; equal for physically identical points."""
+    return hash_dict(normalize_params(params))
+
+
+def deduplicate(
+    points: Iterable[dict],
+) -> tuple[list[dict], list[tuple[dict, dict]]]:
+    """
+    Split sweep points into unique points and duplicates.
+
+    The first occurrence of every normalized point is its representative.
+
+    Returns:
+        (unique points in their original order,
+         list of (duplicate point, representative point))
+    """
+    representatives: dict[str, dict] = {}
+    unique, duplicates = [], []
+
+    for params in points:
+        key = params_key(params)
+        if key in representatives:
+            duplicates.append((params, representatives[key]))
+        else:
+            representatives[key] = params
+            unique.append(params)
+
+    return unique, duplicates
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import json
+from typing import Literal
+
+import numpy as np
+from pycaddy.dict_utils import flatten
+
+from .dedup import normalize_params
+
+SweepOrder = Literal["auto", "sweep", "similarity"]
+
+
+def order_points(
+    points: list[dict], sweep_order: SweepOrder = "auto", reuse_mesh: bool = False
+) -> list[dict]:
+    """
+    The sweep points in the order `sweep_order` asks for. ``"auto"`` is
+    ``"similarity"`` when an analysis reuses meshes, as neighbouring points
+    must then run consecutively, and ``"sweep"`` otherwise.
+    """
+    if sweep_order == "similarity" or (sweep_order == "auto" and reuse_mesh):
+        return order_by_similarity(points)
+    return list(points)
+
+
+def order_by_similarity(points: list[dict]) -> list[dict]:
+    """
+    Reorder sweep points into a short path through parameter space.
+
+    A greedy nearest-neighbour tour starting at the first point. Values are
+    normalized to SI and every numeric parameter is scaled by its range, so
+    "3mm" vs "3.1mm" and "10nh" vs "11nh" weigh alike; non-numeric parameters
+    count 1 when they differ. Ties go to the earlier point, so the order is
+    deterministic for a given list of points.
+    """
+    if len(points) < 3:
+        return list(points)
+
+    rows = [flatten(normalize_params(params)) for params in points]
+    keys = sorted({key for row in rows for key in row}, key=str)
+
+    numeric, categorical = [], []
+    for key in keys:
+        values = [row.get(key) for row in rows]
+        if all(_is_number(v) for v in values):
+            numeric.append(values)
+        else:
+            codes = {}
+            categorical.append(
+                [codes.setdefault(_token(v), len(codes)) for v in values]
+            )
+
+    x = np.array(numeric, dtype=float).T.reshape(len(points), len(numeric))
+    span = x.max(axis=0) - x.min(axis=0)
+    x = x / np.where(span > 0, span, 1.0)
+    c = np.array(categorical, dtype=int).T.reshape(len(points), len(categorical))
+
+    visited = np.zeros(len(points), dtype=bool)
+    order = [0]
+    visited[0] = True
+    for _ in range(len(points) - 1):
+        last = order[-1]
+        distance = ((x - x[last]) ** 2).sum(axis=1) + (c != c[last]).sum(axis=1)
+        distance[visited] = np.inf
+        nearest = int(np.argmin(distance))
+        visited[nearest] = True
+        order.append(nearest)
+
+    return [points[i] for i in order]
+
+
+def _is_number(value) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _token(value) -> str:
+    return json.dumps(value, sort_keys=True, default=str)
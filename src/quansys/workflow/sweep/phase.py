@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from pycaddy.project import Project
+
+from ..config import WorkflowConfig
+from ..phases import read_flat_result
+from ..runner import IterationRunner
+from .adaptive import AdaptiveSweep
+
+
+def validate_adaptive(config: WorkflowConfig, adaptive: AdaptiveSweep) -> None:
+    if config.multi_variation.enabled:
+        raise ValueError("AdaptiveSweep cannot be combined with multi_variation")
+    if adaptive.identifier not in config.simulations:
+        raise ValueError(
+            f"AdaptiveSweep identifier {adaptive.identifier!r} is not one of the "
+            f"simulations: {list(config.simulations)}"
+        )
+
+
+def adaptive_phase(
+    runner: IterationRunner, base_points: list[dict], adaptive: AdaptiveSweep
+) -> None:
+    """Refine `adaptive.parameter` for every static sweep point."""
+    for base in base_points:
+        samples: dict[float, float] = {}
+        batch = adaptive.initial()
+
+        while batch:
+            for x in batch:
+                runner.run(adaptive.point(base, x))
+
+            # results must be on disk before they can drive the next proposal
+            runner.pipeline.drain()
+            for x in batch:
+                samples[x] = _read_target(
+                    runner.project, adaptive, adaptive.point(base, x)
+                )
+
+            proposal = adaptive.propose(samples)
+            batch = [] if proposal is None else [proposal]
+
+
+def _read_target(project: Project, adaptive: AdaptiveSweep, params: dict) -> float:
+    flat = read_flat_result(project, adaptive.identifier, params)
+    if adaptive.target not in flat:
+        raise ValueError(
+            f"AdaptiveSweep target {adaptive.target!r} not found in the results "
+            f"of {adaptive.identifier!r}: {list(flat)}"
+        )
+    return float(flat[adaptive.target])
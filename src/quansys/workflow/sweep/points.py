@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from pycaddy.sweeper import ChainSweep
+
+from .adaptive import AdaptiveSweep
+from .dedup import deduplicate
+
+
+def expand_sweep(
+    builder_sweep: list, deduplicate_sweep: bool = True
+) -> tuple[list[dict], list[tuple[dict, dict]], AdaptiveSweep | None]:
+    """
+    Expand `WorkflowConfig.builder_sweep` into the points to run.
+
+    Returns:
+        (unique static points, (duplicate, representative) pairs, the AdaptiveSweep
+         refining on top of the static points, if any)
+    """
+    # an adaptive sweep refines on top of every static sweep combination
+    adaptive = next((s for s in builder_sweep if isinstance(s, AdaptiveSweep)), None)
+    static = [s for s in builder_sweep if not isinstance(s, AdaptiveSweep)]
+
+    # physically identical points ("10nh", "10 nH", 1e-8) are solved once
+    points, duplicates = list(ChainSweep(sweepers=static).generate()), []
+    if deduplicate_sweep:
+        points, duplicates = deduplicate(points)
+
+    return points, duplicates, adaptive
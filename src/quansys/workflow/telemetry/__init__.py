@@ -0,0 +1,12 @@
+from .config import TelemetryConfig
+from .recorder import NO_TELEMETRY, PHASES, Telemetry
+from .report import load_events, summarize_events
+
+__all__ = [
+    "NO_TELEMETRY",
+    "PHASES",
+    "Telemetry",
+    "TelemetryConfig",
+    "load_events",
+    "summarize_events",
+]
@@ -0,0 +1,23 @@
+from pydantic import BaseModel, Field
+
+
+class TelemetryConfig(BaseModel):
+    """
+    Configuration for the per-phase telemetry stream of a workflow.
+
+    Off by default. When enabled, every phase of every iteration (prepare, build, simulate, cleanup) and every
+    aggregation appends one JSON line to `<root_folder>/<file_name>`, with its
+    wall time, CPU time, the peak resident memory of the AEDT child processes and
+    its outcome. Summarize it with `quansys report`. Requires psutil
+    (`pip install 'quansys[telemetry]'`).
+
+    Attributes:
+        enabled: If True, events are written. default: False
+        file_name: Name of the JSONL file inside the root folder. default: 'telemetry.jsonl'
+        interval: Seconds between samples of the child processes' memory and CPU time.
+            default: 0.5
+    """
+
+    enabled: bool = False
+    file_name: str = "telemetry.jsonl"
+    interval: float = Field(0.5, gt=0)
@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Self
+
+from pycaddy.dict_utils import hash_dict
+
+PHASES = ("prepare", "build", "simulate", "cleanup", "aggregate")
+
+
+def _require_psutil():
+    try:
+        import psutil
+    except ImportError as exc:
+        raise ImportError(
+            "Telemetry requires psutil: pip install 'quansys[telemetry]'"
+        ) from exc
+    return psutil
+
+
+class _ChildSampler(threading.Thread):
+    """
+    Polls the children of this process (AEDT and its solvers) while a phase runs,
+    keeping the peak of their summed RSS and the last CPU time seen per process.
+    """
+
+    def __init__(self, interval: float):
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.psutil = _require_psutil()
+        self.process = self.psutil.Process()
+        self.lock = threading.Lock()
+        self.wake = threading.Event()
+        self.stopped = False
+        self.active = False
+        self.peak_rss = 0
+        self.cpu: dict[int, float] = {}
+
+    def run(self) -> None:
+        while not self.stopped:
+            if self.active:
+                self.sample()
+            self.wake.wait(self.interval)
+            self.wake.clear()
+
+    def sample(self) -> None:
+        rss, cpu = 0, {}
+        for child in self.process.children(recursive=True):
+            try:
+                rss += child.memory_info().rss
+                times = child.cpu_times()
+                cpu[child.pid] = times.user + times.system
+            except self.psutil.Error:
+                # exited (or became inaccessible) while iterating
+                continue
+        with self.lock:
+            self.peak_rss = max(self.peak_rss, rss)
+            self.cpu.update(cpu)
+
+    def begin(self) -> dict[int, float]:
+        with self.lock:
+            self.peak_rss, self.cpu = 0, {}
+        self.sample()
+        with self.lock:
+            self.active = True
+            return dict(self.cpu)
+
+    def end(self) -> tuple[int, dict[int, float]]:
+        self.sample()
+        with self.lock:
+            self.active = False
+            return self.peak_rss, dict(self.cpu)
+
+    def stop(self) -> None:
+        self.stopped = True
+        self.wake.set()
+
+
+class Telemetry:
+    """
+    Append-only JSONL stream of workflow phase events.
+
+    One event per phase, with:
+
+    - `timestamp`: ISO time the phase started.
+    - `params_hash`: hash of the iteration parameters, the same as the ledger's
+      `param_hash`; null for phases that are not per iteration.
+    - `phase`: one of `PHASES`.
+    - `identifier`: the analysis identifier (or aggregation name), if any.
+    - `wall_s`: wall time.
+    - `cpu_s`: CPU time of this process plus of its child processes (AEDT).
+      CPU time of children that exit between two samples is not counted.
+    - `peak_rss_mb`: peak summed RSS of the child processes in MiB, sampled
+      every `interval` seconds.
+    - `outcome`: `ok`, or `error:<ExceptionType>`.
+
+    `listeners` are called with every event: once when the phase starts (with
+    outcome `running` and no measurements) and once when it ends. A disabled
+    instance (`path=None`) still informs its listeners, but measures nothing
+    and writes nothing.
+    """
+
+    def __init__(self, path: Path | None, interval: float = 0.5, listeners: tuple = ()):
+        self.path = None if path is None else Path(path)
+        self.interval = interval
+        self.listeners = list(listeners)
+        self._sampler: _ChildSampler | None = None
+
+    def __enter__(self) -> Self:
+        if self.path is not None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._sampler = _ChildSampler(self.interval)
+            self._sampler.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        if self._sampler is not None:
+            self._sampler.stop()
+            self._sampler.join()
+            self._sampler = None
+
+    @contextmanager
+    def phase(
+        self, phase: str, params: dict | None = None, identifier: str | None = None
+    ):
+        if self._sampler is None and not self.listeners:
+            yield
+            return
+
+        event = {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "params_hash": None if params is None else hash_dict(params),
+            "phase": phase,
+            "identifier": identifier,
+        }
+        self._notify({**event, "outcome": "running"})
+
+        start_wall, start_cpu = time.perf_counter(), time.process_time()
+        start_children = self._sampler.begin() if self._sampler else {}
+        outcome = "ok"
+        try:
+            yield
+        except BaseException as exc:
+            outcome = f"error:{type(exc).__name__}"
+            raise
+        finally:
+            peak_rss, children = self._sampler.end() if self._sampler else (0, {})
+            children_cpu = sum(
+                cpu - start_children.get(pid, 0.0) for pid, cpu in children.items()
+            )
+            event.update(
+                wall_s=round(time.perf_counter() - start_wall, 3),
+                cpu_s=round(time.process_time() - start_cpu + children_cpu, 3),
+                peak_rss_mb=round(peak_rss / 2**20, 1),
+                outcome=outcome,
+            )
+            if self.path is not None:
+                self._write(event)
+            self._notify(event)
+
+    def _notify(self, event: dict) -> None:
+        for listener in self.listeners:
+            listener(event)
+
+    def _write(self, event: dict) -> None:
+        # one write per line, so concurrent readers never see half an event
+        with open(self.path, "a") as f:
+            f.write(json.dumps(event) + "\n")
+
+
+# shared, so it must never be given listeners
+NO_TELEMETRY = Telemetry(None)
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pandas as pd
+
+
+def load_events(path: Path) -> list[dict]:
+    """Read a telemetry stream, skipping a partially written last line."""
+    events = []
+    with open(path) as f:
+        for line in f:
+            try:
+                events.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+    return events
+
+
+def summarize_events(events: list[dict]) -> pd.DataFrame:
+    """
+    Where the time went: one row per (phase, identifier), sorted by total wall
+    time, with the share of the run's total wall time.
+    """
+    columns = ["phase", "identifier", "runs", "errors", "wall_s", "mean_s", "max_s"]
+    columns += ["cpu_s", "peak_rss_mb", "share"]
+    if not events:
+        return pd.DataFrame(columns=columns)
+
+    df = pd.DataFrame(events)
+    df["identifier"] = df["identifier"].fillna("")
+    df["error"] = df["outcome"] != "ok"
+
+    summary = (
+        df.groupby(["phase", "identifier"])
+        .agg(
+            runs=("wall_s", "size"),
+            errors=("error", "sum"),
+            wall_s=("wall_s", "sum"),
+            mean_s=("wall_s", "mean"),
+            max_s=("wall_s", "max"),
+            cpu_s=("cpu_s", "sum"),
+            peak_rss_mb=("peak_rss_mb", "max"),
+        )
+        .reset_index()
+        .sort_values("wall_s", ascending=False, ignore_index=True)
+    )
+    total = summary["wall_s"].sum()
+    summary["share"] = summary["wall_s"] / total if total else 0.0
+    return summary[columns]
@@ -1,17 +1,30 @@
 # workflow.py
+from __future__ import annotations
+
 from pathlib import Path
-import shutil
-import pandas as pd
+import logging
 
-from .session_handler import PyaedtFileParameters
 from .config import WorkflowConfig
-from .prepare import PrepareFolderConfig
+from .prepare import TransferStats, summarize
+from .pipeline import PostProcessingPipeline
+from .cache import ResultCache, file_digest
+from .telemetry import Telemetry
+from .progress import PROGRESS_FILE, ProgressIndex, expected_runs
+from .ledger import open_project
+from .aggregation import IncrementalAggregation
+from .aggregation.parallel import RESULTS_ADAPTER
+from .consolidated import ConsolidatedStore
+from .sweep import expand_sweep, order_points
+from .sweep.phase import adaptive_phase, validate_adaptive
+from .screening.phase import screening_phase, validate_screening
+from .multi_variation.phase import multi_variation_phase
+from .phases import CachedTemplate, aggregation_phase, fan_out_phase
+from .runner import IterationRunner
 from ..simulation import SIMULATION_RESULTS_ADAPTER
 
-from pycaddy.project import Project, StorageMode
-from pycaddy.sweeper import ChainSweep
-from pycaddy.save import save_json
-from pycaddy.aggregator import Aggregator
+from pycaddy.project import Project
+
+logger = logging.getLogger(__name__)
 
 
 # ---------------------------------------------------------------------------
@@ -28,9 +41,20 @@ def execute_workflow(config: WorkflowConfig) -> None:
     2. **Build** – apply the current sweep parameters to the HFSS design
        through the configured builder object.
     3. **Simulate** – execute one or more analyses for every parameter set
-       and store their JSON results.
+       and store their JSON results. With ``config.pipeline.enabled`` the
+       CPU-only post-processing of each analysis overlaps the next
+       iteration's build and solve.
+       With ``config.multi_variation.enabled`` phases 1-3 instead run once
+       for the whole sweep: a single project copy is solved as an HFSS
+       parametric analysis, and each point's results are extracted into
+       its own iteration.
+       With an ``AdaptiveSweep`` in ``config.builder_sweep`` the points of
+       phases 1-3 are proposed one by one from the results seen so far.
+       With ``config.screening`` every point is first simulated cheaply,
+       and only the selected points are simulated at full fidelity.
     4. **Aggregate** – flatten and merge selected results into CSV files
-       for downstream analysis.
+       for downstream analysis. Rows are appended as iterations finish, so
+       a resumed or extended sweep only adds its new rows.
 
     Args:
         config (WorkflowConfig):
@@ -43,6 +67,8 @@ def execute_workflow(config: WorkflowConfig) -> None:
 
     Raises:
         ValueError: If the configuration is incomplete.
+        TypeError: If ``multi_variation`` is enabled without a
+            `DesignVariableBuilder`.
         RuntimeError: If an HFSS session cannot be opened or a simulation
             fails unexpectedly.
 
@@ -74,140 +100,122 @@ def execute_workflow(config: WorkflowConfig) -> None:
         # → results/aggregations/classical_agg.csv is produced
         ```
     """
-    project = Project(root=config.root_folder)
+    project = open_project(config.root_folder, config.ledger)
     iteration_proj = project.sub("iterations")
 
-    chain_sweep = ChainSweep(sweepers=config.builder_sweep)
-
-    for params in chain_sweep.generate():
-        # 1. PREPARE (copy template .aedt if policy allows)
-        run_params = _prepare_folder_phase(
-            cfg=config.prepare_folder,
-            pyaedt=config.pyaedt_file_parameters,
-            params=params,
-            project=iteration_proj,
+    points, duplicates, adaptive = expand_sweep(
+        config.builder_sweep, config.deduplicate_sweep
+    )
+    if adaptive is not None:
+        validate_adaptive(config, adaptive)
+    if config.screening is not None:
+        validate_screening(config, adaptive)
+
+    # ordering the full sweep keeps the path stable across resumes
+    reuse_mesh = any(
+        getattr(simulation, "reuse_mesh", False)
+        for simulation in config.simulations.values()
+    )
+    points = order_points(points, config.sweep_order, reuse_mesh)
+
+    cache = None
+    if (
+        config.result_cache is not None
+        and config.pyaedt_file_parameters.file_path.exists()
+    ):
+        cache = CachedTemplate(
+            cache=ResultCache(config.result_cache.path, config.result_cache.max_bytes),
+            template_digest=file_digest(config.pyaedt_file_parameters.file_path),
         )
 
-        # 2. BUILD (apply parameter sweep values)
-        _build_phase(config.builder, run_params, params, iteration_proj)
-
-        # 3. SIMULATIONS
-        _simulations_phase(
-            config.simulations,
-            params,
-            run_params.model_copy(),
-            config.keep_hfss_solutions,
+    aggregation_proj = project.sub("aggregations")
+    aggregations = [
+        IncrementalAggregation(
+            name,
+            identifiers,
+            aggregation_proj,
             iteration_proj,
+            RESULTS_ADAPTER,
+            config.aggregation_format,
+            config.aggregation_loading,
         )
-
-    # 4. AGGREGATION
-    aggregation_proj = project.sub("aggregations")
-    for name, identifiers in config.aggregation_dict.items():
-        aggregator = Aggregator(identifiers=identifiers)
-        _aggregation_phase(name, aggregator, aggregation_proj, iteration_proj)
-
-
-# ---------------------------------------------------------------------------
-# helper phases
-# ---------------------------------------------------------------------------
-def _prepare_folder_phase(
-    cfg: PrepareFolderConfig,
-    pyaedt: PyaedtFileParameters,
-    params: dict,
-    project: Project,
-) -> PyaedtFileParameters:
-    """
-    • Optionally copy the template AEDT into the run folder.
-    • Return a **new** PyaedtFileParameters whose file_path points at that copy.
-    • Nothing is mutated in-place.
-    """
-    # ── skip entirely if policy disabled ────────────────────────────────────
-    # if not cfg.copy_enabled:
-    #     return pyaedt
-
-    session = project.session("prepare", params=params)
-
-    if session.is_done():
-        hfss_path = session.files["hfss"]
-        return pyaedt.model_copy(update={"file_path": hfss_path})
-
-    session.start()
-    dest: Path = session.path(cfg.dest_name, include_identifier=False)
-
-    # Template missing -> just fall through without copy
-    if pyaedt.file_path.exists():
-        shutil.copy2(pyaedt.file_path, dest)
-
-    session.attach_files({"hfss": dest})
-
-    session.done()
-    return pyaedt.model_copy(update={"file_path": dest})
-
-
-def _build_phase(builder, pyaedt_params, params, project):
-    session = project.session("build", params=params)
-
-    if session.is_done():
-        return
-
-    session.start()
-
-    parameters_path = session.path("parameters.json")
-    save_json(parameters_path, params)
-    session.attach_files({"data": parameters_path})
-
-    with pyaedt_params.open_pyaedt_file() as hfss:
-        builder.build(hfss, parameters=params)
-    session.done()
-
-
-def _simulations_phase(
-    identifier_simulation_dict,
-    params: dict,
-    run_params: PyaedtFileParameters,
-    keep_hfss_solutions: bool,
-    project: Project,
-):
-    designs = []
-
-    for identifier, simulation in identifier_simulation_dict.items():
-        session = project.session(identifier, params=params)
-        if session.is_done():
-            continue
-
-        designs.append(simulation.design_name)
-
-        run_params.design_name = simulation.design_name
-        with run_params.open_pyaedt_file() as hfss:
-            session.start()
-            result = simulation.analyze(hfss=hfss)
-            path = session.path(suffix=".json")
-            save_json(path, result.model_dump())
-            session.attach_files({"data": path})
-            session.done()
-
-    if not keep_hfss_solutions:
-        with run_params.open_pyaedt_file() as hfss:
-            for design_name in set(designs):
-                hfss.set_active_design(design_name)
-                hfss.cleanup_solution()
-
-
-def _aggregation_phase(
-    name: str, aggregator: Aggregator, project: Project, iteration_project: Project
-):
-    session = project.session(identifier=name, storage_mode=StorageMode.PREFIX)
-    if session.is_done():
-        return
-
-    session.start()
-    results = aggregator.aggregate(
-        project.ledger,
-        "data",
-        relpath=iteration_project.relpath,
-        adapter=SIMULATION_RESULTS_ADAPTER,
+        for name, identifiers in config.aggregation_dict.items()
+    ]
+    if config.consolidated_store is not None:
+        # updated along with the aggregations, from the main process only
+        aggregations.append(_consolidated_store(config, iteration_proj))
+
+    # progress.json follows the phase events and saved results, for `quansys status`
+    progress = ProgressIndex(
+        Path(config.root_folder) / PROGRESS_FILE,
+        expected_runs(config, len(points) + len(duplicates), adaptive),
+    )
+    progress.sync(project.ledger)
+
+    telemetry_path = None
+    if config.telemetry.enabled:
+        telemetry_path = Path(config.root_folder) / config.telemetry.file_name
+    telemetry = Telemetry(telemetry_path, config.telemetry.interval, (progress,))
+
+    transfers: list[TransferStats] = []
+    with (
+        telemetry,
+        PostProcessingPipeline(
+            config.pipeline, config.result_arrays, (progress.finished,)
+        ) as pipeline,
+    ):
+        if config.multi_variation.enabled:
+            multi_variation_phase(
+                config, points, project, pipeline, cache, transfers, telemetry
+            )
+        else:
+            runner = IterationRunner(
+                config,
+                iteration_proj,
+                pipeline,
+                cache,
+                transfers,
+                reuse_mesh,
+                telemetry,
+                aggregations,
+            )
+            if adaptive is not None:
+                adaptive_phase(runner, points, adaptive)
+            elif config.screening is not None:
+                screening_phase(runner, points, config.screening, project)
+            else:
+                for params in points:
+                    runner.run(params)
+            runner.close()
+
+    if transfers:
+        logger.info(summarize(transfers))
+
+    # fan the representative's results back to every duplicate point
+    for params, representative in duplicates:
+        fan_out_phase(config.simulations, params, representative, iteration_proj)
+
+    # runs finished without a phase event (cache hits, duplicates)
+    progress.sync(project.ledger)
+
+    # 4. AGGREGATION (whatever the iterations have not appended yet)
+    with telemetry:
+        aggregation_phase(aggregations, telemetry, final=True)
+
+
+def _consolidated_store(config: WorkflowConfig, project: Project) -> ConsolidatedStore:
+    store_config = config.consolidated_store
+    identifiers = store_config.identifiers or list(config.simulations)
+    unknown = [i for i in identifiers if i not in config.simulations]
+    if unknown:
+        raise ValueError(
+            f"consolidated_store identifiers {unknown} are not among the "
+            f"simulations: {list(config.simulations)}"
+        )
+    return ConsolidatedStore(
+        store_config,
+        Path(config.root_folder) / store_config.file_name,
+        identifiers,
+        project,
+        SIMULATION_RESULTS_ADAPTER,
     )
-    path = session.path(suffix=".csv", include_uid=False)
-    pd.DataFrame(results).to_csv(path)
-    session.attach_files({"data": path})
-    session.done()
@@ -0,0 +1,94 @@
+"""
+Tests for `quansys aggregate`: re-aggregating a results tree from a spec
+(no HFSS needed).
+"""
+
+import pandas as pd
+import pytest
+from pycaddy.project import Project
+from pycaddy.save import save_json
+from typer.testing import CliRunner
+
+from quansys.cli.main import app
+from quansys.workflow.aggregation import AggregationSpec, aggregate_tree
+
+
+def _iteration(root, params, results):
+    project = Project(root=root).sub("iterations")
+    for identifier, data in (("build", params), ("eigen", results)):
+        session = project.session(identifier, params=params)
+        session.start()
+        path = session.path(suffix=".json")
+        save_json(path, data)
+        session.attach_files({"data": path})
+        session.done()
+    return path
+
+
+@pytest.fixture
+def tree(tmp_path):
+    for lj in ("10nh", "12 nH", "14nh"):
+        for seed in (0, 1):
+            _iteration(
+                tmp_path,
+                {"lj": lj, "seed": seed},
+                {"f": float(lj[:2]) + seed, "q": 1e6},
+            )
+    return tmp_path
+
+
+def test_filters_before_parsing_results(tree):
+    # an excluded iteration with an unreadable result is never parsed
+    broken = _iteration(tree, {"lj": "20nh", "seed": 0}, {"f": 0.0})
+    broken.write_text("not json")
+
+    spec = AggregationSpec(
+        identifiers=["eigen"],
+        where=[{"param": "lj", "op": "<=", "value": 1.2e-8}],
+    )
+    frame = aggregate_tree(tree, spec)
+    assert list(frame.columns) == ["lj", "seed", "f", "q", "uid"]
+    assert list(frame["lj"]) == ["10nh", "10nh", "12 nH", "12 nH"]
+
+
+def test_reduce_over_axis_and_pivot(tree):
+    spec = AggregationSpec(
+        identifiers=["eigen"],
+        columns=["f"],
+        reduce={"over": ["seed"], "functions": ["mean", "max"]},
+    )
+    reduced = aggregate_tree(tree, spec)
+    assert list(reduced.columns) == ["lj", "f [mean]", "f [max]"]
+    assert list(reduced["f [mean]"]) == [10.5, 12.5, 14.5]
+
+    spec = AggregationSpec(
+        identifiers=["eigen"],
+        pivot={"index": ["lj"], "columns": "seed", "values": ["f"]},
+    )
+    wide = aggregate_tree(tree, spec)
+    assert list(wide.columns) == ["lj", "f | seed=0", "f | seed=1"]
+    assert list(wide["f | seed=1"]) == [11.0, 13.0, 15.0]
+
+    spec = AggregationSpec(
+        identifiers=["eigen"], pivot={"index": ["seed"], "columns": "q"}
+    )
+    with pytest.raises(ValueError, match="reduce them first"):
+        aggregate_tree(tree, spec)
+
+
+def test_cli_writes_output(tree, tmp_path):
+    spec_path = tmp_path / "agg.yaml"
+    spec_path.write_text(
+        "identifiers: [eigen]\n"
+        "where:\n"
+        "  - {param: seed, op: in, value: [1]}\n"
+        "reduce: {group_by: [seed], functions: [min]}\n"
+    )
+    output = tmp_path / "out.csv"
+    result = CliRunner().invoke(
+        app, ["aggregate", str(tree), "--spec", str(spec_path), "-o", str(output)]
+    )
+    assert result.exit_code == 0, result.output
+    assert "3 of 6 finished iterations selected" in result.output
+    frame = pd.read_csv(output)
+    assert frame.to_dict("records") == [{"seed": 1, "f [min]": 11.0, "q [min]": 1e6}]
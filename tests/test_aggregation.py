@@ -0,0 +1,196 @@
+"""
+Tests for incremental, streaming aggregation (no HFSS needed).
+"""
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+from pycaddy.project import Project
+from pycaddy.save import save_json
+
+from quansys.workflow.aggregation import (
+    IncrementalAggregation,
+    ParallelLoadingConfig,
+    load_aggregation,
+)
+from quansys.workflow.ledger import IndexedProject
+
+
+def _session(root, identifier, params, data=None, project_cls=Project):
+    session = (
+        project_cls(root=root).sub("iterations").session(identifier, params=params)
+    )
+    if data is not None:
+        session.start()
+        path = session.path(suffix=".json")
+        save_json(path, data)
+        session.attach_files({"data": path})
+        session.done()
+
+
+def _aggregation(root, format="csv", project_cls=Project):
+    project = project_cls(root=root)
+    return IncrementalAggregation(
+        "agg",
+        ["build", "eigen"],
+        project.sub("aggregations"),
+        project.sub("iterations"),
+        format=format,
+    )
+
+
+def test_matches_dataframe_layout(tmp_path):
+    for w in (1, 2):
+        _session(tmp_path, "build", {"w": w}, {"w": w})
+        _session(tmp_path, "eigen", {"w": w}, {"f": 5.0 / w})
+
+    assert _aggregation(tmp_path).update() == 2
+
+    expected = pd.DataFrame(
+        [{"w": 1, "f": 5.0, "uid": "000"}, {"w": 2, "f": 2.5, "uid": "001"}]
+    ).to_csv()
+    assert (tmp_path / "aggregations" / "agg.csv").read_text() == expected
+
+
+def test_appends_only_new_rows(tmp_path):
+    path = tmp_path / "aggregations" / "agg.csv"
+    for w in (1, 2, 3):
+        _session(tmp_path, "build", {"w": w}, {"w": w})
+    _session(tmp_path, "eigen", {"w": 1}, {"f": 1.0})
+    _session(tmp_path, "eigen", {"w": 2})  # still pending
+    _session(tmp_path, "eigen", {"w": 3}, {"f": 3.0})
+
+    aggregation = _aggregation(tmp_path)
+    assert aggregation.update() == 2
+    assert aggregation.update() == 0
+
+    # the skipped uid finishes late; a new point brings a new column
+    _session(tmp_path, "eigen", {"w": 2}, {"f": 2.0})
+    _session(tmp_path, "build", {"w": 4}, {"w": 4})
+    _session(tmp_path, "eigen", {"w": 4}, {"f": 4.0, "q": 1e6})
+
+    # an interrupted update left half a row behind
+    with open(path, "a") as f:
+        f.write("9,9,9")
+
+    # a fresh instance, as after a resume
+    assert _aggregation(tmp_path).update() == 2
+
+    df = pd.read_csv(path, index_col=0)
+    assert list(df["uid"]) == [0, 2, 1, 3]
+    assert list(df["f"]) == [1.0, 3.0, 2.0, 4.0]
+    assert list(df.columns) == ["w", "f", "uid", "q"]
+    assert df["q"].isna().sum() == 3
+    assert list(df.index) == [0, 1, 2, 3]
+
+    # one ledger record for the aggregation, however many updates
+    ledger = Project(root=tmp_path).ledger
+    assert len(ledger.get_uid_record_dict("agg", relpath=Path("aggregations"))) == 1
+
+
+@pytest.mark.parametrize("project_cls", [Project, IndexedProject])
+def test_aggregation_skips_unfinished_runs(tmp_path, project_cls):
+    path = tmp_path / "aggregations" / "agg.csv"
+    aggregation = _aggregation(tmp_path, project_cls=project_cls)
+    for w in range(4):
+        _session(tmp_path, "build", {"w": w}, {"w": w}, project_cls)
+    for w in (0, 2):
+        _session(tmp_path, "eigen", {"w": w}, {"q": float(w)}, project_cls)
+    _session(tmp_path, "eigen", {"w": 1}, project_cls=project_cls)  # pending
+
+    assert aggregation.update() == 2
+    assert aggregation.update() == 0
+
+    # only the run skipped below the mark and the one above it are new
+    _session(tmp_path, "eigen", {"w": 1}, {"q": 1.0}, project_cls)
+    _session(tmp_path, "eigen", {"w": 3}, {"q": 3.0}, project_cls)
+    assert aggregation.update() == 2
+
+    df = pd.read_csv(path, index_col=0)
+    assert list(df["q"]) == [0.0, 2.0, 1.0, 3.0]
+
+
+def test_parquet_parts_and_loader(tmp_path):
+    pytest.importorskip("pyarrow")
+    path = tmp_path / "aggregations" / "agg.parquet"
+
+    # one update per iteration, as during a run
+    aggregation = _aggregation(tmp_path, "parquet")
+    for w in range(5):
+        _session(tmp_path, "build", {"w": w}, {"w": w, "label": f"L{w % 2}"})
+        _session(tmp_path, "eigen", {"w": w}, {"f": 1 / 3 + w})
+        aggregation.update()
+    assert len(list(path.glob("part-*"))) == 5
+
+    # a part left by an interrupted update is ignored
+    (path / "part-00000099.parquet").write_bytes(b"partial")
+    assert aggregation.update(final=True) == 0
+    assert [p.name for p in path.glob("part-*")] == ["part-00000005.parquet"]
+
+    df = load_aggregation(path)
+    assert list(df["uid"]) == ["000", "001", "002", "003", "004"]
+    assert list(df["f"]) == [1 / 3 + w for w in range(5)]
+    assert df["label"].dtype == "category"
+
+    df = load_aggregation(path, columns=["w", "f"], filters=[("w", ">=", 3)])
+    assert list(df.columns) == ["w", "f"]
+    assert list(df["w"]) == [3, 4]
+
+
+def test_parquet_parts_with_mixed_types(tmp_path):
+    pytest.importorskip("pyarrow")
+    path = tmp_path / "aggregations" / "agg.parquet"
+
+    # a sweep value that is text at some points and a number at others
+    aggregation = _aggregation(tmp_path, "parquet")
+    for w, value in enumerate(["a", 2, "b", 3.5]):
+        _session(tmp_path, "build", {"w": w}, {"w": w, "value": value})
+        _session(tmp_path, "eigen", {"w": w}, {"f": float(w)})
+        aggregation.update()
+
+    assert list(load_aggregation(path)["value"]) == ["a", "2", "b", "3.5"]
+
+    aggregation.update(final=True)
+    assert len(list(path.glob("part-*"))) == 1
+    df = load_aggregation(path, filters=[("w", "<", 2)])
+    assert list(df["value"]) == ["a", "2"]
+    assert list(df["f"]) == [0.0, 1.0]
+
+
+def test_csv_loader_filters(tmp_path):
+    for w in (1, 2, 3):
+        _session(tmp_path, "build", {"w": w}, {"w": w})
+        _session(tmp_path, "eigen", {"w": w}, {"f": float(w)})
+    _aggregation(tmp_path).update()
+
+    df = load_aggregation(
+        tmp_path / "aggregations" / "agg.csv",
+        columns=["f"],
+        filters=[("w", "in", [1, 3])],
+    )
+    assert list(df["f"]) == [1.0, 3.0]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_parallel_loading_keeps_uid_order(tmp_path, workers):
+    for w in range(30):
+        _session(tmp_path, "build", {"w": w}, {"w": w})
+        _session(tmp_path, "eigen", {"w": w}, {"f": 5.0 / (w + 1)})
+
+    sequential = _aggregation(tmp_path / "seq")
+    project = Project(root=tmp_path)
+    parallel = IncrementalAggregation(
+        "agg",
+        ["build", "eigen"],
+        project.sub("aggregations"),
+        project.sub("iterations"),
+        loading=ParallelLoadingConfig(workers=workers, min_rows=1, chunk_size=4),
+    )
+    sequential.iteration_project = parallel.iteration_project
+
+    assert parallel.update() == sequential.update() == 30
+    expected = pd.read_csv(sequential._session.path(suffix=".csv", include_uid=False))
+    actual = pd.read_csv(parallel._session.path(suffix=".csv", include_uid=False))
+    pd.testing.assert_frame_equal(actual, expected)
+    assert list(actual["w"]) == list(range(30))
@@ -0,0 +1,125 @@
+"""
+Tests for the content-addressed result cache.
+"""
+
+import json
+import os
+
+from pycaddy.project import Project
+from pycaddy.sweeper import DictSweep
+
+from quansys.simulation import EigenmodeAnalysis
+from quansys.workflow import (
+    DesignVariableBuilder,
+    PyaedtFileParameters,
+    ResultCacheConfig,
+    WorkflowConfig,
+    execute_workflow,
+)
+from quansys.workflow.cache import ResultCache, file_digest
+
+SIMULATION = EigenmodeAnalysis(setup_name="Setup1", design_name="my_design")
+
+
+def _write(path, size):
+    path.write_bytes(b"x" * size)
+    return path
+
+
+def test_key_depends_on_template_params_and_analysis():
+    key = ResultCache.key("abc", {"w": "3mm"}, SIMULATION)
+
+    assert key == ResultCache.key("abc", {"w": "3mm"}, SIMULATION)
+    assert key == ResultCache.key("abc", {"w": "3 mm"}, SIMULATION)
+    assert key != ResultCache.key("abd", {"w": "3mm"}, SIMULATION)
+    assert key != ResultCache.key("abc", {"w": "4mm"}, SIMULATION)
+    assert key != ResultCache.key(
+        "abc", {"w": "3mm"}, SIMULATION.model_copy(update={"cores": 8})
+    )
+
+
+def test_put_and_get(tmp_path):
+    cache = ResultCache(tmp_path / "cache", max_bytes=10_000)
+    source = _write(tmp_path / "result.json", 10)
+
+    assert cache.get("ab" * 32) is None
+    cache.put("ab" * 32, source)
+
+    hit = cache.get("ab" * 32)
+    assert hit is not None
+    assert hit.read_bytes() == source.read_bytes()
+    assert cache.stats().entries == 1
+
+
+def test_lru_eviction(tmp_path):
+    cache = ResultCache(tmp_path / "cache", max_bytes=350)
+    keys = [f"{i:02d}" * 32 for i in range(3)]
+
+    for i, key in enumerate(keys):
+        cache.put(key, _write(tmp_path / f"{i}.json", 100))
+        # make access order explicit regardless of filesystem time resolution
+        os.utime(cache.path(key), (1000 + i, 1000 + i))
+
+    # touching the oldest entry makes it the most recently used
+    cache.get(keys[0])
+    cache.put("ff" * 32, _write(tmp_path / "new.json", 100))
+
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) is not None
+    assert cache.stats().total_bytes <= 350
+
+
+def test_overwriting_an_entry_does_not_count_it_twice(tmp_path, monkeypatch):
+    cache = ResultCache(tmp_path / "cache", max_bytes=250)
+    collections = []
+    monkeypatch.setattr(cache, "gc", lambda: collections.append(1))
+
+    cache.put("01" * 32, _write(tmp_path / "a.json", 100))
+    for _ in range(3):
+        cache.put("02" * 32, _write(tmp_path / "b.json", 100))
+
+    assert collections == []
+    assert cache.stats().total_bytes == 200
+
+
+def test_file_digest_tracks_content(tmp_path):
+    path = _write(tmp_path / "design.aedt", 10)
+    first = file_digest(path)
+
+    path.write_bytes(b"y" * 11)
+    assert file_digest(path) != first
+
+
+def test_full_hit_opens_no_aedt(tmp_path, monkeypatch):
+    template = _write(tmp_path / "design.aedt", 10)
+    cache_config = ResultCacheConfig(path=tmp_path / "cache")
+    cache = ResultCache(cache_config.path, cache_config.max_bytes)
+    points = [{"w": "3mm"}, {"w": "4mm"}]
+    for i, params in enumerate(points):
+        result = tmp_path / f"{i}.json"
+        result.write_text(json.dumps({"w": params["w"]}))
+        cache.put(ResultCache.key(file_digest(template), params, SIMULATION), result)
+
+    def open_pyaedt_file(self):
+        raise AssertionError("AEDT opened on a full cache hit")
+
+    monkeypatch.setattr(PyaedtFileParameters, "open_pyaedt_file", open_pyaedt_file)
+
+    config = WorkflowConfig(
+        root_folder=tmp_path / "results",
+        pyaedt_file_parameters=PyaedtFileParameters(file_path=template),
+        simulations={"eigen": SIMULATION},
+        builder=DesignVariableBuilder(design_name="my_design"),
+        builder_sweep=[DictSweep(parameters={"w": ["3mm", "4mm"]})],
+        result_cache=cache_config,
+    )
+    execute_workflow(config)
+
+    iterations = Project(root=config.root_folder).sub("iterations")
+    for params in points:
+        assert iterations.session("eigen", params=params).is_done()
+        build = iterations.session("build", params=params)
+        assert json.loads(build.files["data"].read_text()) == params
+        # no project copy was made
+        assert not iterations.session("prepare", params=params).is_done()
+    assert not list(config.root_folder.rglob("*.aedt"))
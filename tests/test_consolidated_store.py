@@ -0,0 +1,104 @@
+"""
+Tests for the consolidated HDF5 result store (no HFSS needed).
+"""
+
+import numpy as np
+import pytest
+from pycaddy.project import Project
+from pycaddy.save import save_json
+
+from quansys.workflow.consolidated import (
+    ConsolidatedStore,
+    ConsolidatedStoreConfig,
+    Hdf5ResultStore,
+)
+
+pytest.importorskip("h5py")
+
+
+def _session(root, identifier, params, data=None):
+    session = Project(root=root).sub("iterations").session(identifier, params=params)
+    if data is not None:
+        session.start()
+        path = session.path(suffix=".json")
+        save_json(path, data)
+        session.attach_files({"data": path})
+        session.done()
+
+
+def _result(modes):
+    return {
+        "chi": np.arange(modes * modes, dtype=float).reshape(modes, modes).tolist(),
+        "frequencies": {"value": [5.0] * modes, "unit": "GHz"},
+    }
+
+
+def test_update_appends_finished_runs(tmp_path):
+    for w, modes in ((1, 2), (2, 3)):
+        _session(tmp_path, "build", {"w": w}, {"w": w})
+    _session(tmp_path, "quantum", {"w": 1}, _result(2))
+    _session(tmp_path, "quantum", {"w": 2})  # still pending
+
+    path = tmp_path / "results.h5"
+    store = ConsolidatedStore(
+        ConsolidatedStoreConfig(),
+        path,
+        ["quantum"],
+        Project(root=tmp_path).sub("iterations"),
+    )
+    assert store.update() == 1
+    assert store.update() == 0
+
+    _session(tmp_path, "quantum", {"w": 2}, _result(3))
+    assert store.update() == 1
+
+    with Hdf5ResultStore(path) as h5:
+        assert h5.params("quantum") == [{"w": 1}, {"w": 2}]
+        assert h5.row("quantum", {"w": 2}) == 1
+
+        chi = h5.read("quantum", "chi")
+        assert chi.shape == (2, 3, 3)
+        np.testing.assert_array_equal(chi[1], _result(3)["chi"])
+        # the smaller first row is padded
+        np.testing.assert_array_equal(chi[0, :2, :2], _result(2)["chi"])
+        assert np.isnan(chi[0, 2]).all()
+
+        assert list(h5.read("quantum", "frequencies/unit")) == ["GHz", "GHz"]
+
+
+def test_append_overwrites_and_promotes(tmp_path):
+    with Hdf5ResultStore(tmp_path / "store.h5", "a") as h5:
+        h5.append("eigen", "a", "000", {"w": 1}, {"v": [1.0, 2.0]})
+        h5.append("eigen", "b", "001", {"w": 2}, {"v": [1j, 2.0], "q": 3})
+        h5.append("eigen", "a", "000", {"w": 1}, {"v": [4.0, 5.0]})
+
+    with Hdf5ResultStore(tmp_path / "store.h5") as h5:
+        assert h5.keys("eigen") == ["a", "b"]
+        v = h5.read("eigen", "v")
+        assert v.dtype == np.complex128
+        np.testing.assert_array_equal(v, [[4.0, 5.0], [1j, 2.0]])
+        # a value that appears later is filled for the earlier rows
+        np.testing.assert_array_equal(h5.read("eigen", "q"), [0, 3])
+
+
+def test_rerun_replaces_its_row(tmp_path):
+    _session(tmp_path, "build", {"w": 1}, {"w": 1})
+    _session(tmp_path, "quantum", {"w": 1}, _result(2))
+
+    path = tmp_path / "results.h5"
+    store = ConsolidatedStore(
+        ConsolidatedStoreConfig(),
+        path,
+        ["quantum"],
+        Project(root=tmp_path).sub("iterations"),
+    )
+    assert store.update() == 1
+
+    # redone with another result: same key and uid, finished later
+    _session(tmp_path, "quantum", {"w": 1}, _result(3))
+    assert store.update() == 1
+    assert store.update() == 0
+
+    with Hdf5ResultStore(path) as h5:
+        assert h5.uids("quantum") == ["000"]
+        np.testing.assert_array_equal(h5.read("quantum", "chi")[0], _result(3)["chi"])
@@ -0,0 +1,103 @@
+"""
+Tests for the cached unit conversions.
+"""
+
+import numpy as np
+import pint
+import pytest
+
+from quansys.shared import Value, conversion
+from quansys.shared.conversion import convert, convert_array, get_registry, to_si, ureg
+from quansys.shared.hfss_values import HFSS_UNITS, parse_hfss_value
+from quansys.workflow.builder.design_variables_handler import (
+    InputAdapter,
+    format_variables,
+)
+from quansys.workflow.builder.design_variables_handler.conversion import convert_to_si
+
+
+@pytest.mark.parametrize(
+    "value, unit, target",
+    [
+        (5.1, "GHz", "MHz"),
+        (3.5, "inch", "centimeter"),
+        (20, "degC", "K"),
+        (10, "dBm", "mW"),
+    ],
+)
+def test_convert_matches_pint(value, unit, target):
+    expected = ureg.Quantity(value, unit).to(target)
+    for _ in range(2):  # resolved, then cached
+        converted, converted_unit = convert(value, unit, target)
+        assert converted == pytest.approx(expected.magnitude, rel=1e-12)
+        assert converted_unit == str(expected.units)
+
+    array, array_unit = convert_array([value, 2 * value], unit, target)
+    np.testing.assert_allclose(
+        array, ureg.Quantity(np.array([value, 2 * value]), unit).to(target).magnitude
+    )
+    assert array_unit == converted_unit
+
+
+def test_value_change_unit():
+    value = Value(value=5e9, unit="Hz")
+    value.change_unit("GHz")
+    assert value.value == pytest.approx(5.0)
+
+    with pytest.raises(ValueError, match="from 'GHz' to 'm'"):
+        convert(1, "GHz", "m")
+
+
+pint_ureg = pint.UnitRegistry()
+
+
+def test_hfss_table_matches_pint():
+    for unit, pint_unit in HFSS_UNITS.items():
+        number, written = parse_hfss_value(f" 3.5e-1 {unit.upper()}")
+        assert (number, written) == (0.35, unit.upper())
+        if written in HFSS_UNITS.values():
+            # written as pint spells another unit ("MH" for "mh"): that unit
+            pint_unit = written
+        # pint spellings are case-sensitive ("mA" vs "MA")
+        expected = (number * pint_ureg.Unit(pint_unit)).to_base_units().magnitude
+        assert to_si(number, written) == pytest.approx(expected, rel=1e-12), unit
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [("5 Mohm", 5e6), ("5 mohm", 5e-3), ("5 megohm", 5e6), ("5 MOHM", 5e-3)],
+)
+def test_pint_spelling_keeps_its_case(text, expected):
+    assert to_si(*parse_hfss_value(text)) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("unit", ["mm", "Mm", "nH", "Mohm", "MS", "Pa", "mK", "mil"])
+def test_convert_to_si_is_case_sensitive(unit):
+    # as pint spells them; HFSS's case-insensitive names read "Pa" as picoampere
+    expected = (1.5 * pint_ureg.Unit(unit)).to_base_units().magnitude
+    assert convert_to_si(1.5, unit) == pytest.approx(expected, rel=1e-12)
+
+
+def test_parse_hfss_value_fallbacks():
+    assert parse_hfss_value("lj + 1nh") is None
+    assert to_si(*parse_hfss_value("20 degC")) == pytest.approx(293.15)
+
+
+def test_format_variables_matches_validation():
+    variables = {
+        "a": 1.5,
+        "b": "3mm",
+        "c": 3,
+        "d": True,
+        "e": {"value": 2, "unit": "nH"},
+    }
+    expected = {
+        k: v.to_str() for k, v in InputAdapter.validate_python(variables).items()
+    }
+    assert format_variables(variables) == expected
+
+
+def test_single_registry():
+    assert get_registry() is get_registry() is conversion.ureg
+    with pytest.raises(AttributeError):
+        conversion.registry  # noqa: B018
@@ -1,6 +1,11 @@
+import logging
+
 import pytest
-from quansys.simulation import EigenmodeAnalysis
+from ansys.aedt.core.internal.errors import GrpcApiError
 
+from quansys.simulation import EigenmodeAnalysis
+from quansys.simulation.eigenmode import MeshSeed
+from quansys.simulation.eigenmode.mesh import link_mesh
 
 NUM_OF_MODES_IN_SETUP = 5
 
@@ -75,3 +80,34 @@ def test_analyze_raises_on_invalid_hfss():
 def test_frequencies_sorted(eigenmode_results):
     freqs = [mode.frequency.value for mode in eigenmode_results.results.values()]
     assert freqs == sorted(freqs), "Frequencies are not sorted ascending."
+
+
+class _FailingSetup:
+    name = "Setup1"
+
+    def __init__(self, error):
+        self.error = error
+
+    def add_mesh_link(self, design, **kwargs):
+        raise self.error
+
+
+def test_link_mesh_logs_rejected_links(tmp_path, caplog):
+    seed = MeshSeed(project=tmp_path / "seed.aedt")
+    seed.project.write_text("")
+
+    with caplog.at_level(logging.WARNING):
+        assert not link_mesh(_FailingSetup(GrpcApiError("no solution")), "d", seed)
+    assert "no solution" in caplog.text
+
+
+def test_link_mesh_raises_on_bad_arguments(tmp_path):
+    seed = MeshSeed(project=tmp_path / "seed.aedt")
+    seed.project.write_text("")
+
+    with pytest.raises(ValueError, match="Design does not exist"):
+        link_mesh(
+            _FailingSetup(ValueError("Design does not exist in current project.")),
+            "d",
+            seed,
+        )
@@ -0,0 +1,105 @@
+"""
+Tests for cost prediction from earlier runs (no HFSS needed).
+"""
+
+import pytest
+import typer
+from pycaddy.project import Project
+from pycaddy.save import save_json
+from pycaddy.sweeper import DictSweep
+
+from quansys.simulation import EigenmodeAnalysis
+from quansys.workflow import PyaedtFileParameters, WorkflowConfig
+from quansys.workflow.history import format_hhmm, make_plan, recommend
+
+
+def _config(root, widths):
+    return WorkflowConfig(
+        root_folder=root,
+        pyaedt_file_parameters=PyaedtFileParameters(file_path="template.aedt"),
+        simulations={"eigen": EigenmodeAnalysis(setup_name="Setup1", design_name="d")},
+        builder_sweep=[DictSweep(parameters={"w": widths})],
+    )
+
+
+def _finish(root, identifier, params, profile=None):
+    session = Project(root=root).sub("iterations").session(identifier, params=params)
+    session.start()
+    if profile is not None:
+        path = session.path(suffix=".json")
+        save_json(path, {"results": {}, "profile": profile})
+        session.attach_files({"data": path})
+    session.done()
+
+
+def test_plan_counts_pending_and_uses_history(tmp_path):
+    # an earlier workflow on the same template and analysis
+    old = tmp_path / "old"
+    old.mkdir()
+    _config(old / "results", ["1mm", "2mm"]).save_to_yaml(old / "config.yaml")
+    for w, (minutes, memory) in zip(["1mm", "2mm"], [(2, "800 M"), (4, "1.5 GB")]):
+        _finish(
+            old / "results",
+            "eigen",
+            {"w": w},
+            {"total_time_min": minutes, "memory": memory},
+        )
+
+    # the planned workflow, with one of three points already done
+    new = tmp_path / "new"
+    new.mkdir()
+    _config(new / "results", ["1mm", "3mm", "4mm"]).save_to_yaml(new / "config.yaml")
+    _finish(new / "results", "eigen", {"w": "1mm"})
+
+    plan = make_plan(new / "config.yaml", history=[old])
+    eigen = {e.identifier: e for e in plan.estimates}["eigen"]
+
+    assert eigen.pending == 2
+    assert eigen.samples == 3
+    assert eigen.memory_gb == 1.5
+    assert {e.identifier: e.pending for e in plan.estimates}["build"] == 3
+    assert plan.unknown == ["prepare", "build"]
+
+    resources = recommend(plan, margin=0.25)
+    assert resources.mem_mb == 2000
+    assert resources.timeout is not None
+
+
+def test_format_hhmm_rounds_up():
+    assert format_hhmm(61) == "00:02"
+    assert format_hhmm(3600 * 26) == "26:00"
+
+
+def test_auto_resources_picks_smallest_queue(tmp_path):
+    from quansys.cli.commands.submit.impl import _auto_resources
+
+    old = tmp_path / "old"
+    old.mkdir()
+    _config(old / "results", ["1mm"]).save_to_yaml(old / "config.yaml")
+    _finish(
+        old / "results",
+        "eigen",
+        {"w": "1mm"},
+        {"total_time_min": 4, "memory": "1.5 GB"},
+    )
+    new = tmp_path / "new"
+    new.mkdir()
+    _config(new / "results", ["2mm", "3mm"]).save_to_yaml(new / "config.yaml")
+
+    cores, mem, timeout, queue = _auto_resources(
+        new / "config.yaml", [old], 0.25, "medium=03:00,short=00:05", 120000, "03:00"
+    )
+
+    # 2 runs x 4 min x 1.25 -> 10 min, too long for "short"
+    assert (mem, timeout, queue) == (2000, "00:10", "medium")
+    # the config's cores, floored like a submit without --auto-resources
+    analysis = EigenmodeAnalysis(setup_name="Setup1", design_name="d")
+    assert cores == max(8, analysis.cores)
+
+
+@pytest.mark.parametrize("queues", ["short", "short=3h", "short=03:00,", "=03:00"])
+def test_malformed_queues_are_rejected(queues):
+    from quansys.cli.commands.submit.impl import _parse_queues
+
+    with pytest.raises(typer.BadParameter, match="name=HH:MM"):
+        _parse_queues(queues)
@@ -0,0 +1,153 @@
+"""
+Tests for the indexed SQLite ledger backend (no HFSS needed).
+"""
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pytest
+from pycaddy.ledger import Ledger
+from pycaddy.project import Project
+from typer.testing import CliRunner
+
+from quansys.cli.commands.status.impl import read_status
+from quansys.cli.main import app
+from quansys.workflow.ledger import (
+    IndexedProject,
+    SqliteLedger,
+    import_json_ledger,
+    open_project,
+)
+
+ITERATIONS = Path("iterations")
+
+
+def _run(project, identifier, params, done=True):
+    session = project.sub("iterations").session(identifier, params=params)
+    session.start()
+    session.attach_files({"data": Path(f"{identifier}.json")})
+    if done:
+        session.done()
+    return session.uid
+
+
+def test_resume_matches_json_project(tmp_path):
+    json_project = Project(root=tmp_path / "json")
+    sqlite_project = IndexedProject(root=tmp_path / "sqlite")
+
+    for project in (json_project, sqlite_project):
+        assert _run(project, "eigen", {"w": 1}) == "000"
+        assert _run(project, "eigen", {"w": 2}, done=False) == "001"
+
+    for project in (json_project, sqlite_project):
+        iterations = project.sub("iterations")
+        resumed = iterations.session("eigen", params={"w": 1})
+        assert (resumed.uid, resumed.is_done()) == ("000", True)
+        assert resumed.files == {"data": Path("eigen.json")}
+        assert not iterations.session("eigen", params={"w": 2}).is_done()
+        assert iterations.session("eigen", params={"w": 3}).uid == "002"
+
+    assert isinstance(sqlite_project.sub("iterations").ledger, SqliteLedger)
+    assert (tmp_path / "sqlite" / "metadata.sqlite").exists()
+    assert not (tmp_path / "sqlite" / "metadata.json").exists()
+
+
+def _allocate(root, worker):
+    project = IndexedProject(root=root)
+    return [_run(project, "eigen", {"worker": worker, "i": i}) for i in range(10)]
+
+
+def test_concurrent_writers(tmp_path):
+    # create the database up front
+    assert IndexedProject(root=tmp_path).ledger.file.exists()
+
+    context = multiprocessing.get_context("fork")
+    with ProcessPoolExecutor(4, mp_context=context) as pool:
+        uids = [
+            u
+            for result in pool.map(_allocate, [tmp_path] * 4, range(4))
+            for u in result
+        ]
+
+    records = SqliteLedger(tmp_path / "metadata.sqlite").get_uid_record_dict(
+        "eigen", relpath=ITERATIONS
+    )
+    assert sorted(uids) == sorted(records) == [f"{i:03d}" for i in range(40)]
+    assert all(record.status == "done" for record in records.values())
+
+
+def test_import_json_ledger(tmp_path):
+    project = Project(root=tmp_path)
+    _run(project, "build", {"w": 1})
+    _run(project, "eigen", {"w": 1}, done=False)
+
+    with pytest.raises(ValueError, match="import it first"):
+        open_project(tmp_path, "sqlite")
+
+    result = CliRunner().invoke(app, ["ledger", "import", str(tmp_path)])
+    assert result.exit_code == 0, result.output
+    assert "Imported 2 runs" in result.output
+    # a second import would overwrite newer runs
+    assert CliRunner().invoke(app, ["ledger", "import", str(tmp_path)]).exit_code == 1
+
+    iterations = open_project(tmp_path, "sqlite").sub("iterations")
+    assert iterations.session("build", params={"w": 1}).is_done()
+    assert iterations.session("eigen", params={"w": 1}).uid == "000"
+    assert iterations.ledger.load() == project.ledger.load()
+
+    statuses, _ = read_status(tmp_path)
+    assert {(s.identifier, s.done, s.running) for s in statuses} == {
+        ("build", 1, 0),
+        ("eigen", 0, 1),
+    }
+
+
+def test_records_after_a_uid(tmp_path):
+    project = IndexedProject(root=tmp_path)
+    for w in range(5):
+        _run(project, "eigen", {"w": w})
+
+    ledger = project.sub("iterations").ledger
+    records = ledger.get_uid_record_dict_after
+    assert list(records("eigen", None, relpath=ITERATIONS)) == [
+        f"{i:03d}" for i in range(5)
+    ]
+    assert list(records("eigen", "002", relpath=ITERATIONS, include=["000"])) == [
+        "000",
+        "003",
+        "004",
+    ]
+
+
+def test_allocation_continues_after_the_last_uid(tmp_path):
+    json_project = Project(root=tmp_path)
+    for w in range(3):
+        _run(json_project, "eigen", {"w": w})
+    import_json_ledger(
+        tmp_path / "metadata.json", SqliteLedger(tmp_path / "metadata.sqlite")
+    )
+
+    # counted on from the imported runs
+    ledger = SqliteLedger(tmp_path / "metadata.sqlite")
+    uids = [ledger.allocate("eigen", relpath=ITERATIONS) for _ in range(3)]
+    assert uids == ["003", "004", "005"]
+
+
+def test_uid_order_matches_json_ledger(tmp_path):
+    # past the padding width, where text order would put "10" before "9"
+    ledgers = [
+        Ledger(tmp_path / "metadata.json", maxsize=10),
+        SqliteLedger(tmp_path / "metadata.sqlite", maxsize=10),
+    ]
+    for ledger in ledgers:
+        for i in range(12):
+            ledger.allocate("eigen", param_hash="dup" if i in (9, 10) else str(i))
+
+    json_ledger, sqlite_ledger = ledgers
+    expected = [str(i) for i in range(12)]
+    assert list(json_ledger.get_uid_record_dict("eigen")) == expected
+    assert list(sqlite_ledger.get_uid_record_dict("eigen")) == expected
+    assert list(sqlite_ledger.load()["eigen"][""]) == expected
+    assert sqlite_ledger.find_by_param_hash("eigen", "dup")[0] == "9"
+    assert json_ledger.find_by_param_hash("eigen", "dup")[0] == "9"
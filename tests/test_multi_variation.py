@@ -0,0 +1,166 @@
+"""
+Tests for the multi-variation strategy helpers (no HFSS needed).
+"""
+
+import csv
+from contextlib import contextmanager
+from types import SimpleNamespace
+
+import pytest
+from pycaddy.sweeper import DictSweep
+
+from quansys.simulation import EigenmodeAnalysis
+from quansys.simulation.eigenmode.results import EigenmodeResults
+from quansys.workflow import (
+    DesignVariableBuilder,
+    FunctionBuilder,
+    MultiVariationConfig,
+    PyaedtFileParameters,
+    WorkflowConfig,
+    execute_workflow,
+)
+from quansys.workflow.multi_variation.phase import (
+    _validate_variation_solved,
+    _write_variations_table,
+)
+
+
+class _FakeParametricSetup:
+    """The parametric setup of `_FakeHfss`, solving the rows of its table."""
+
+    def __init__(self, hfss, rows: list[dict]):
+        self.hfss = hfss
+        self.rows = rows
+        self.props = {
+            "ProdOptiSetupDataV2": {
+                "SaveFields": False,
+                "CopyMesh": False,
+                "SolveWithCopiedMeshOnly": True,
+            }
+        }
+        self.updated = {}
+
+    def update(self):
+        self.updated = dict(self.props["ProdOptiSetupDataV2"])
+
+    def analyze(self, **kwargs):
+        variations = [
+            " ".join(f"{k}='{v}'" for k, v in row.items() if k != "*")
+            for row in self.rows
+        ]
+        # without SaveFields, only the last variation keeps its solution
+        saved = self.updated.get("SaveFields", False)
+        self.hfss.solved = variations if saved else variations[-1:]
+
+
+class _FakeHfss:
+    def __init__(self):
+        self.variables = {}
+        self.solved = []
+        self.sweep = None
+        self.parametrics = SimpleNamespace(add_from_file=self._add_from_file)
+
+    def _add_from_file(self, path, name):
+        with open(path, newline="") as f:
+            self.sweep = _FakeParametricSetup(self, list(csv.DictReader(f)))
+        return self.sweep
+
+    def __setitem__(self, name, value):
+        self.variables[name] = value
+
+    def list_of_variations(self, setup=None, sweep=None):
+        return self.solved
+
+    def set_active_design(self, name):
+        pass
+
+    def save_project(self):
+        pass
+
+    def cleanup_solution(self):
+        pass
+
+
+def test_variations_table_layout(tmp_path):
+    path = tmp_path / "table.csv"
+    points = [
+        {"l": "10nh", "w": {"value": 3, "unit": "mm"}},
+        {"l": "11nh", "w": {"value": 4, "unit": "mm"}},
+    ]
+
+    _write_variations_table(path, points)
+
+    with open(path, newline="") as f:
+        rows = list(csv.DictReader(f))
+
+    assert [row["*"] for row in rows] == ["1", "2"]
+    assert rows[0]["l"] == "10nh"
+    assert rows[1]["w"] == "4.0mm"
+
+
+def test_multi_variation_requires_design_variable_builder(tmp_path):
+    config = WorkflowConfig(
+        root_folder=tmp_path / "results",
+        pyaedt_file_parameters=PyaedtFileParameters(file_path=tmp_path / "x.aedt"),
+        simulations={"eigen": EigenmodeAnalysis(setup_name="Setup1", design_name="d")},
+        builder=FunctionBuilder(function=dict),
+        builder_sweep=[DictSweep(parameters={"l": ["10nh", "11nh"]})],
+        multi_variation=MultiVariationConfig(enabled=True),
+    )
+
+    with pytest.raises(TypeError, match="DesignVariableBuilder"):
+        execute_workflow(config)
+
+
+def test_multi_variation_extracts_every_solved_variation(tmp_path, monkeypatch):
+    hfss = _FakeHfss()
+
+    @contextmanager
+    def open_pyaedt_file(self):
+        yield hfss
+
+    extracted = []
+
+    def extract(self, hfss):
+        extracted.append(dict(hfss.variables))
+        return EigenmodeResults(
+            results={
+                1: {
+                    "mode_number": 1,
+                    "quality_factor": 1e4,
+                    "frequency": {"value": 5e9, "unit": "Hz"},
+                }
+            }
+        )
+
+    monkeypatch.setattr(PyaedtFileParameters, "open_pyaedt_file", open_pyaedt_file)
+    monkeypatch.setattr(EigenmodeAnalysis, "extract", extract)
+
+    template = tmp_path / "x.aedt"
+    template.write_text("")
+    config = WorkflowConfig(
+        root_folder=tmp_path / "results",
+        pyaedt_file_parameters=PyaedtFileParameters(file_path=template),
+        simulations={"eigen": EigenmodeAnalysis(setup_name="Setup1", design_name="d")},
+        builder=DesignVariableBuilder(design_name="d"),
+        builder_sweep=[DictSweep(parameters={"l": ["10nh", "11nh", "12nh"]})],
+        multi_variation=MultiVariationConfig(enabled=True),
+    )
+
+    execute_workflow(config)
+
+    assert hfss.sweep.updated["SaveFields"] is True
+    assert hfss.sweep.updated["CopyMesh"] is True
+    assert extracted == [{"l": "10nh"}, {"l": "11nh"}, {"l": "12nh"}]
+
+
+def test_missing_variation_solution_is_reported():
+    hfss = _FakeHfss()
+    hfss.solved = ["l='12nH' w='3mm'"]
+    simulation = EigenmodeAnalysis(setup_name="Setup1", design_name="d")
+
+    # equivalent spellings of the solved variation are found
+    _validate_variation_solved(hfss, simulation, {"l": "12 nh", "w": "3.0mm"})
+
+    with pytest.raises(ValueError, match="no solution"):
+        _validate_variation_solved(hfss, simulation, {"l": "10nh", "w": "3mm"})
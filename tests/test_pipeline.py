@@ -0,0 +1,80 @@
+"""
+Tests for the post-processing pipeline used by the workflow.
+
+Runs without HFSS: a dummy analysis supplies `collect` / `post_process`.
+"""
+
+from typing import Literal
+
+import pytest
+from pycaddy.load import load_json
+from pycaddy.project import Project
+
+from quansys.simulation.base import (
+    BaseAnalysis,
+    BaseSimulationOutput,
+    SimulationOutputTypesNames,
+    SimulationTypesNames,
+)
+from quansys.workflow import PipelineConfig
+from quansys.workflow.pipeline import PostProcessingPipeline
+
+
+class DummyOutput(BaseSimulationOutput):
+    type: Literal[SimulationOutputTypesNames.EIGENMODE_RESULT] = (
+        SimulationOutputTypesNames.EIGENMODE_RESULT
+    )
+    value: float
+
+    def flatten(self) -> dict:
+        return {"value": self.value}
+
+
+class DummyAnalysis(BaseAnalysis):
+    type: Literal[SimulationTypesNames.EIGENMODE] = SimulationTypesNames.EIGENMODE
+    factor: float = 2.0
+
+    def analyze(self, hfss=None) -> DummyOutput:
+        return self.post_process(self.collect(hfss))
+
+    def collect(self, hfss=None) -> float:
+        return 1.5
+
+    def post_process(self, collected: float) -> DummyOutput:
+        if collected < 0:
+            raise ValueError("negative")
+        return DummyOutput(value=collected * self.factor)
+
+
+@pytest.mark.parametrize(
+    "config",
+    [PipelineConfig(), PipelineConfig(enabled=True, workers=2, max_pending=1)],
+)
+def test_pipeline_finalizes_every_session(tmp_path, config):
+    project = Project(root=tmp_path).sub("iterations")
+    simulation = DummyAnalysis()
+
+    sessions = []
+    with PostProcessingPipeline(config) as pipeline:
+        for i in range(3):
+            session = project.session("dummy", params={"i": i})
+            session.start()
+            pipeline.submit(session, simulation, float(i), session.path(suffix=".json"))
+            sessions.append(session)
+
+    for i, session in enumerate(sessions):
+        assert session.is_done()
+        assert load_json(session.files["data"])["value"] == i * 2.0
+
+
+def test_pipeline_marks_failed_job_as_error(tmp_path):
+    project = Project(root=tmp_path).sub("iterations")
+    session = project.session("dummy", params={"i": 0})
+    session.start()
+
+    pipeline = PostProcessingPipeline(PipelineConfig(enabled=True))
+    with pytest.raises(ValueError, match="negative"), pipeline:
+        pipeline.submit(session, DummyAnalysis(), -1.0, session.path(suffix=".json"))
+        pipeline.drain()
+
+    assert session.status == "error"
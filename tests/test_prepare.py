@@ -0,0 +1,61 @@
+"""
+Tests for placing the template project in run folders (no HFSS needed).
+"""
+
+import pytest
+from pydantic import ValidationError
+
+from quansys.workflow.prepare import (
+    PrepareFolderConfig,
+    TransferStats,
+    place_project,
+    summarize,
+)
+
+
+@pytest.fixture
+def template(tmp_path):
+    path = tmp_path / "template.aedt"
+    path.write_bytes(b"$begin 'AnsoftProject'\n" * 100)
+    (tmp_path / "template.aedtresults").mkdir()
+    return path
+
+
+def test_copy_writes_the_project_only(template, tmp_path):
+    run = tmp_path / "run"
+    run.mkdir()
+
+    stats = place_project(template, run / "build.aedt", "copy")
+
+    assert stats.method == "copy"
+    assert stats.bytes_written == template.stat().st_size
+    assert (run / "build.aedt").read_bytes() == template.read_bytes()
+    assert [p.name for p in run.iterdir()] == ["build.aedt"]
+
+
+def test_hardlink_mode_is_rejected():
+    # AEDT saves into the project it opened, which a hardlink would share
+    with pytest.raises(ValidationError):
+        PrepareFolderConfig(link_mode="hardlink")
+
+
+def test_auto_is_an_independent_copy(template, tmp_path):
+    dest = tmp_path / "build.aedt"
+
+    stats = place_project(template, dest, "auto")
+
+    # reflink where supported, a plain copy otherwise; never shared
+    assert stats.method in ("reflink", "copy")
+    dest.write_bytes(b"changed")
+    assert template.read_bytes().startswith(b"$begin")
+
+
+def test_summarize():
+    stats = [
+        TransferStats("copy", 2_000_000, 0.5),
+        TransferStats("reflink", 0, 0.25),
+    ]
+
+    assert summarize(stats) == (
+        "prepare: 2 project(s) placed (1 copy, 1 reflink), 2.0 MB written in 0.75 s"
+    )
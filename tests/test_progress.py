@@ -0,0 +1,87 @@
+"""
+Tests for the progress index and `quansys status` (no HFSS needed).
+"""
+
+import json
+import time
+
+from pycaddy.project import Project
+from typer.testing import CliRunner
+
+from quansys.cli.commands.status.impl import read_status
+from quansys.cli.main import app
+from quansys.workflow.progress import PROGRESS_FILE, ProgressIndex
+from quansys.workflow.telemetry import Telemetry
+
+
+def _finish(project, identifier, params):
+    session = project.sub("iterations").session(identifier, params=params)
+    session.start()
+    session.done()
+    return session
+
+
+def test_progress_follows_phases(tmp_path):
+    project = Project(root=tmp_path)
+    _finish(project, "eigen", {"w": 1})  # from an earlier run
+
+    progress = ProgressIndex(
+        tmp_path / PROGRESS_FILE, {"build": 4, "eigen": 4}, min_interval=0
+    )
+    progress.sync(project.ledger)
+
+    with Telemetry(None, listeners=(progress,)) as telemetry:
+        for w in (1, 2, 3):
+            with telemetry.phase("build", {"w": w}):
+                pass
+            with telemetry.phase("simulate", {"w": w}, "eigen"):
+                time.sleep(0.01)
+            # done only once the pipeline has saved the result
+            assert len(progress.done["eigen"]) == max(1, w - 1)
+            progress.finished(_finish(project, "eigen", {"w": w}))
+        with telemetry.phase("build", {"w": 4}):
+            # still running while status is read
+            statuses, age = read_status(tmp_path)
+
+    by_id = {s.identifier: s for s in statuses}
+    assert (by_id["build"].done, by_id["build"].running, by_id["build"].pending) == (
+        3,
+        1,
+        0,
+    )
+    # the resumed point is not a new completion
+    assert (by_id["eigen"].done, by_id["eigen"].pending) == (3, 1)
+    assert by_id["eigen"].per_hour > 0
+    assert by_id["eigen"].eta_seconds > 0
+    assert 0 <= age < 5
+
+    result = CliRunner().invoke(app, ["status", str(tmp_path)])
+    assert result.exit_code == 0
+    assert "ETA:" in result.output
+
+
+def test_progress_file_is_throttled(tmp_path):
+    path = tmp_path / PROGRESS_FILE
+    progress = ProgressIndex(path, {"build": 2}, min_interval=60)
+    progress.sync(Project(root=tmp_path).ledger)
+
+    with (
+        Telemetry(None, listeners=(progress,)) as telemetry,
+        telemetry.phase("build", {"w": 1}),
+    ):
+        pass
+    assert json.loads(path.read_text())["identifiers"]["build"]["done"] == 0
+
+    progress.flush()
+    assert json.loads(path.read_text())["identifiers"]["build"]["done"] == 1
+
+
+def test_status_falls_back_to_ledger(tmp_path):
+    project = Project(root=tmp_path)
+    _finish(project, "eigen", {"w": 1})
+    project.sub("iterations").session("eigen", params={"w": 2})
+
+    statuses, age = read_status(tmp_path)
+
+    assert age is None
+    assert [(s.identifier, s.done, s.pending) for s in statuses] == [("eigen", 1, 1)]
@@ -0,0 +1,200 @@
+"""
+Tests for result files with binary array sidecars (no HFSS needed).
+"""
+
+import json
+import os
+import pickle
+from pathlib import Path
+
+import numpy as np
+import pytest
+from pydantic import BaseModel, ConfigDict
+
+from quansys.shared import Value
+from quansys.simulation import (
+    SIMULATION_RESULTS_ADAPTER,
+    ConfigJunction,
+    EigenmodeResults,
+    QuantumResults,
+)
+from quansys.simulation.quantum_epr.serializer import deserialize_ndarray
+from quansys.simulation.quantum_epr.structures import (
+    EprDiagResult,
+    ParsedJunctionValues,
+    ParticipationDataset,
+)
+from quansys.simulation.storage import copy_result, load_result, save_result
+from quansys.workflow.aggregation import merge_row
+
+ARRAY_FIELDS = (
+    "frequencies",
+    "quality_factors",
+    "inductances",
+    "capacitances",
+    "participation_ratio_induction",
+    "participation_ratio_capacitance",
+    "sign",
+    "peak_currents",
+    "peak_voltages",
+    "inductance_energy",
+    "capacitance_energy",
+    "total_inductance_energy",
+    "total_capacitance_energy",
+    "peak_total_magnetic_energy",
+    "peak_total_electric_energy",
+    "norm",
+    "diff",
+)
+
+
+def _quantum_result(modes=3, junctions=2) -> QuantumResults:
+    rng = np.random.default_rng(0)
+    labels = [f"m{i}" for i in range(modes)]
+    junction = ParsedJunctionValues(
+        info=ConfigJunction(line_name="j", inductance_variable_name="lj"),
+        inductance=Value(value=1e-8, unit="H"),
+    )
+    arrays = {name: rng.random((modes, junctions)) for name in ARRAY_FIELDS}
+    arrays["peak_currents"] = arrays["peak_currents"] * (1 + 1j)
+    arrays["frequencies"] = rng.uniform(4e9, 8e9, modes)
+    arrays["quality_factors"] = rng.uniform(1e4, 1e6, modes)
+    distributed = ParticipationDataset(
+        junctions_infos=(junction,) * junctions,
+        labels_to_modes={label: i + 1 for i, label in enumerate(labels)},
+        labels_order=tuple(labels),
+        **arrays,
+    )
+    eigenmode = EigenmodeResults(
+        results={
+            i + 1: {
+                "mode_number": i + 1,
+                "quality_factor": float(arrays["quality_factors"][i]),
+                "frequency": {"value": float(arrays["frequencies"][i]), "unit": "Hz"},
+                "label": label,
+            }
+            for i, label in enumerate(labels)
+        }
+    )
+    chi = rng.normal(size=(modes, modes))
+    return QuantumResults(
+        epr=EprDiagResult(chi=chi + chi.T, frequencies=arrays["frequencies"] / 1e9),
+        distributed=distributed,
+        eigenmode_result=eigenmode,
+    )
+
+
+@pytest.mark.parametrize("arrays", ["json", "npz", "npy"])
+def test_round_trip_is_lossless(tmp_path, arrays):
+    result = _quantum_result()
+    path = save_result(tmp_path / "quantum.json", result, arrays)
+    loaded = load_result(path, SIMULATION_RESULTS_ADAPTER)
+
+    for name in ARRAY_FIELDS:
+        expected = getattr(result.distributed, name)
+        actual = getattr(loaded.distributed, name)
+        assert isinstance(actual, np.ndarray)
+        np.testing.assert_array_equal(actual, expected)
+        assert actual.dtype == expected.dtype
+    np.testing.assert_array_equal(loaded.epr.chi, result.epr.chi)
+    assert loaded.flatten() == result.flatten()
+
+
+def test_sidecar_layout(tmp_path):
+    result = _quantum_result()
+    path = save_result(tmp_path / "quantum.json", result, "npy")
+
+    data = json.loads(path.read_text())
+    assert data["epr"]["chi"] == {"__ndarray__": "chi"}
+    assert data["distributed"]["frequencies"] == {"__ndarray__": "frequencies_1"}
+    assert isinstance(load_result(path, SIMULATION_RESULTS_ADAPTER).epr.chi, np.memmap)
+
+    # switching back to JSON removes the stale sidecar
+    save_result(path, result, "json")
+    assert not path.with_suffix(".arrays").exists()
+
+
+def test_copy_and_aggregate_with_sidecar(tmp_path):
+    result = _quantum_result()
+    source = save_result(tmp_path / "a" / "quantum.json", result, "npz")
+    target = copy_result(source, tmp_path / "quantum_copy.json")
+    assert target.with_suffix(".npz").exists()
+
+    row = merge_row([target], SIMULATION_RESULTS_ADAPTER)
+    assert row == result.flatten()
+
+
+def test_json_keeps_nan_and_complex(tmp_path):
+    result = _quantum_result()
+    result.epr.chi[0, 1] = np.nan
+    result.distributed.peak_voltages = result.distributed.peak_voltages + 0j
+    path = save_result(tmp_path / "quantum.json", result)
+
+    loaded = load_result(path, SIMULATION_RESULTS_ADAPTER)
+    np.testing.assert_array_equal(loaded.epr.chi, result.epr.chi)
+    # complex arrays without an imaginary part are stored as real
+    assert loaded.distributed.peak_voltages.dtype == np.float64
+    assert loaded.distributed.peak_currents.dtype == np.complex128
+    # load_result without an adapter returns the plain data
+    assert np.isnan(load_result(path)["epr"]["chi"][0][1])
+
+
+class _RawComplex(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    impedance: complex
+    gain: np.complex128
+    s11: np.ndarray
+
+
+def test_json_writes_raw_complex_values(tmp_path):
+    s11 = np.array([[1 + 2j, 3.0], [0.5j, -1]])
+    result = _RawComplex(impedance=50 - 1j, gain=np.complex128(2j), s11=s11)
+    data = load_result(save_result(tmp_path / "raw.json", result))
+
+    assert data["impedance"] == {"real": 50.0, "imag": -1.0}
+    assert data["gain"] == {"real": 0.0, "imag": 2.0}
+    # the element-wise layout of the result serializers
+    assert data["s11"][0][0] == {"real": 1.0, "imag": 2.0}
+    np.testing.assert_array_equal(deserialize_ndarray(data["s11"]), s11)
+
+
+def test_quantum_payloads_are_decoded_on_access(tmp_path):
+    result = _quantum_result()
+    path = save_result(tmp_path / "quantum.json", result)
+    loaded = load_result(path, SIMULATION_RESULTS_ADAPTER)
+
+    assert isinstance(loaded.distributed, ParticipationDataset)
+    assert loaded.flatten() == result.flatten()
+    # flatten reads the labels, not the participation arrays
+    assert "peak_currents" not in vars(loaded.distributed)
+
+    np.testing.assert_array_equal(
+        loaded.distributed.peak_currents, result.distributed.peak_currents
+    )
+    assert type(pickle.loads(pickle.dumps(loaded)).distributed) is ParticipationDataset
+
+
+def _open_fds_to(path) -> list[str]:
+    fds = Path("/proc/self/fd")
+    targets = []
+    for fd in fds.iterdir():
+        try:
+            targets.append(os.readlink(fd))
+        except OSError:
+            continue
+    return [t for t in targets if t == str(path)]
+
+
+@pytest.mark.skipif(not Path("/proc/self/fd").is_dir(), reason="needs /proc")
+def test_sidecar_is_closed_after_load(tmp_path):
+    result = _quantum_result()
+    path = save_result(tmp_path / "quantum.json", result, "npz")
+    loaded = load_result(path, SIMULATION_RESULTS_ADAPTER)
+
+    # decoded while the sidecar was open, which load_result closed
+    np.testing.assert_array_equal(
+        loaded.distributed.peak_currents, result.distributed.peak_currents
+    )
+    assert loaded.flatten() == result.flatten()
+    assert _open_fds_to(path.with_suffix(".npz").resolve()) == []
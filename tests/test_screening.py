@@ -0,0 +1,58 @@
+"""
+Tests for multi-fidelity screening selection (no HFSS needed).
+"""
+
+import pytest
+from pydantic import ValidationError
+
+from quansys.simulation import EigenmodeAnalysis
+from quansys.workflow import ScreeningConfig
+from quansys.workflow.screening import select_points
+
+POINTS = [{"w": w} for w in (1, 2, 3, 4)]
+RESULTS = [{"Mode 1 Quality Factor": q} for q in (10.0, 40.0, 20.0, 30.0)]
+
+
+def test_top_k_selection_keeps_sweep_order():
+    screening = ScreeningConfig(
+        identifier="eigen", metric="Mode 1 Quality Factor", top_k=2
+    )
+
+    assert select_points(POINTS, RESULTS, screening) == [1, 3]
+
+    screening.maximize = False
+    assert select_points(POINTS, RESULTS, screening) == [0, 2]
+
+
+def keep_wide(parameters, results):
+    return parameters["w"] >= 3 and results["Mode 1 Quality Factor"] > 25
+
+
+def test_predicate_selection():
+    screening = ScreeningConfig(identifier="eigen", predicate=f"{__name__}:keep_wide")
+
+    assert select_points(POINTS, RESULTS, screening) == [3]
+
+
+def test_selection_rule_is_required_once():
+    with pytest.raises(ValidationError):
+        ScreeningConfig(identifier="eigen")
+    with pytest.raises(ValidationError):
+        ScreeningConfig(identifier="eigen", metric="q", top_k=1, predicate="mod:func")
+
+
+def test_screening_simulations_override_setup():
+    screening = ScreeningConfig(identifier="eigen", metric="q", top_k=1)
+    eigen = EigenmodeAnalysis(
+        setup_name="Setup1", design_name="d", setup_parameters={"MinimumPasses": 2}
+    )
+
+    stage = screening.screening_simulations({"eigen": eigen})
+
+    assert list(stage) == ["eigen_screening"]
+    assert stage["eigen_screening"].setup_parameters == {
+        "MinimumPasses": 2,
+        "MaximumPasses": 3,
+        "MaxDeltaFreq": 5,
+    }
+    assert eigen.setup_parameters == {"MinimumPasses": 2}
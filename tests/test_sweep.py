@@ -0,0 +1,251 @@
+"""
+Tests for sweep-point handling in the workflow (no HFSS needed).
+"""
+
+import math
+from contextlib import contextmanager
+
+import pytest
+from pycaddy.sweeper import DictSweep
+
+from quansys.simulation import EigenmodeAnalysis
+from quansys.simulation.eigenmode.results import EigenmodeResults
+from quansys.workflow import (
+    DesignVariableBuilder,
+    PrepareFolderConfig,
+    PyaedtFileParameters,
+    WorkflowConfig,
+    execute_workflow,
+)
+from quansys.workflow.builder.design_variables_handler import normalize_value
+from quansys.workflow.sweep import (
+    AdaptiveSweep,
+    deduplicate,
+    normalize_params,
+    order_by_similarity,
+    order_points,
+    params_key,
+)
+
+
+def test_normalize_value_equivalent_spellings():
+    assert normalize_value("10nh") == normalize_value("10 nH") == normalize_value(1e-8)
+    assert normalize_value("3mm") == normalize_value(0.003)
+    assert normalize_value("5ghz") == normalize_value("5000 MHz")
+    assert normalize_value({"value": 10, "unit": "nH"}) == 1e-8
+
+
+def test_normalize_value_leaves_non_numeric_values():
+    assert normalize_value("x + 1mm") == "x + 1mm"
+    assert normalize_value(True) is True
+    assert normalize_value(None) is None
+
+
+def test_normalize_params_nested():
+    params = {"l": "10nh", "w": {"value": 3, "unit": "mm"}, "args": {"f": "5 GHz"}}
+
+    assert normalize_params(params) == {"l": 1e-8, "w": 0.003, "args": {"f": 5e9}}
+
+
+def test_deduplicate_maps_duplicates_to_first_occurrence():
+    points = [
+        {"l": "10nh", "w": "3mm"},
+        {"l": "11nh", "w": "3mm"},
+        {"l": "10 nH", "w": "3 mm"},
+        {"l": 1e-8, "w": 0.003},
+    ]
+
+    unique, duplicates = deduplicate(points)
+
+    assert unique == points[:2]
+    assert duplicates == [(points[2], points[0]), (points[3], points[0])]
+    assert params_key(points[0]) == params_key(points[3])
+    assert params_key(points[0]) != params_key(points[1])
+
+
+def test_order_by_similarity_walks_neighbours():
+    points = [{"w": f"{w}mm"} for w in (1, 5, 2, 4, 3)]
+
+    ordered = order_by_similarity(points)
+
+    assert [p["w"] for p in ordered] == ["1mm", "2mm", "3mm", "4mm", "5mm"]
+
+
+def test_order_by_similarity_scales_each_parameter_by_its_range():
+    # 0.1 nH is a full step of "l", 1 mm is a small step of "w"
+    points = [
+        {"w": "1mm", "l": "10nh"},
+        {"w": "1mm", "l": "10.1nh"},
+        {"w": "2mm", "l": "10nh"},
+        {"w": "9mm", "l": "10nh"},
+    ]
+
+    assert order_by_similarity(points) == [points[0], points[2], points[3], points[1]]
+
+
+def test_order_by_similarity_non_numeric_parameters():
+    points = [
+        {"kind": "a", "w": 1},
+        {"kind": "b", "w": 1},
+        {"kind": "a", "w": 2},
+        {"kind": "a", "w": 10},
+    ]
+
+    assert order_by_similarity(points) == [points[0], points[2], points[3], points[1]]
+
+
+def test_order_points_follows_sweep_order():
+    points = [{"w": f"{w}mm"} for w in (1, 5, 2, 4, 3)]
+    tour = order_by_similarity(points)
+
+    assert order_points(points, "sweep", reuse_mesh=True) == points
+    assert order_points(points, "similarity") == tour
+    assert order_points(points, "auto") == points
+    assert order_points(points, "auto", reuse_mesh=True) == tour
+
+
+class _FakeHfss:
+    def __init__(self):
+        self.variables = {}
+
+    def __setitem__(self, name, value):
+        self.variables[name] = value
+
+    def set_active_design(self, name):
+        pass
+
+    def cleanup_solution(self):
+        pass
+
+
+@pytest.mark.parametrize(
+    ("sweep_order", "reuse_mesh", "expected"),
+    [
+        ("sweep", True, [1, 5, 2, 4, 3]),
+        ("similarity", False, [1, 2, 3, 4, 5]),
+        ("auto", False, [1, 5, 2, 4, 3]),
+        ("auto", True, [1, 2, 3, 4, 5]),
+    ],
+)
+def test_execute_workflow_runs_points_in_sweep_order(
+    tmp_path, monkeypatch, sweep_order, reuse_mesh, expected
+):
+    hfss = _FakeHfss()
+    solved = []
+
+    @contextmanager
+    def open_pyaedt_file(self):
+        yield hfss
+
+    def collect(self, hfss):
+        solved.append(hfss.variables["w"])
+        return EigenmodeResults(
+            results={
+                1: {
+                    "mode_number": 1,
+                    "quality_factor": 1e4,
+                    "frequency": {"value": 5e9, "unit": "Hz"},
+                }
+            }
+        )
+
+    monkeypatch.setattr(PyaedtFileParameters, "open_pyaedt_file", open_pyaedt_file)
+    monkeypatch.setattr(EigenmodeAnalysis, "collect", collect)
+
+    template = tmp_path / "x.aedt"
+    template.write_text("")
+    config = WorkflowConfig(
+        root_folder=tmp_path / "results",
+        pyaedt_file_parameters=PyaedtFileParameters(file_path=template),
+        simulations={
+            "eigen": EigenmodeAnalysis(
+                setup_name="Setup1", design_name="d", reuse_mesh=reuse_mesh
+            )
+        },
+        builder=DesignVariableBuilder(design_name="d"),
+        builder_sweep=[
+            DictSweep(parameters={"w": [f"{w}mm" for w in (1, 5, 2, 4, 3)]})
+        ],
+        sweep_order=sweep_order,
+    )
+
+    execute_workflow(config)
+
+    assert solved == [f"{w}mm" for w in expected]
+
+
+def test_reuse_mesh_requires_project_copies(tmp_path):
+    with pytest.raises(ValueError, match="copy_enabled"):
+        WorkflowConfig(
+            pyaedt_file_parameters=PyaedtFileParameters(file_path=tmp_path / "x.aedt"),
+            simulations={
+                "eigen": EigenmodeAnalysis(
+                    setup_name="Setup1", design_name="d", reuse_mesh=True
+                )
+            },
+            builder=DesignVariableBuilder(design_name="d"),
+            prepare_folder=PrepareFolderConfig(copy_enabled=False),
+        )
+
+
+def _refine(sweep: AdaptiveSweep, f) -> list[float]:
+    samples = {x: f(x) for x in sweep.initial()}
+    while (x := sweep.propose(samples)) is not None:
+        samples[x] = f(x)
+    return sorted(samples)
+
+
+def test_adaptive_sweep_refines_where_target_changes_fastest():
+    sweep = AdaptiveSweep(
+        parameter="w", start=0, stop=1, identifier="e", target="f", budget=10
+    )
+
+    xs = _refine(sweep, lambda x: math.tanh((x - 0.37) * 40))
+
+    assert len(xs) == 10
+    assert sum(0.25 <= x <= 0.5 for x in xs) >= 7
+
+
+def test_adaptive_sweep_brackets_target_crossing_within_tolerance():
+    sweep = AdaptiveSweep(
+        parameter="w",
+        start=0,
+        stop=1,
+        identifier="e",
+        target="f",
+        target_value=0.0,
+        tolerance=1e-3,
+        budget=100,
+    )
+
+    xs = _refine(sweep, lambda x: x - 0.3)
+
+    # stops on tolerance, not budget, with samples next to the crossing
+    assert len(xs) < 100
+    assert min(abs(x - 0.3) for x in xs) < 1e-3
+
+
+def test_adaptive_sweep_in_workflow_config(tmp_path):
+    config = WorkflowConfig.model_validate(
+        {
+            "pyaedt_file_parameters": {"file_path": tmp_path / "x.aedt"},
+            "simulations": {},
+            "builder_sweep": [
+                {"parameters": {"l": ["10nh", "11nh"]}},
+                {
+                    "type": "adaptive",
+                    "parameter": "w",
+                    "start": 1,
+                    "stop": 2,
+                    "unit": "mm",
+                    "identifier": "eigen",
+                    "target": "Mode 1 Freq. (GHz)",
+                },
+            ],
+        }
+    )
+
+    dict_sweep, adaptive = config.builder_sweep
+    assert isinstance(dict_sweep, DictSweep)
+    assert isinstance(adaptive, AdaptiveSweep)
+    assert adaptive.point({"l": "10nh"}, 1.25) == {"l": "10nh", "w": "1.25mm"}
@@ -0,0 +1,76 @@
+"""
+Tests for the per-phase telemetry stream and its report (no HFSS needed).
+"""
+
+import json
+import subprocess
+import sys
+
+import pytest
+from pycaddy.dict_utils import hash_dict
+from typer.testing import CliRunner
+
+from quansys.cli.main import app
+from quansys.workflow.telemetry import (
+    Telemetry,
+    TelemetryConfig,
+    load_events,
+    summarize_events,
+)
+
+# a child process holding ~50 MB, standing in for AEDT
+CHILD = "import time; x = bytearray(50 * 2**20); time.sleep(0.5)"
+
+
+def test_phase_events(tmp_path):
+    path = tmp_path / "telemetry.jsonl"
+    params = {"w": "1mm"}
+
+    with Telemetry(path, interval=0.05) as telemetry:
+        with telemetry.phase("simulate", params, "eigen"):
+            subprocess.run([sys.executable, "-c", CHILD], check=True)
+        with pytest.raises(KeyError), telemetry.phase("build", params):
+            raise KeyError("w")
+        with telemetry.phase("aggregate", identifier="agg"):
+            pass
+
+    simulate, build, aggregate = load_events(path)
+
+    assert simulate["params_hash"] == hash_dict(params)
+    assert simulate["identifier"] == "eigen"
+    assert simulate["wall_s"] >= 0.5
+    assert simulate["peak_rss_mb"] >= 50
+    assert simulate["outcome"] == "ok"
+    assert build["outcome"] == "error:KeyError"
+    assert aggregate["params_hash"] is None
+
+
+def test_disabled_telemetry_writes_nothing(tmp_path):
+    assert not TelemetryConfig().enabled
+    with Telemetry(None) as telemetry, telemetry.phase("prepare", {"w": "1mm"}):
+        pass
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_report(tmp_path):
+    events = [
+        {"phase": "simulate", "identifier": "eigen", "wall_s": 30.0, "outcome": "ok"},
+        {"phase": "simulate", "identifier": "eigen", "wall_s": 50.0, "outcome": "ok"},
+        {"phase": "build", "identifier": None, "wall_s": 20.0, "outcome": "error:X"},
+    ]
+    for event in events:
+        event.update(timestamp="", params_hash=None, cpu_s=1.0, peak_rss_mb=2048.0)
+
+    summary = summarize_events(events)
+    assert list(summary["phase"]) == ["simulate", "build"]
+    assert list(summary["share"]) == [0.8, 0.2]
+    assert summary.loc[1, "errors"] == 1
+
+    path = tmp_path / "events.jsonl"
+    path.write_text("".join(f"{json.dumps(e)}\n" for e in events))
+    result = CliRunner().invoke(app, ["report", str(tmp_path), "--file", path.name])
+    assert result.exit_code == 0, result.output
+    assert "2.0 GiB" in result.output
+    assert "Total wall time: 00:01:40" in result.output
+    # the default file name is not there
+    assert CliRunner().invoke(app, ["report", str(tmp_path)]).exit_code == 1